@@ -48,8 +48,10 @@ def test_add_developer_role_then_set_profile(
         == f"california_state_polytechnic_university_pomona/developers/{user.id}/"
     )
 
-    stored_profile = db_session.exec(
-        select(DeveloperProfile).where(DeveloperProfile.user_id == user.id)
+    stored_profile = asyncio.run(
+        db_session.exec(
+            select(DeveloperProfile).where(DeveloperProfile.user_id == user.id)
+        )
     ).first()
     assert stored_profile is not None
     assert stored_profile.storage_path == profile_data["storage_path"]
@@ -0,0 +1,215 @@
+import base64
+import io
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from PIL import Image
+
+from backend.api.deps import get_image_derivatives
+from backend.storage import ImageDerivativeCache, Storage
+
+PNG_BYTES = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 8
+
+
+@pytest.fixture
+def image_path(raw_storage: Storage, tmp_path: Path) -> str:
+    if raw_storage.get_storage_type() == "local":
+        target = (tmp_path / "images" / "diagram.png").as_posix()
+    else:
+        target = "images/diagram.png"
+    raw_storage.write(target, PNG_BYTES)
+    return target
+
+
+def test_get_image_returns_content(api_client: TestClient, image_path: str) -> None:
+    response = api_client.get("/images/firebase", params={"path": image_path})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/png"
+    assert response.content == PNG_BYTES
+
+
+def test_get_image_supports_range_requests_for_local_files(
+    api_client: TestClient, raw_storage: Storage, image_path: str
+) -> None:
+    if raw_storage.get_storage_type() != "local":
+        pytest.skip("Range requests are served from local disk only")
+
+    response = api_client.get(
+        "/images/firebase",
+        params={"path": image_path},
+        headers={"Range": "bytes=0-7"},
+    )
+
+    assert response.status_code == 206
+    assert response.content == PNG_BYTES[:8]
+
+
+def test_get_image_missing_returns_404(api_client: TestClient, tmp_path: Path) -> None:
+    path = (tmp_path / "missing.png").as_posix()
+
+    response = api_client.get("/images/firebase", params={"path": path})
+
+    assert response.status_code == 404
+
+
+def test_get_image_data_url(api_client: TestClient, image_path: str) -> None:
+    response = api_client.get("/images/firebase-data-url", params={"path": image_path})
+
+    assert response.status_code == 200
+    encoded = base64.b64encode(PNG_BYTES).decode()
+    assert response.json() == {"src": f"data:image/png;base64,{encoded}"}
+
+
+def test_get_image_sets_validators_and_honours_if_none_match(
+    api_client: TestClient, image_path: str
+) -> None:
+    first = api_client.get("/images/firebase", params={"path": image_path})
+    etag = first.headers["etag"]
+
+    assert first.headers["cache-control"] == "no-cache"
+    assert "last-modified" in first.headers
+
+    second = api_client.get(
+        "/images/firebase",
+        params={"path": image_path},
+        headers={"If-None-Match": etag},
+    )
+
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+
+
+def test_get_image_pinned_version_is_immutable(
+    api_client: TestClient, image_path: str
+) -> None:
+    etag = api_client.get("/images/firebase", params={"path": image_path}).headers[
+        "etag"
+    ]
+
+    response = api_client.get(
+        "/images/firebase", params={"path": image_path, "v": etag.strip('"')}
+    )
+
+    assert response.status_code == 200
+    assert "immutable" in response.headers["cache-control"]
+
+
+def test_get_image_etag_changes_with_content(
+    api_client: TestClient, raw_storage: Storage, image_path: str
+) -> None:
+    etag = api_client.get("/images/firebase", params={"path": image_path}).headers[
+        "etag"
+    ]
+    raw_storage.write(image_path, PNG_BYTES + b"changed")
+
+    response = api_client.get(
+        "/images/firebase",
+        params={"path": image_path},
+        headers={"If-None-Match": etag},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+@pytest.fixture
+def photo_path(raw_storage: Storage, tmp_path: Path) -> str:
+    out = io.BytesIO()
+    Image.new("RGB", (400, 200), color=(200, 30, 30)).save(out, format="PNG")
+    if raw_storage.get_storage_type() == "local":
+        target = (tmp_path / "images" / "photo.png").as_posix()
+    else:
+        target = "images/photo.png"
+    raw_storage.write(target, out.getvalue())
+    return target
+
+
+@pytest.fixture
+def derivatives(
+    api_client: TestClient, raw_storage: Storage, tmp_path: Path
+) -> ImageDerivativeCache:
+    if raw_storage.get_storage_type() == "local":
+        prefix = (tmp_path / "derived").as_posix()
+    else:
+        prefix = "derived"
+    cache = ImageDerivativeCache(raw_storage, prefix, max_workers=1)
+    api_client.app.dependency_overrides[get_image_derivatives] = lambda: cache
+    return cache
+
+
+@pytest.mark.usefixtures("derivatives")
+def test_get_derived_image_resizes_and_converts(
+    api_client: TestClient, photo_path: str
+) -> None:
+    response = api_client.get(
+        "/images/derived",
+        params={"path": photo_path, "width": 100, "format": "webp"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/webp"
+    image = Image.open(io.BytesIO(response.content))
+    assert image.format == "WEBP"
+    assert image.size == (100, 50)
+
+
+@pytest.mark.usefixtures("derivatives")
+def test_get_derived_image_decodes_base64_stored_images(
+    api_client: TestClient, raw_storage: Storage, photo_path: str
+) -> None:
+    encoded = base64.b64encode(raw_storage.read(photo_path) or b"")
+    raw_storage.write(photo_path, encoded)
+
+    response = api_client.get(
+        "/images/derived", params={"path": photo_path, "width": 100, "format": "png"}
+    )
+
+    assert response.status_code == 200
+    assert Image.open(io.BytesIO(response.content)).size == (100, 50)
+
+
+def test_get_derived_image_is_rendered_once(
+    api_client: TestClient,
+    raw_storage: Storage,
+    derivatives: ImageDerivativeCache,
+    photo_path: str,
+) -> None:
+    params = {"path": photo_path, "width": 100, "format": "png"}
+    first = api_client.get("/images/derived", params=params)
+    stored = raw_storage.list(derivatives.prefix, recursive=True)
+
+    second = api_client.get(
+        "/images/derived",
+        params=params,
+        headers={"If-None-Match": first.headers["etag"]},
+    )
+
+    assert first.status_code == 200
+    assert len(stored) == 1
+    assert second.status_code == 304
+    assert raw_storage.list(derivatives.prefix, recursive=True) == stored
+
+
+@pytest.mark.usefixtures("derivatives")
+def test_get_derived_image_never_upscales(
+    api_client: TestClient, photo_path: str
+) -> None:
+    response = api_client.get(
+        "/images/derived", params={"path": photo_path, "width": 1000, "format": "png"}
+    )
+
+    assert Image.open(io.BytesIO(response.content)).size == (400, 200)
+
+
+@pytest.mark.usefixtures("derivatives")
+def test_get_derived_image_rejects_non_images(
+    api_client: TestClient, image_path: str
+) -> None:
+    response = api_client.get(
+        "/images/derived", params={"path": image_path, "format": "webp"}
+    )
+
+    assert response.status_code == 422
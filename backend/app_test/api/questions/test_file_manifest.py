@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.question import QuestionCreate
+from backend.question.services.question_file import QuestionFileDB
+from backend.question_manager.services.manager import QuestionManager
+from backend.storage import FileData
+
+
+@pytest.mark.asyncio
+async def test_get_file_manifest_filters_by_since(
+    api_client: TestClient,
+    question_manager: QuestionManager,
+    question_payload: QuestionCreate,
+    question_files: list[FileData],
+    storage_base_path: str,
+) -> None:
+    question = await question_manager.create_question(
+        question_payload,
+        storage_base_path=storage_base_path,
+        files=question_files,
+    )
+
+    response = api_client.get(f"/questions/{question.id}/files/manifest")
+    body = response.json()
+
+    assert response.status_code == 200
+    assert {entry["filename"] for entry in body["files"]} == {
+        file.filename for file in question_files
+    }
+    assert datetime.fromisoformat(body["cursor"]).utcoffset() == timedelta(0)
+
+    await question_manager.write_file(question.id, "solution.html", "<p>A</p>")
+    later = api_client.get(
+        f"/questions/{question.id}/files/manifest",
+        params={"since": body["cursor"]},
+    )
+
+    assert later.status_code == 200
+    seen = {(entry["filename"], entry["updated_at"]) for entry in body["files"]}
+    new = [
+        entry
+        for entry in later.json()["files"]
+        if (entry["filename"], entry["updated_at"]) not in seen
+    ]
+    assert [entry["filename"] for entry in new] == ["solution.html"]
+
+
+@pytest.mark.asyncio
+async def test_get_file_manifest_skips_entries_before_the_overlap(
+    api_client: TestClient,
+    question_manager: QuestionManager,
+    question_payload: QuestionCreate,
+    question_files: list[FileData],
+    storage_base_path: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(QuestionFileDB, "SYNC_OVERLAP", timedelta(0))
+    question = await question_manager.create_question(
+        question_payload,
+        storage_base_path=storage_base_path,
+        files=question_files,
+    )
+    cursor = api_client.get(f"/questions/{question.id}/files/manifest").json()["cursor"]
+
+    later = api_client.get(
+        f"/questions/{question.id}/files/manifest", params={"since": cursor}
+    )
+
+    assert later.status_code == 200
+    assert later.json()["files"] == []
+
+
+def test_get_file_manifest_missing_question_returns_404(
+    api_client: TestClient,
+) -> None:
+    response = api_client.get(
+        "/questions/00000000-0000-0000-0000-000000000000/files/manifest"
+    )
+
+    assert response.status_code == 404
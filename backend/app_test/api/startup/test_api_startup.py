@@ -1,7 +1,8 @@
 import pytest
+from fastapi.testclient import TestClient
 
 
-def test_startup_connection(api_client) -> None:
+def test_startup_connection(api_client: TestClient) -> None:
     response = api_client.get("/health/live")
     response.json()
     assert response.status_code == 200
@@ -12,7 +13,7 @@ def test_startup_connection(api_client) -> None:
     }
 
 
-def test_database_health(api_client) -> None:
+def test_database_health(api_client: TestClient) -> None:
     response = api_client.get("/health/db")
     assert response.status_code == 200
     data = response.json()
@@ -21,9 +22,17 @@ def test_database_health(api_client) -> None:
     assert data.get("database") == "connected"
 
 
+def test_database_pool_health(api_client: TestClient) -> None:
+    response = api_client.get("/health/db/pool")
+    assert response.status_code == 200
+    pools = response.json()["pools"]
+    assert set(pools) == {"async", "sync"}
+    assert pools["async"]["checkouts"] >= pools["async"]["checkins"]
+
+
 @pytest.mark.usefixtures("firebase_app_for_tests")
 def test_firebase_health(
-    api_client,
+    api_client: TestClient,
 ) -> None:
     response = api_client.get("health/firebase")
 
@@ -7,7 +7,7 @@ from backend.question import Question
 
 
 class MakeQuestion(Protocol):
-    def __call__(
+    async def __call__(
         self,
         owner: DeveloperProfile | None = None,
         **overrides: Any,
@@ -16,15 +16,15 @@ class MakeQuestion(Protocol):
 
 @pytest.fixture
 def make_question(db_session) -> MakeQuestion:
-    def make(owner: DeveloperProfile | None = None, **overrides) -> Question:
+    async def make(owner: DeveloperProfile | None = None, **overrides) -> Question:
         question = Question(
             title=overrides.pop("title", "Owned question"),
             created_by=owner,
             **overrides,
         )
         db_session.add(question)
-        db_session.commit()
-        db_session.refresh(question)
+        await db_session.commit()
+        await db_session.refresh(question)
         return question
 
     return make
@@ -8,16 +8,16 @@ from backend.developer import DeveloperProfile
 
 
 class MakeUser(Protocol):
-    def __call__(self, **overrides: Any) -> User: ...
+    async def __call__(self, **overrides: Any) -> User: ...
 
 
 class MakeDeveloperProfile(Protocol):
-    def __call__(self, user: User, **overrides: Any) -> DeveloperProfile: ...
+    async def __call__(self, user: User, **overrides: Any) -> DeveloperProfile: ...
 
 
 @pytest.fixture
 def make_user(db_session) -> MakeUser:
-    def make(**overrides):
+    async def make(**overrides):
         user = User(
             id=overrides.pop("id", uuid4()),
             first_name=overrides.pop("first_name", "Test"),
@@ -26,8 +26,8 @@ def make_user(db_session) -> MakeUser:
             **overrides,
         )
         db_session.add(user)
-        db_session.commit()
-        db_session.refresh(user)
+        await db_session.commit()
+        await db_session.refresh(user)
         return user
 
     return make
@@ -35,7 +35,7 @@ def make_user(db_session) -> MakeUser:
 
 @pytest.fixture
 def make_developer_profile(db_session) -> MakeDeveloperProfile:
-    def make(user: User, **overrides) -> DeveloperProfile:
+    async def make(user: User, **overrides) -> DeveloperProfile:
         profile = DeveloperProfile(
             user_id=user.id,
             storage_path=overrides.pop(
@@ -45,8 +45,8 @@ def make_developer_profile(db_session) -> MakeDeveloperProfile:
             **overrides,
         )
         db_session.add(profile)
-        db_session.commit()
-        db_session.refresh(profile)
+        await db_session.commit()
+        await db_session.refresh(profile)
         return profile
 
     return make
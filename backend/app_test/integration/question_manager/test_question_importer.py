@@ -0,0 +1,128 @@
+from typing import NoReturn
+from uuid import uuid4
+
+import pytest
+
+from backend.question import QType, QuestionCreate
+from backend.question.exceptions import QuestionCreateError
+from backend.question_manager import QuestionImporter
+from backend.question_manager.schemas import QuestionImportItem
+from backend.question_manager.services.manager import (
+    QuestionManager,
+    question_storage_path,
+)
+from backend.storage import FileData
+
+
+def import_item(title: str | None, **question: object) -> QuestionImportItem:
+    return QuestionImportItem(
+        question={
+            "title": title,
+            "topics": ["Fluids", "statics"],
+            "qType": ["mc"],
+            **question,
+        },
+        files=[
+            FileData(filename="question.html", content=f"<p>{title}</p>"),
+            FileData(filename="meta.json", content={"difficulty": "easy"}),
+        ],
+    )
+
+
+@pytest.mark.asyncio
+async def test_import_questions_creates_valid_items_and_reports_invalid(
+    question_manager: QuestionManager,
+    storage_base_path: str,
+) -> None:
+    duplicate_files = import_item("Duplicate Files")
+    duplicate_files.files.append(duplicate_files.files[0])
+    items = [
+        import_item("Bernoulli Equation"),
+        import_item(None),
+        import_item("Unknown Type", qType=["essay"]),
+        duplicate_files,
+        import_item("Hydrostatics", topics=["fluids"], qType=["mc", "num"]),
+    ]
+
+    report = await QuestionImporter(question_manager).import_questions(
+        items, storage_base_path
+    )
+
+    assert [r.status for r in report.results] == [
+        "created",
+        "invalid",
+        "invalid",
+        "invalid",
+        "created",
+    ]
+    assert (report.created, report.failed) == (2, 3)
+
+    first, last = report.results[0], report.results[-1]
+    assert first.question_id and last.question_id
+    question = await question_manager.qdb.get_question_data(first.question_id)
+    assert question.storage_path == question_storage_path(
+        storage_base_path, "Bernoulli Equation", first.question_id
+    )
+    assert sorted(question.topics) == ["Fluids", "statics"]
+    assert question.qType == [QType.MC]
+    assert await question_manager.read_file(first.question_id, "question.html") == (
+        b"<p>Bernoulli Equation</p>"
+    )
+
+    # Topics are matched case-insensitively across the batch
+    hydrostatics = await question_manager.qdb.get_question_data(last.question_id)
+    assert hydrostatics.topics == ["Fluids"]
+    assert sorted(hydrostatics.qType) == [QType.MC, QType.NUM]
+
+    manifest = await question_manager.get_file_manifest(first.question_id)
+    assert {entry.filename for entry in manifest.files} == {
+        "question.html",
+        "meta.json",
+    }
+
+
+@pytest.mark.asyncio
+async def test_import_questions_rejects_existing_ids(
+    question_manager: QuestionManager,
+    question_payload: QuestionCreate,
+    storage_base_path: str,
+) -> None:
+    existing = await question_manager.create_question(
+        question_payload, storage_base_path
+    )
+    new_id = uuid4()
+
+    report = await QuestionImporter(question_manager).import_questions(
+        [
+            import_item("Again", id=str(existing.id)),
+            import_item("Fresh", id=str(new_id)),
+            import_item("Fresh Twice", id=str(new_id)),
+        ],
+        storage_base_path,
+    )
+
+    assert [r.status for r in report.results] == ["invalid", "created", "invalid"]
+    assert report.results[1].question_id == new_id
+
+
+@pytest.mark.asyncio
+async def test_import_questions_removes_uploaded_files_when_insert_fails(
+    question_manager: QuestionManager,
+    storage_base_path: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def fail_insert(*_args: object, **_kwargs: object) -> NoReturn:
+        raise QuestionCreateError("database unavailable")
+
+    monkeypatch.setattr(question_manager.qdb, "bulk_create_questions", fail_insert)
+
+    report = await QuestionImporter(question_manager).import_questions(
+        [import_item("Bernoulli Equation"), import_item("Hydrostatics")],
+        storage_base_path,
+    )
+
+    assert [r.status for r in report.results] == ["failed", "failed"]
+    assert "database unavailable" in (report.results[0].error or "")
+    assert not await question_manager.storage.list_files(
+        f"{storage_base_path.rstrip('/')}/questions", recursive=True
+    )
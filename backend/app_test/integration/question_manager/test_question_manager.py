@@ -1,16 +1,20 @@
+import base64
+import hashlib
 import json
+from datetime import timedelta
 from pathlib import PurePosixPath
 from uuid import UUID
 
 import pytest
 
 from backend.question import QuestionCreate, QuestionUpdate
+from backend.question.services.question_file import QuestionFileDB
 from backend.question_manager.exceptions import (
     FileOperationError,
     QuestionNotFoundError,
 )
 from backend.question_manager.services.manager import QuestionManager
-from backend.storage import FileData
+from backend.storage import BinaryFileData, FileData, prefetch
 from backend.utils import safe_dir_name
 
 
@@ -134,6 +138,100 @@ async def test_upload_files_adds_files_to_existing_question(
     }
 
 
+@pytest.mark.asyncio
+async def test_image_files_round_trip_as_raw_bytes(
+    question_manager: QuestionManager,
+    question_payload: QuestionCreate,
+    storage_base_path: str,
+) -> None:
+    question = await question_manager.create_question(
+        question_payload,
+        storage_base_path=storage_base_path,
+    )
+    png = b"\x89PNG\r\n\x1a\n" + bytes(range(256))
+    await question_manager.upload_files(
+        question.id,
+        [BinaryFileData(filename="plot.png", content=png, mime_type="image/png")],
+    )
+
+    (stored,) = await question_manager.get_question_filedata(question.id)
+
+    assert await question_manager.read_file(question.id, "plot.png") == png
+    assert isinstance(stored, BinaryFileData)
+    assert stored.content == png
+    assert stored.encoded().content == base64.b64encode(png).decode()
+
+
+@pytest.mark.asyncio
+async def test_file_handles_list_metadata_and_load_lazily(
+    question_manager: QuestionManager,
+    question_payload: QuestionCreate,
+    question_files: list[FileData],
+    storage_base_path: str,
+) -> None:
+    question = await question_manager.create_question(
+        question_payload,
+        storage_base_path=storage_base_path,
+        files=question_files,
+    )
+
+    handles = await question_manager.get_question_file_handles(question.id)
+    by_name = {handle.filename: handle for handle in handles}
+
+    assert set(by_name) == {file.filename for file in question_files}
+    assert not any(handle.loaded for handle in handles)
+    assert by_name["question.html"].mime_type == "text/html"
+    assert by_name["question.html"].size == len("<p>Question</p>")
+    assert "content" not in by_name["question.html"].model_dump()
+
+    await prefetch(handles)
+
+    assert all(handle.loaded for handle in handles)
+    loaded = await by_name["question.html"].load()
+    assert loaded.content == b"<p>Question</p>"
+
+
+@pytest.mark.asyncio
+async def test_file_manifest_tracks_changes_since_cursor(
+    question_manager: QuestionManager,
+    question_payload: QuestionCreate,
+    question_files: list[FileData],
+    storage_base_path: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Without the overlap window the cursor is exact
+    monkeypatch.setattr(QuestionFileDB, "SYNC_OVERLAP", timedelta(0))
+    question = await question_manager.create_question(
+        question_payload,
+        storage_base_path=storage_base_path,
+        files=question_files,
+    )
+
+    full = await question_manager.get_file_manifest(question.id)
+    by_name = {entry.filename: entry for entry in full.files}
+
+    assert set(by_name) == {file.filename for file in question_files}
+    assert by_name["question.html"].size == len("<p>Question</p>")
+    assert (
+        by_name["question.html"].sha256
+        == hashlib.sha256(b"<p>Question</p>").hexdigest()
+    )
+
+    await question_manager.write_file(question.id, "question.html", "<p>New</p>")
+    await question_manager.write_file(question.id, "solution.html", "<p>Solution</p>")
+    await question_manager.delete_file(question.id, "meta.json")
+    changed = await question_manager.get_file_manifest(question.id, full.cursor)
+
+    assert {(e.filename, e.deleted) for e in changed.files} == {
+        ("question.html", False),
+        ("meta.json", True),
+    }
+    assert changed.cursor is not None and full.cursor is not None
+    assert changed.cursor > full.cursor
+    unchanged = await question_manager.get_file_manifest(question.id, changed.cursor)
+    assert unchanged.files == []
+
+
 @pytest.mark.asyncio
 async def test_update_question_meta_updates_database_only(
     question_manager: QuestionManager,
@@ -182,3 +280,31 @@ async def test_get_question_raises_for_missing_question(
 
     with pytest.raises(QuestionNotFoundError):
         await question_manager.get_question(missing_id)
+
+
+@pytest.mark.asyncio
+async def test_copy_question_copies_files_in_storage(
+    question_manager: QuestionManager,
+    question_payload: QuestionCreate,
+    question_files: list[FileData],
+    storage_base_path: str,
+) -> None:
+    question = await question_manager.create_question(
+        question_payload,
+        storage_base_path,
+        files=question_files,
+    )
+    assert question.id
+
+    copy = await question_manager.copy_question(question.id, storage_base_path)
+
+    assert copy.id and copy.id != question.id
+    assert copy.storage_path != question.storage_path
+    assert await question_manager.read_file(copy.id, "question.html") == (
+        b"<p>Question</p>"
+    )
+    copied = {
+        PurePosixPath(f).name
+        for f in await question_manager.get_question_files(copy.id)
+    }
+    assert copied == {f.filename for f in question_files}
@@ -0,0 +1,137 @@
+from pathlib import Path
+
+import pytest
+
+from backend.storage import CachedStorage, LocalStorage
+from backend.storage.services import cached_storage
+
+
+class CountingStorage(LocalStorage):
+    """LocalStorage that records how often the backend is actually read."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.reads = 0
+        self.version_checks = 0
+
+    def read(self, target: str) -> bytes | None:
+        self.reads += 1
+        return super().read(target)
+
+    def get_version(self, target: str) -> str | None:
+        self.version_checks += 1
+        return super().get_version(target)
+
+
+@pytest.fixture
+def backend() -> CountingStorage:
+    return CountingStorage()
+
+
+@pytest.fixture
+def cached(backend: CountingStorage, tmp_path: Path) -> CachedStorage:
+    return CachedStorage(backend, tmp_path / "cache")
+
+
+def test_repeat_reads_are_served_from_cache(
+    cached: CachedStorage, backend: CountingStorage, tmp_path: Path
+) -> None:
+    target = (tmp_path / "data" / "question.html").as_posix()
+    backend.write(target, "<p>Q</p>")
+
+    assert cached.read(target) == b"<p>Q</p>"
+    assert cached.read(target) == b"<p>Q</p>"
+    assert backend.reads == 1
+
+
+def test_disk_tier_survives_memory_eviction(
+    backend: CountingStorage, tmp_path: Path
+) -> None:
+    cached = CachedStorage(backend, tmp_path / "cache", max_memory_bytes=4)
+    target = (tmp_path / "data" / "big.txt").as_posix()
+    backend.write(target, "0123456789")
+
+    assert cached.read(target) == b"0123456789"
+    assert cached.read(target) == b"0123456789"
+    assert backend.reads == 1
+
+
+def test_write_through_cache_invalidates_entry(
+    cached: CachedStorage, backend: CountingStorage, tmp_path: Path
+) -> None:
+    target = (tmp_path / "data" / "meta.json").as_posix()
+    cached.write(target, {"v": 1})
+    cached.read(target)
+
+    cached.write(target, {"v": 2, "extra": True})
+
+    assert b'"extra"' in (cached.read(target) or b"")
+    assert backend.reads == 2
+
+
+def test_out_of_band_change_is_detected_by_version(
+    backend: CountingStorage, tmp_path: Path
+) -> None:
+    cached = CachedStorage(backend, tmp_path / "cache", revalidate_after=0)
+    target = (tmp_path / "data" / "server.js").as_posix()
+    backend.write(target, "a")
+    cached.read(target)
+
+    backend.write(target, "bb")
+
+    assert cached.read(target) == b"bb"
+    assert backend.reads == 2
+
+
+def test_recently_checked_copy_skips_version_lookup(
+    cached: CachedStorage,
+    backend: CountingStorage,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    now = 1000.0
+    monkeypatch.setattr(cached_storage.time, "monotonic", lambda: now)
+    target = (tmp_path / "data" / "server.js").as_posix()
+    backend.write(target, "a")
+    cached.read(target)
+
+    backend.write(target, "bb")
+    assert cached.read(target) == b"a"
+    assert backend.version_checks == 1
+
+    now += cached.revalidate_after
+    assert cached.read(target) == b"bb"
+    assert backend.version_checks == 2
+
+
+def test_delete_directory_invalidates_children(
+    cached: CachedStorage, tmp_path: Path
+) -> None:
+    folder = (tmp_path / "data" / "q1").as_posix()
+    target = f"{folder}/question.html"
+    cached.write(target, "x")
+    cached.read(target)
+
+    cached.delete(folder)
+
+    assert not cached.exists(target)
+    assert cached._memory == {}
+    assert cached._disk == {}
+
+
+def test_disk_size_cap_evicts_oldest_entries(
+    backend: CountingStorage, tmp_path: Path
+) -> None:
+    cached = CachedStorage(
+        backend, tmp_path / "cache", max_disk_bytes=10, max_memory_bytes=0
+    )
+    first = (tmp_path / "data" / "a.txt").as_posix()
+    second = (tmp_path / "data" / "b.txt").as_posix()
+    backend.write(first, "123456")
+    backend.write(second, "abcdef")
+
+    cached.read(first)
+    cached.read(second)
+
+    assert cached._disk_bytes <= 10
+    assert list(cached._disk) == [cached._cache_key(second)]
@@ -0,0 +1,170 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from backend.storage import ContentAddressedStorage, LocalStorage
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> ContentAddressedStorage:
+    return ContentAddressedStorage(
+        LocalStorage(),
+        blob_prefix=(tmp_path / "blobs").as_posix(),
+        gc_grace=0,
+        gc_interval=None,
+    )
+
+
+def blob_count(tmp_path: Path) -> int:
+    # Blobs sit in two-character shard folders, next to the manifest registry
+    return sum(
+        1
+        for p in (tmp_path / "blobs").rglob("*")
+        if p.is_file() and len(p.parent.name) == 2
+    )
+
+
+def test_identical_content_is_stored_once(
+    storage: ContentAddressedStorage, tmp_path: Path
+) -> None:
+    q1 = (tmp_path / "q1").as_posix()
+    q2 = (tmp_path / "q2").as_posix()
+
+    storage.write(f"{q1}/helper.js", "export const g = 9.81")
+    storage.write_many(
+        [(f"{q2}/helper.js", "export const g = 9.81"), (f"{q2}/q.html", "<p>Q</p>")]
+    )
+
+    assert blob_count(tmp_path) == 2
+    assert storage.read(f"{q2}/helper.js") == b"export const g = 9.81"
+    assert storage.get_version(f"{q1}/helper.js") == storage.get_version(
+        f"{q2}/helper.js"
+    )
+
+
+def test_directory_copy_only_duplicates_manifests(
+    storage: ContentAddressedStorage, tmp_path: Path
+) -> None:
+    source = (tmp_path / "q1").as_posix()
+    storage.write_many([(f"{source}/a.html", "a"), (f"{source}/b.png", b"\x89PNG")])
+
+    storage.copy(f"{source}/", (tmp_path / "q1_copy").as_posix())
+
+    assert blob_count(tmp_path) == 2
+    copied = sorted(
+        Path(p).name for p in storage.list((tmp_path / "q1_copy").as_posix())
+    )
+    assert copied == ["a.html", "b.png"]
+    assert storage.read_many([(tmp_path / "q1_copy" / "b.png").as_posix()]) == {
+        (tmp_path / "q1_copy" / "b.png").as_posix(): b"\x89PNG"
+    }
+
+
+def test_delete_and_garbage_collection(
+    storage: ContentAddressedStorage, tmp_path: Path
+) -> None:
+    folder = (tmp_path / "q1").as_posix()
+    storage.write(f"{folder}/keep.txt", "keep")
+    storage.write(f"{folder}/drop.txt", "drop")
+
+    storage.delete(f"{folder}/drop.txt")
+
+    assert not storage.exists(f"{folder}/drop.txt")
+    assert [Path(p).name for p in storage.list(folder)] == ["keep.txt"]
+    assert storage.collect_garbage() == 1
+    assert storage.read(f"{folder}/keep.txt") == b"keep"
+
+
+def test_garbage_collection_keeps_blobs_used_elsewhere(
+    storage: ContentAddressedStorage, tmp_path: Path
+) -> None:
+    q1 = (tmp_path / "q1").as_posix()
+    q2 = (tmp_path / "q2").as_posix()
+    storage.write_many([(f"{q1}/shared.js", "shared"), (f"{q1}/own.txt", "own")])
+    storage.write(f"{q2}/shared.js", "shared")
+
+    storage.delete(f"{q1}/")
+
+    assert storage.collect_garbage() == 1
+    assert blob_count(tmp_path) == 1
+    assert storage.read(f"{q2}/shared.js") == b"shared"
+    # The registration of the deleted folder is dropped as well
+    assert len(list((tmp_path / "blobs" / "manifests").iterdir())) == 1
+
+
+def test_moved_folder_keeps_its_blobs(
+    storage: ContentAddressedStorage, tmp_path: Path
+) -> None:
+    source = (tmp_path / "q1").as_posix()
+    destination = (tmp_path / "q2").as_posix()
+    storage.write(f"{source}/q.html", "<p>Q</p>")
+
+    storage.move(f"{source}/", destination)
+
+    assert storage.collect_garbage() == 0
+    assert storage.read(f"{destination}/q.html") == b"<p>Q</p>"
+
+
+def test_recent_blobs_survive_garbage_collection(tmp_path: Path) -> None:
+    storage = ContentAddressedStorage(
+        LocalStorage(), blob_prefix=(tmp_path / "blobs").as_posix(), gc_interval=None
+    )
+    folder = (tmp_path / "q1").as_posix()
+    storage.write(f"{folder}/draft.txt", "draft")
+    storage.delete(f"{folder}/draft.txt")
+
+    # Within the grace period the blob may belong to an unfinished write
+    assert storage.collect_garbage() == 0
+    assert blob_count(tmp_path) == 1
+
+
+def test_delete_starts_background_garbage_collection(tmp_path: Path) -> None:
+    storage = ContentAddressedStorage(
+        LocalStorage(),
+        blob_prefix=(tmp_path / "blobs").as_posix(),
+        gc_grace=0,
+        gc_interval=0,
+    )
+    folder = (tmp_path / "q1").as_posix()
+    storage.write(f"{folder}/keep.txt", "keep")
+    storage.write(f"{folder}/drop.txt", "drop")
+
+    storage.delete(f"{folder}/drop.txt")
+    assert storage._gc_thread is not None
+    storage._gc_thread.join(timeout=10)
+
+    assert blob_count(tmp_path) == 1
+    assert storage.read(f"{folder}/keep.txt") == b"keep"
+
+
+def test_concurrent_writers_keep_every_manifest_entry(tmp_path: Path) -> None:
+    # Separate instances stand in for separate worker processes
+    blobs = (tmp_path / "blobs").as_posix()
+    writers = [
+        ContentAddressedStorage(LocalStorage(), blob_prefix=blobs) for _ in range(4)
+    ]
+    folder = (tmp_path / "q1").as_posix()
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(
+            pool.map(
+                lambda i: writers[i % 4].write(f"{folder}/f{i}.txt", str(i)),
+                range(16),
+            )
+        )
+
+    assert len(writers[0].list(folder)) == 16
+
+
+def test_files_outside_the_layout_are_still_served(
+    storage: ContentAddressedStorage, tmp_path: Path
+) -> None:
+    legacy = tmp_path / "legacy" / "old.html"
+    legacy.parent.mkdir(parents=True)
+    legacy.write_text("<p>old</p>")
+
+    assert storage.read(legacy.as_posix()) == b"<p>old</p>"
+    assert [Path(p).name for p in storage.list(legacy.parent.as_posix())] == [
+        "old.html"
+    ]
@@ -3,7 +3,8 @@ from typing import Any
 
 import pytest
 
-from backend.storage import Storage
+from backend.storage import LocalStorage, Storage
+from backend.storage.exceptions import StorageConflictError
 from backend.utils import normalize_newlines
 
 FILE_CASES = [
@@ -126,3 +127,97 @@ def test_move_file_local_only(raw_storage: Storage, tmp_path: Path) -> None:
     assert moved == destination
     assert not raw_storage.exists(source)
     assert raw_storage.exists(destination)
+
+
+def test_batch_write_read_and_delete(
+    raw_storage: Storage,
+    tmp_path: Path,
+) -> None:
+    base = storage_path(raw_storage, tmp_path, "questions/batch").rstrip("/")
+    items = [(f"{base}/{name}", content) for name, content in FILE_CASES]
+
+    written = raw_storage.write_many(items)
+    contents = raw_storage.read_many(written)
+
+    assert len(written) == len(FILE_CASES)
+    for (_, content), target in zip(items, written, strict=True):
+        assert normalize_newlines(contents[target]) == normalize_newlines(  # type: ignore
+            expected_content(raw_storage, content)
+        )
+
+    raw_storage.delete_many([*written, f"{base}/missing.txt"])
+    assert not any(raw_storage.exists(target) for target in written)
+
+
+def test_conditional_write_rejects_stale_version(
+    raw_storage: Storage, tmp_path: Path
+) -> None:
+    target = storage_path(raw_storage, tmp_path, "conditional/manifest.json")
+
+    raw_storage.write_if_version(target, "v1", None)
+    content, version = raw_storage.read_versioned(target)
+    assert content == b"v1"
+    assert version is not None
+
+    raw_storage.write_if_version(target, "v2", version)
+    with pytest.raises(StorageConflictError):
+        raw_storage.write_if_version(target, "v3", version)
+    with pytest.raises(StorageConflictError):
+        raw_storage.write_if_version(target, "v3", None)
+    with pytest.raises(StorageConflictError):
+        raw_storage.delete_if_version(target, version)
+
+    content, version = raw_storage.read_versioned(target)
+    assert content == b"v2"
+    raw_storage.delete_if_version(target, version)  # type: ignore[arg-type]
+    assert raw_storage.read_versioned(target) == (None, None)
+
+
+@pytest.mark.asyncio
+async def test_async_write_read_list_and_delete(
+    raw_storage: Storage, tmp_path: Path
+) -> None:
+    folder = storage_path(raw_storage, tmp_path, "async/q1")
+    target = f"{folder}/question.html"
+
+    await raw_storage.awrite(target, "<p>Q</p>")
+
+    assert await raw_storage.aread(target) == b"<p>Q</p>"
+    listed = await raw_storage.alist(folder)
+    assert [PurePosixPath(p).name for p in listed] == ["question.html"]
+
+    await raw_storage.adelete(target)
+
+    assert not await raw_storage.aexists(target)
+
+
+def test_local_list_entries_include_size_and_mtime(tmp_path: Path) -> None:
+    storage = LocalStorage()
+    folder = (tmp_path / "entries").as_posix()
+    storage.write(f"{folder}/a.txt", "abc")
+    storage.write(f"{folder}/nested/b.txt", "hello")
+
+    direct = storage.list_entries(folder)
+    nested = storage.list_entries(folder, recursive=True)
+
+    assert [(PurePosixPath(e.path).name, e.size) for e in direct] == [("a.txt", 3)]
+    assert sorted((PurePosixPath(e.path).name, e.size) for e in nested) == [
+        ("a.txt", 3),
+        ("b.txt", 5),
+    ]
+    assert all(e.updated for e in nested)
+
+
+def test_local_directory_index_is_invalidated_on_writes(tmp_path: Path) -> None:
+    storage = LocalStorage(index=True)
+    folder = (tmp_path / "indexed").as_posix()
+    storage.write(f"{folder}/a.txt", "a")
+    assert len(storage.list(folder, recursive=True)) == 1
+
+    storage.write(f"{folder}/sub/b.txt", "b")
+    assert len(storage.list(folder, recursive=True)) == 2
+
+    storage.delete(f"{folder}/a.txt")
+    assert [PurePosixPath(p).name for p in storage.list(folder, recursive=True)] == [
+        "b.txt"
+    ]
@@ -0,0 +1,194 @@
+import io
+import zipfile
+from pathlib import Path, PurePosixPath
+
+import pytest
+from fastapi import UploadFile
+
+from backend.storage import (
+    ContentAddressedStorage,
+    LocalStorage,
+    extract_zip_to_storage,
+    stream_zip,
+    upload_zip_and_extract,
+)
+from backend.storage.exceptions import (
+    StorageBatchError,
+    ZipArchiveError,
+    ZipLimitExceededError,
+)
+
+
+def make_zip(files: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as z:
+        for name, content in files.items():
+            z.writestr(name, content)
+    return buffer.getvalue()
+
+
+ARCHIVE_FILES = {
+    "question.html": b"<p>Q</p>",
+    "server.js": b"module.exports = {}",
+    "img/diagram.png": b"\x89PNG\r\n",
+    "../escape.txt": b"nope",
+}
+
+
+def test_extract_zip_to_storage_writes_safe_members(tmp_path: Path) -> None:
+    storage = LocalStorage()
+    folder = (tmp_path / "questions" / "upload").as_posix()
+
+    written = extract_zip_to_storage(
+        io.BytesIO(make_zip(ARCHIVE_FILES)), storage, folder, max_in_flight=2
+    )
+
+    assert {PurePosixPath(t).relative_to(folder).as_posix() for t in written} == {
+        "question.html",
+        "server.js",
+        "img/diagram.png",
+    }
+    assert storage.read(f"{folder}/img/diagram.png") == b"\x89PNG\r\n"
+    assert not (tmp_path / "questions" / "escape.txt").exists()
+
+
+def test_extract_zip_to_storage_updates_each_manifest_once(tmp_path: Path) -> None:
+    class ManifestCountingStorage(LocalStorage):
+        def __init__(self) -> None:
+            super().__init__()
+            self.manifest_writes = 0
+
+        def write_if_version(
+            self,
+            target: str,
+            data: str | dict | list | bytes | bytearray,
+            version: str | None,
+        ) -> str:
+            self.manifest_writes += 1
+            return super().write_if_version(target, data, version)
+
+    backend = ManifestCountingStorage()
+    storage = ContentAddressedStorage(
+        backend, blob_prefix=(tmp_path / "blobs").as_posix(), gc_interval=None
+    )
+    folder = (tmp_path / "upload").as_posix()
+
+    extract_zip_to_storage(io.BytesIO(make_zip(ARCHIVE_FILES)), storage, folder)
+
+    # One batch: the folder and img/ manifests are each written once
+    assert backend.manifest_writes == 2
+    assert storage.read(f"{folder}/img/diagram.png") == b"\x89PNG\r\n"
+
+
+def test_extract_zip_to_storage_enforces_member_limit(tmp_path: Path) -> None:
+    with pytest.raises(ZipLimitExceededError):
+        extract_zip_to_storage(
+            io.BytesIO(make_zip(ARCHIVE_FILES)),
+            LocalStorage(),
+            tmp_path.as_posix(),
+            max_members=2,
+        )
+
+
+def test_extract_zip_to_storage_enforces_size_limit(tmp_path: Path) -> None:
+    archive = make_zip({"big.txt": b"x" * 4096})
+
+    with pytest.raises(ZipLimitExceededError):
+        extract_zip_to_storage(
+            io.BytesIO(archive),
+            LocalStorage(),
+            tmp_path.as_posix(),
+            max_total_bytes=1024,
+        )
+
+
+def test_extract_zip_to_storage_removes_written_files_on_failure(
+    tmp_path: Path,
+) -> None:
+    class FailingStorage(LocalStorage):
+        def write(
+            self,
+            target: str,
+            data: str | dict | list | bytes | bytearray,
+            *,
+            overwrite: bool = True,
+        ) -> str:
+            if target.endswith("server.js"):
+                raise OSError("disk full")
+            return super().write(target, data, overwrite=overwrite)
+
+    with pytest.raises(StorageBatchError) as exc_info:
+        extract_zip_to_storage(
+            io.BytesIO(make_zip(ARCHIVE_FILES)),
+            FailingStorage(),
+            tmp_path.as_posix(),
+            max_in_flight=1,
+        )
+
+    assert list(exc_info.value.failures) == [f"{tmp_path.as_posix()}/server.js"]
+    assert not (tmp_path / "question.html").exists()
+    assert not (tmp_path / "img" / "diagram.png").exists()
+
+
+def test_extract_zip_to_storage_rejects_invalid_archive(tmp_path: Path) -> None:
+    with pytest.raises(ZipArchiveError):
+        extract_zip_to_storage(
+            io.BytesIO(b"not a zip"), LocalStorage(), tmp_path.as_posix()
+        )
+
+
+@pytest.mark.asyncio
+async def test_upload_zip_and_extract_streams_upload(tmp_path: Path) -> None:
+    upload = UploadFile(
+        file=io.BytesIO(make_zip(ARCHIVE_FILES)), filename="My Question.zip"
+    )
+
+    storage = LocalStorage()
+
+    result = await upload_zip_and_extract(upload, storage, tmp_path)
+
+    assert result["files_extracted"] == 3
+    assert storage.exists(str(result["zip_path"]))
+    question = (tmp_path / "My_Question" / "question.html").as_posix()
+    assert storage.read(question) == b"<p>Q</p>"
+
+
+@pytest.mark.asyncio
+async def test_upload_zip_and_extract_validates_before_storing(
+    tmp_path: Path,
+) -> None:
+    upload = UploadFile(file=io.BytesIO(b"not a zip"), filename="broken.zip")
+    storage = LocalStorage()
+    root = tmp_path / "uploads"
+
+    with pytest.raises(ZipArchiveError):
+        await upload_zip_and_extract(upload, storage, root)
+
+    assert not storage.list(root.as_posix(), recursive=True)
+
+
+@pytest.mark.asyncio
+async def test_upload_zip_and_extract_rejects_empty_upload(tmp_path: Path) -> None:
+    upload = UploadFile(file=io.BytesIO(b""), filename="empty.zip")
+
+    with pytest.raises(ZipArchiveError):
+        await upload_zip_and_extract(upload, LocalStorage(), tmp_path)
+
+
+@pytest.mark.asyncio
+async def test_stream_zip_yields_a_valid_archive_in_chunks(tmp_path: Path) -> None:
+    storage = LocalStorage()
+    files = {f"file_{i}.txt": f"content {i}".encode() * 100 for i in range(5)}
+    entries = []
+    for name, content in files.items():
+        target = (tmp_path / "q" / name).as_posix()
+        storage.write(target, content)
+        entries.append((f"Question/{name}", target))
+
+    chunks = [chunk async for chunk in stream_zip(storage, entries, max_in_flight=2)]
+
+    assert len(chunks) > 1
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as z:
+        assert z.namelist() == [arcname for arcname, _ in entries]
+        for name, content in files.items():
+            assert z.read(f"Question/{name}") == content
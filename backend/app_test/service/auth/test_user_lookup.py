@@ -1,7 +1,7 @@
-import asyncio
 from typing import Any
 
 import pytest
+import pytest_asyncio
 
 from backend.auth import UserRoles, ValidInstitutions
 from backend.auth.services.user_lookup import UserLookup
@@ -50,18 +50,18 @@ MOCK_USER_LOOKUP_DATA: list[dict[str, Any]] = [
 ]
 
 
-@pytest.fixture
-def lookup_users(make_user, seed_roles, seed_institution):
+@pytest_asyncio.fixture
+async def lookup_users(make_user, seed_roles, seed_institution):
     roles_by_name = {role.name: role for role in seed_roles}
     institutions_by_name = {
-        institution: asyncio.run(seed_institution(institution))
+        institution: await seed_institution(institution)
         for institution in ValidInstitutions
     }
 
     users = []
     for user_data in MOCK_USER_LOOKUP_DATA:
         users.append(
-            make_user(
+            await make_user(
                 first_name=user_data["first_name"],
                 last_name=user_data["last_name"],
                 username=user_data["username"],
@@ -74,8 +74,9 @@ def lookup_users(make_user, seed_roles, seed_institution):
     return users
 
 
-def test_find_users_returns_any_matching_role(db_session, lookup_users):
-    users = UserLookup(db_session).find_users(
+@pytest.mark.asyncio
+async def test_find_users_returns_any_matching_role(db_session, lookup_users):
+    users = await UserLookup(db_session).find_users(
         roles=[UserRoles.DEVELOPER],
     )
 
@@ -85,8 +86,9 @@ def test_find_users_returns_any_matching_role(db_session, lookup_users):
     }
 
 
-def test_find_users_filters_by_query(db_session, lookup_users):
-    users = UserLookup(db_session).find_users(
+@pytest.mark.asyncio
+async def test_find_users_filters_by_query(db_session, lookup_users):
+    users = await UserLookup(db_session).find_users(
         roles=[UserRoles.STUDENT, UserRoles.DEVELOPER],
         query="liam",
     )
@@ -94,10 +96,11 @@ def test_find_users_filters_by_query(db_session, lookup_users):
     assert [user.email for user in users] == ["liam.devstudent@example.com"]
 
 
-def test_find_users_filters_by_institution(db_session, lookup_users):
+@pytest.mark.asyncio
+async def test_find_users_filters_by_institution(db_session, lookup_users):
     ucr = lookup_users[0].institution
 
-    users = UserLookup(db_session).find_users(
+    users = await UserLookup(db_session).find_users(
         roles=[UserRoles.STUDENT],
         institution=ucr,
     )
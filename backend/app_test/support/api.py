@@ -4,16 +4,15 @@ from contextlib import asynccontextmanager
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.api.deps import (
     get_session,
     get_storage_manager,
     get_storage_type,
-    get_user_mng,
 )
-from backend.api.developer.dependencies import get_developer_profile_service
 from backend.auth import InstitutionDB, RoleDB, UserManager
-from backend.developer.services import DeveloperProfileService
 from src.main import get_application
 
 
@@ -27,26 +26,23 @@ def user_manager(db_session) -> UserManager:
     return UserManager(db_session)
 
 
+async def _seed(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    async with session_factory() as session:
+        await RoleDB(session).seed_roles()
+        await InstitutionDB(session).seed_institution()
+
+
 @pytest.fixture(scope="function")
-def api_client(db_session, user_manager, raw_storage):
-    asyncio.run(RoleDB(db_session).seed_roles())
-    asyncio.run(InstitutionDB(db_session).seed_institution())
+def api_client(session_factory: async_sessionmaker[AsyncSession], raw_storage):
+    asyncio.run(_seed(session_factory))
 
     app = get_application()
     app.router.lifespan_context = on_startup_test
 
-    def override_get_db():
-        yield db_session
-
-    def override_get_user_manager():
-        return user_manager
-
-    def override_get_developer_profile_service():
-        return DeveloperProfileService(
-            session=db_session,
-            storage=raw_storage,
-            user_manager=user_manager,
-        )
+    # Each request gets its own session, as it does outside the tests
+    async def override_get_db():
+        async with session_factory() as session:
+            yield session
 
     def override_get_storage():
         return raw_storage
@@ -55,10 +51,6 @@ def api_client(db_session, user_manager, raw_storage):
         return raw_storage.get_storage_type()
 
     app.dependency_overrides[get_session] = override_get_db
-    app.dependency_overrides[get_user_mng] = override_get_user_manager
-    app.dependency_overrides[get_developer_profile_service] = (
-        override_get_developer_profile_service
-    )
     app.dependency_overrides[get_storage_manager] = override_get_storage
     app.dependency_overrides[get_storage_type] = override_get_storage_type
 
@@ -1,7 +1,12 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator
 
 import pytest
-from sqlmodel import Session, SQLModel, create_engine
+import pytest_asyncio
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlmodel import SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.auth import (
     InstitutionDB,
@@ -30,10 +35,31 @@ def test_engine(tmp_path):
 
 
 @pytest.fixture(scope="function")
-def db_session(test_engine) -> Generator[Session]:
-    with Session(test_engine, expire_on_commit=False) as session:
+def async_test_engine(test_engine: Engine) -> AsyncEngine:
+    # Connections are opened per use, so sessions are not tied to one event loop
+    return create_async_engine(
+        test_engine.url.set(drivername="sqlite+aiosqlite"),
+        echo=False,
+        poolclass=NullPool,
+    )
+
+
+@pytest.fixture(scope="function")
+def session_factory(
+    async_test_engine: AsyncEngine,
+) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        async_test_engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+
+@pytest_asyncio.fixture(scope="function")
+async def db_session(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> AsyncGenerator[AsyncSession]:
+    async with session_factory() as session:
         yield session
-        session.rollback()
+        await session.rollback()
 
 
 @pytest.fixture(autouse=True)
@@ -50,9 +76,9 @@ def mark_logs_in_test():
     in_test_ctx.reset(token)
 
 
-@pytest.fixture
-def seed_qtypes(db_session) -> None:
-    QuestionQTypeDB(db_session).seed_types()
+@pytest_asyncio.fixture
+async def seed_qtypes(db_session) -> None:
+    await QuestionQTypeDB(db_session).seed_types()
 
 
 @pytest.fixture
@@ -68,20 +94,20 @@ def seed_institution(institution_db):
     return _seed
 
 
-@pytest.fixture
-def seed_roles(db_session: Session):
+@pytest_asyncio.fixture
+async def seed_roles(db_session: AsyncSession):
     roles = [
         Role(name=UserRoles.STUDENT.value),
         Role(name=UserRoles.ADMIN.value),
         Role(name=UserRoles.DEVELOPER.value),
     ]
     db_session.add_all(roles)
-    db_session.commit()
+    await db_session.commit()
     return roles
 
 
 @pytest.fixture
-def role_db(db_session: Session) -> RoleDB:
+def role_db(db_session: AsyncSession) -> RoleDB:
     return RoleDB(db_session)
 
 
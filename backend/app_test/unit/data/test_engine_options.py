@@ -0,0 +1,67 @@
+import sqlite3
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+
+from backend.core import get_settings
+from backend.database import engine_options, to_async_url
+from backend.database.pool_metrics import (
+    PoolMetrics,
+    TimedAsyncQueuePool,
+    TimedQueuePool,
+)
+
+
+def test_sqlite_keeps_default_pool() -> None:
+    options = engine_options(make_url("sqlite+aiosqlite:///app.db"), get_settings())
+    assert options["echo"] is False
+    assert "poolclass" not in options
+    assert "pool_size" not in options
+
+
+def test_asyncpg_options() -> None:
+    settings = get_settings().model_copy(
+        update={
+            "DB_POOL_SIZE": 3,
+            "DB_STATEMENT_TIMEOUT_MS": 5000,
+            "DB_STATEMENT_CACHE_SIZE": 0,
+        }
+    )
+    url, _ = to_async_url("postgres://user:pw@host/db")
+    options = engine_options(url, settings)
+
+    assert options["poolclass"] is TimedAsyncQueuePool
+    assert options["pool_size"] == 3
+    assert options["connect_args"] == {
+        "statement_cache_size": 0,
+        "server_settings": {"statement_timeout": "5000"},
+    }
+    assert options["url"].query["prepared_statement_cache_size"] == "0"
+
+
+def test_psycopg2_statement_timeout() -> None:
+    settings = get_settings().model_copy(update={"DB_STATEMENT_TIMEOUT_MS": 2500})
+    options = engine_options(make_url("postgresql://user:pw@host/db"), settings)
+
+    assert options["poolclass"] is TimedQueuePool
+    assert options["connect_args"] == {"options": "-c statement_timeout=2500"}
+
+
+def test_timed_pool_reports_connect_time_apart_from_wait() -> None:
+    def slow_connect() -> sqlite3.Connection:
+        time.sleep(0.05)
+        return sqlite3.connect(":memory:")
+
+    engine = create_engine("sqlite://", poolclass=TimedQueuePool, creator=slow_connect)
+    metrics = PoolMetrics().attach(engine)
+
+    for _ in range(2):
+        with engine.connect():
+            pass
+    stats = metrics.snapshot(engine.pool)
+
+    assert (stats["checkouts"], stats["connects"], stats["connect_count"]) == (2, 1, 1)
+    assert stats["connect_max_ms"] >= 50
+    assert stats["wait_count"] == 2
+    assert stats["wait_max_ms"] < 50
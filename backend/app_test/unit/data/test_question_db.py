@@ -1,13 +1,19 @@
+from datetime import datetime
 from typing import Any
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.engine.interfaces import DBAPICursor
+from sqlalchemy.ext.asyncio import AsyncEngine
 
 from backend.question import (
     QType,
     Question,
     QuestionCreate,
     QuestionDB,
+    QuestionFilter,
     QuestionRead,
     QuestionUpdate,
     QuestionValidationError,
@@ -158,6 +164,173 @@ async def test_get_all_questions(
     assert len(questions) == len(combined_payload)
 
 
+@pytest.mark.asyncio
+async def test_get_all_questions_cursor_pages(
+    question_db: QuestionDB,
+    question_payloads: PayloadMap,
+) -> None:
+    payload = question_payloads["basic"]
+    created = [
+        await question_db.create_question(payload.model_copy(update={"title": f"Q{i}"}))
+        for i in range(5)
+    ]
+    # Shared timestamps push the ordering onto the id; one row has none at all
+    for q in created[1:]:
+        q.updated_at = q.created_at = datetime(2026, 1, 1)
+    created[0].updated_at = created[0].created_at = None
+    question_db.session.add_all(created)
+    await question_db.session.commit()
+
+    seen: list[Question] = []
+    cursor = None
+    while True:
+        page = await question_db.get_all_questions(limit=2, cursor=cursor)
+        seen.extend(page)
+        if len(page) < 2:
+            break
+        cursor = question_db.page_cursor(page[-1])
+
+    assert sorted(q.id for q in seen) == sorted(q.id for q in created)
+    assert seen[-1].updated_at is None
+
+
+@pytest.mark.asyncio
+async def test_get_all_questions_rejects_invalid_cursor(
+    question_db: QuestionDB,
+) -> None:
+    with pytest.raises(QuestionValidationError):
+        await question_db.get_all_questions(cursor="not-a-cursor")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("term", "expected"),
+    [
+        ("bern", ["Bernoulli Equation", "Bernoulli"]),
+        ("equation bern", ["Bernoulli Equation"]),
+        ("bernoulli", ["Bernoulli", "Bernoulli Equation"]),
+        ("100%", ["100% Yield"]),
+    ],
+)
+async def test_filter_questions_by_title(
+    question_db: QuestionDB,
+    question_payloads: PayloadMap,
+    term: str,
+    expected: list[str],
+) -> None:
+    payload = question_payloads["basic"]
+    for title in ["Bernoulli Equation", "Bernoulli", "Addition", "100% Yield"]:
+        await question_db.create_question(payload.model_copy(update={"title": title}))
+
+    found = await question_db.filter_questions(QuestionFilter(title=term))
+
+    assert sorted(q.title for q in found) == sorted(expected)
+    if term == "bernoulli":
+        # The exact title ranks first
+        assert found[0].title == "Bernoulli"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("count", [2, 8])
+async def test_full_question_listing_uses_constant_queries(
+    question_db: QuestionDB,
+    question_payloads: PayloadMap,
+    async_test_engine: AsyncEngine,
+    count: int,
+) -> None:
+    payload = question_payloads["with_relationships"]
+    for i in range(count):
+        await question_db.create_question(payload.model_copy(update={"title": f"Q{i}"}))
+    question_db.session.expunge_all()
+
+    statements: list[str] = []
+
+    def record(
+        _conn: Connection, _cursor: DBAPICursor, statement: str, *_args: object
+    ) -> None:
+        statements.append(statement)
+
+    event.listen(async_test_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        questions = await question_db.get_all_questions(method="full")
+    finally:
+        event.remove(async_test_engine.sync_engine, "before_cursor_execute", record)
+
+    assert len(questions) == count
+    assert all(isinstance(q, QuestionRead) for q in questions)
+    assert all(sorted(q.topics) == sorted(payload.topics) for q in questions)
+    assert all(list(q.qType) == [QType.MC] for q in questions)
+    assert len(statements) == 3
+
+
+@pytest.mark.asyncio
+async def test_question_reads_share_one_eager_query(
+    question_db: QuestionDB,
+    question_payloads: PayloadMap,
+    async_test_engine: AsyncEngine,
+) -> None:
+    created = await question_db.create_question(question_payloads["with_relationships"])
+    question_db.session.expunge_all()
+
+    statements: list[str] = []
+
+    def record(
+        _conn: Connection, _cursor: DBAPICursor, statement: str, *_args: object
+    ) -> None:
+        statements.append(statement)
+
+    event.listen(async_test_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        data = await question_db.get_question_data(created.id)
+        again = await question_db.get_question_data(created.id)
+        question = await question_db.get_question(created.id)
+    finally:
+        event.remove(async_test_engine.sync_engine, "before_cursor_execute", record)
+
+    assert sorted(data.topics) == ["flow-analysis", "fluid-dynamics"]
+    assert data.qType == [QType.MC]
+    assert again == data
+    assert question is not None and question.storage_path == data.storage_path
+    assert len(statements) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("count", [1, 6])
+async def test_relationship_lookups_use_constant_queries(
+    question_db: QuestionDB,
+    async_test_engine: AsyncEngine,
+    count: int,
+) -> None:
+    await question_db.create_question(
+        QuestionCreate(title="Existing", topics=["Topic 0"], qType=[QType.MC])
+    )
+    # One topic exists in another case, the others are new
+    topics = [f"topic {i}" for i in range(count)]
+    payload = QuestionCreate(
+        title="Many Topics", topics=topics, qType=[QType.MC, QType.NUM]
+    )
+
+    statements: list[str] = []
+
+    def record(
+        _conn: Connection, _cursor: DBAPICursor, statement: str, *_args: object
+    ) -> None:
+        if statement.lstrip().upper().startswith(("SELECT", "INSERT INTO TOPIC")):
+            statements.append(statement)
+
+    event.listen(async_test_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        question = Question(title=payload.title)
+        await question_db._attach_question_relationships(question, payload)
+    finally:
+        event.remove(async_test_engine.sync_engine, "before_cursor_execute", record)
+
+    assert [t.name for t in question.topics] == ["Topic 0", *topics[1:]]
+    assert {q.name for q in question.qType} == {QType.MC, QType.NUM}
+    # Existing topics and, when any are new, one insert; qtypes are cached
+    assert len(statements) == (1 if count == 1 else 2)
+
+
 @pytest.mark.asyncio
 async def test_delete_all_questions(
     question_db: QuestionDB,
@@ -299,7 +472,7 @@ async def test_get_questions_by_user_returns_all_questions_for_creator(
         created_by_id=other_user,
     )
     question_db.session.add_all([*created_for_user, other_question])
-    question_db.session.commit()
+    await question_db.session.commit()
 
     q_retrieved = await question_db.get_questions_by_creator(user)
 
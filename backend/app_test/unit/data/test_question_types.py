@@ -1,40 +1,94 @@
 import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.engine.interfaces import DBAPICursor
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.question import QType, QuestionQTypeDB
 from backend.question.services.question import QuestionDB
 
 
 @pytest.fixture
-def question_db(db_session) -> QuestionDB:
+def question_db(db_session: AsyncSession) -> QuestionDB:
     return QuestionDB(db_session)
 
 
 @pytest.fixture
-def qtype_db(db_session) -> QuestionQTypeDB:
+def qtype_db(db_session: AsyncSession) -> QuestionQTypeDB:
     return QuestionQTypeDB(db_session)
 
 
 @pytest.mark.parametrize("t", [QType.MC, QType.NUM, QType.FB])
-def test_create_qtype(qtype_db, t) -> None:
-    tc = qtype_db.create(t)
+@pytest.mark.asyncio
+async def test_create_qtype(qtype_db: QuestionQTypeDB, t: QType) -> None:
+    tc = await qtype_db.create(t)
     assert tc.id is not None
     assert tc.name == t
     assert tc.description is None
 
 
 @pytest.mark.parametrize("t", [QType.MC, QType.NUM, QType.FB])
-def test_seed_roles(qtype_db, t) -> None:
-    qtype_db.seed_types()
-    tr = qtype_db.get_qtype(t)
+@pytest.mark.asyncio
+async def test_seed_roles(qtype_db: QuestionQTypeDB, t: QType) -> None:
+    await qtype_db.seed_types()
+    tr = await qtype_db.get_qtype(t)
     assert tr is not None
     assert tr.name == t
 
 
 @pytest.mark.parametrize("t", [QType.MC, QType.NUM, QType.FB])
-def test_get_type_by_id(qtype_db, t) -> None:
-    created = qtype_db.create(t)
+@pytest.mark.asyncio
+async def test_get_type_by_id(qtype_db: QuestionQTypeDB, t: QType) -> None:
+    created = await qtype_db.create(t)
 
-    found = qtype_db.get_qtype(created.id)
+    found = await qtype_db.get_qtype(created.id)
     assert found is not None
     assert found.id == created.id
     assert found.name == t
+
+
+@pytest.mark.asyncio
+async def test_qtype_lookups_are_served_from_cache(
+    qtype_db: QuestionQTypeDB,
+    db_session: AsyncSession,
+    async_test_engine: AsyncEngine,
+) -> None:
+    await qtype_db.seed_types()
+    await qtype_db.cache.load(db_session)
+
+    statements: list[str] = []
+
+    def record(
+        _conn: Connection, _cursor: DBAPICursor, statement: str, *_args: object
+    ) -> None:
+        statements.append(statement)
+
+    event.listen(async_test_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        by_name = await qtype_db.get_qtype_by_name("MC")
+        by_id = await qtype_db.get_qtype(by_name.id)
+        many = await qtype_db.get_qtypes_by_name([QType.NUM, "fb"])
+    finally:
+        event.remove(async_test_engine.sync_engine, "before_cursor_execute", record)
+
+    assert statements == []
+    # Cached rows are merged into the session rather than duplicated
+    assert by_id is by_name
+    assert by_name in db_session
+    assert set(many) == {QType.NUM, QType.FB}
+
+
+@pytest.mark.asyncio
+async def test_qtype_cache_picks_up_new_rows(
+    qtype_db: QuestionQTypeDB, db_session: AsyncSession
+) -> None:
+    await qtype_db.create(QType.MC)
+    await qtype_db.cache.load(db_session)
+
+    assert await qtype_db.get_qtype(QType.NUM) is None
+    created = await qtype_db.create(QType.NUM)
+
+    found = await qtype_db.get_qtype(QType.NUM)
+    assert found is not None
+    assert found.id == created.id
@@ -1,6 +1,7 @@
 from types import SimpleNamespace
 
 import pytest
+import pytest_asyncio
 
 from app_test.shared.fakes import FakeStorage, FakeUserManager
 from backend.auth import User, UserRoles
@@ -61,17 +62,17 @@ def developer_collection_service(
     )
 
 
-@pytest.fixture
-def owner(make_user, make_developer_profile) -> SimpleNamespace:
-    user = make_user(email="collection-owner@example.com")
-    profile = make_developer_profile(user)
+@pytest_asyncio.fixture
+async def owner(make_user, make_developer_profile) -> SimpleNamespace:
+    user = await make_user(email="collection-owner@example.com")
+    profile = await make_developer_profile(user)
     return SimpleNamespace(user=user, profile=profile)
 
 
-@pytest.fixture
-def requester(make_user, make_developer_profile) -> SimpleNamespace:
-    user = make_user(email="collection-requester@example.com")
-    profile = make_developer_profile(user)
+@pytest_asyncio.fixture
+async def requester(make_user, make_developer_profile) -> SimpleNamespace:
+    user = await make_user(email="collection-requester@example.com")
+    profile = await make_developer_profile(user)
     return SimpleNamespace(user=user, profile=profile)
 
 
@@ -208,7 +209,7 @@ async def test_delete_collection_deletes_owned_collection(
     )
 
     assert deleted is True
-    assert question_collection_service.get_collection(collection.id) is None
+    assert await question_collection_service.get_collection(collection.id) is None
 
 
 @pytest.mark.asyncio
@@ -223,8 +224,8 @@ async def test_get_all_questions_returns_questions_for_accessible_collection(
         owner.user.id,
         title="Practice",
     )
-    question_1 = make_question(owner=owner.profile, title="Kinematics")
-    question_2 = make_question(owner=owner.profile, title="Forces")
+    question_1 = await make_question(owner=owner.profile, title="Kinematics")
+    question_2 = await make_question(owner=owner.profile, title="Forces")
 
     await developer_collection_service.add_question(
         owner.user.id,
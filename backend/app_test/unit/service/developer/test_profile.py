@@ -86,7 +86,7 @@ async def test_get_developer_data_returns_existing_profile(
         storage_path="cpp/developers/abc-123/",
     )
     db_session.add(profile)
-    db_session.commit()
+    await db_session.commit()
 
     result = await developer_profile_service.get_profile(user_id)
 
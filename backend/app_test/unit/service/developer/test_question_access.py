@@ -1,6 +1,7 @@
 from types import SimpleNamespace
 
 import pytest
+import pytest_asyncio
 from sqlmodel import select
 
 from app_test.shared.fakes import FakeStorage, FakeUserManager
@@ -41,14 +42,14 @@ def question_access(db_session, developer_profile_service):
     )
 
 
-@pytest.fixture
-def owned_question(make_user, make_developer_profile, make_question):
-    owner = make_user(email="owner@example.com")
-    requester = make_user(email="requester@example.com")
+@pytest_asyncio.fixture
+async def owned_question(make_user, make_developer_profile, make_question):
+    owner = await make_user(email="owner@example.com")
+    requester = await make_user(email="requester@example.com")
 
-    owner_profile = make_developer_profile(owner)
-    requester_profile = make_developer_profile(requester, id=requester.id)
-    question = make_question(owner=owner_profile)
+    owner_profile = await make_developer_profile(owner)
+    requester_profile = await make_developer_profile(requester, id=requester.id)
+    question = await make_question(owner=owner_profile)
 
     return SimpleNamespace(
         owner=owner,
@@ -272,8 +273,10 @@ async def test_revoke_access_removes_question_access(
         owned_question.question.id,
     )
 
-    stored_access = db_session.exec(
-        select(QuestionAccess).where(QuestionAccess.id == qaccess.id)
+    stored_access = (
+        await db_session.exec(
+            select(QuestionAccess).where(QuestionAccess.id == qaccess.id)
+        )
     ).first()
     assert stored_access is None
 
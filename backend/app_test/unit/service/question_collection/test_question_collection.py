@@ -1,4 +1,5 @@
 import pytest
+import pytest_asyncio
 
 from backend.developer import DeveloperProfile
 from backend.question_collections import (
@@ -9,14 +10,14 @@ from backend.question_collections import (
 )
 
 
-@pytest.fixture
-def owner_profile(make_user, make_developer_profile) -> DeveloperProfile:
-    return make_developer_profile(make_user())
+@pytest_asyncio.fixture
+async def owner_profile(make_user, make_developer_profile) -> DeveloperProfile:
+    return await make_developer_profile(await make_user())
 
 
-@pytest.fixture
-def other_owner_profile(make_user, make_developer_profile) -> DeveloperProfile:
-    return make_developer_profile(make_user())
+@pytest_asyncio.fixture
+async def other_owner_profile(make_user, make_developer_profile) -> DeveloperProfile:
+    return await make_developer_profile(await make_user())
 
 
 @pytest.fixture
@@ -60,10 +61,14 @@ async def test_create_collection_with_parent_sets_parent_id(
     )
 
     assert child.parent_id == parent.id
-    assert question_collection_service.reconstruct_path(child) == "Mechanics->Dynamics"
+    assert (
+        await question_collection_service.reconstruct_path(child)
+        == "Mechanics->Dynamics"
+    )
 
 
-def test_get_collection_by_owner_returns_only_owned_collection(
+@pytest.mark.asyncio
+async def test_get_collection_by_owner_returns_only_owned_collection(
     question_collection_service: QuestionCollectionService,
     owner_profile: DeveloperProfile,
     other_owner_profile: DeveloperProfile,
@@ -74,10 +79,10 @@ def test_get_collection_by_owner_returns_only_owned_collection(
     )
 
     question_collection_service._session.add(other_collection)
-    question_collection_service._session.commit()
-    question_collection_service._session.refresh(other_collection)
+    await question_collection_service._session.commit()
+    await question_collection_service._session.refresh(other_collection)
 
-    result = question_collection_service.get_collection_by_owner(
+    result = await question_collection_service.get_collection_by_owner(
         owner_profile,
         other_collection.id,
     )
@@ -163,7 +168,7 @@ async def test_delete_collection_removes_owned_collection(
     )
 
     assert deleted is True
-    assert question_collection_service.get_collection(collection.id) is None
+    assert await question_collection_service.get_collection(collection.id) is None
 
 
 @pytest.mark.asyncio
@@ -194,9 +199,11 @@ async def test_get_all_questions_returns_questions_added_to_collection(
         owner_profile,
         title="Physics",
     )
-    question_1 = make_question(owner=owner_profile, title="Newton's Laws")
-    question_2 = make_question(owner=owner_profile, title="Energy")
-    unrelated_question = make_question(owner=owner_profile, title="Not in collection")
+    question_1 = await make_question(owner=owner_profile, title="Newton's Laws")
+    question_2 = await make_question(owner=owner_profile, title="Energy")
+    unrelated_question = await make_question(
+        owner=owner_profile, title="Not in collection"
+    )
 
     await question_collection_service.add_question(collection.id, question_1.id)
     await question_collection_service.add_question(collection.id, question_2.id)
@@ -0,0 +1,136 @@
+import asyncio
+import re
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlmodel import delete
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.auth import Role
+from backend.question import Question, QuestionCreate, QuestionDB
+from backend.question_views.service.dashboard_refresh import (
+    DASHBOARD_VIEW,
+    DashboardRefresher,
+)
+
+MIGRATIONS = Path(__file__).resolve().parents[3] / "migrations" / "versions"
+
+
+class RecordingRefresher(DashboardRefresher):
+    def __init__(self, engine: AsyncEngine) -> None:
+        super().__init__(engine)
+        self.requests = 0
+
+    def request(self) -> None:
+        self.requests += 1
+
+
+class StatementRecorder:
+    """Stands in for a PostgreSQL engine and keeps the SQL it is given."""
+
+    dialect = SimpleNamespace(name="postgresql")
+
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+
+    @asynccontextmanager
+    async def begin(self) -> AsyncIterator["StatementRecorder"]:
+        yield self
+
+    async def execute(self, statement: object) -> None:
+        self.statements.append(str(statement))
+
+
+@pytest_asyncio.fixture
+async def refresher(
+    async_test_engine: AsyncEngine,
+) -> AsyncIterator[RecordingRefresher]:
+    refresher = RecordingRefresher(async_test_engine).listen()
+    yield refresher
+    refresher.remove()
+
+
+def test_refresh_is_disabled_outside_postgres(async_test_engine: AsyncEngine) -> None:
+    assert DashboardRefresher(async_test_engine).enabled is False
+
+
+@pytest.mark.asyncio
+async def test_refresh_uses_concurrent_refresh_on_postgres() -> None:
+    engine = StatementRecorder()
+
+    await DashboardRefresher(engine).refresh()  # type: ignore[arg-type]
+
+    assert engine.statements == [
+        f"REFRESH MATERIALIZED VIEW CONCURRENTLY {DASHBOARD_VIEW}"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_periodic_refresh_runs_until_removed() -> None:
+    # Covers writes committed by other worker processes
+    engine = StatementRecorder()
+    refresher = DashboardRefresher(engine, interval=0.01).listen()  # type: ignore[arg-type]
+    try:
+        await asyncio.sleep(0.05)
+    finally:
+        refresher.remove()
+    refreshes = len(engine.statements)
+    await asyncio.sleep(0.03)
+
+    assert refreshes >= 1
+    assert len(engine.statements) == refreshes
+
+
+def test_dashboard_migrations_create_unique_index_for_refresh() -> None:
+    # REFRESH ... CONCURRENTLY fails on a view without a unique index
+    creates_view = re.compile(rf"CREATE MATERIALIZED VIEW {DASHBOARD_VIEW}\b")
+    unique_index = re.compile(
+        rf"CREATE UNIQUE INDEX \w+ \"\s*\"ON {DASHBOARD_VIEW} \(question_id\)"
+    )
+    migrations = [
+        path
+        for path in sorted(MIGRATIONS.glob("*.py"))
+        if creates_view.search(path.read_text())
+    ]
+
+    assert migrations
+    for path in migrations:
+        assert unique_index.search(path.read_text()), path.name
+
+
+@pytest.mark.asyncio
+async def test_question_write_requests_refresh(
+    question_db: QuestionDB, refresher: RecordingRefresher
+) -> None:
+    question = await question_db.create_question(
+        QuestionCreate(title="Projectile", ai_generated=False, isAdaptive=False)
+    )
+    assert refresher.requests == 1
+
+    question.title = "Projectile motion"
+    question_db.session.add(question)
+    await question_db.session.commit()
+    assert refresher.requests == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_requests_refresh(
+    db_session: AsyncSession, refresher: RecordingRefresher
+) -> None:
+    await db_session.exec(delete(Question))
+    await db_session.commit()
+    assert refresher.requests == 1
+
+
+@pytest.mark.asyncio
+async def test_unrelated_write_does_not_request_refresh(
+    db_session: AsyncSession, refresher: RecordingRefresher
+) -> None:
+    db_session.add(Role(name="reviewer"))
+    await db_session.commit()
+    assert refresher.requests == 0
@@ -0,0 +1,55 @@
+from typing import Any
+
+import pytest
+
+from backend.question_views.schema import (
+    QuestionSearchParams,
+    QuestionTableSearchContext,
+)
+from backend.question_views.service.table_filter_builder import (
+    KEYSET_ORDER,
+    QuestionTableFilterBuilder,
+)
+
+
+def build(**params: Any) -> QuestionTableFilterBuilder:
+    builder = QuestionTableFilterBuilder(
+        QuestionSearchParams(**params), QuestionTableSearchContext()
+    )
+    builder.build()
+    return builder
+
+
+def test_title_search_uses_weighted_prefix_query() -> None:
+    builder = build(search="Bern eq")
+
+    assert builder.query_params["search_query"] == "bern:*A & eq:*A"
+    assert builder.query_params["search"] == "%Bern eq%"
+    assert "search_document @@" in builder.clauses[0]
+
+
+def test_topic_search_matches_topic_words() -> None:
+    builder = build(topic="fluid")
+
+    assert builder.query_params["topic_query"] == "fluid:*B"
+    assert "topics_text ILIKE :topic" in builder.clauses[0]
+
+
+def test_search_without_words_only_uses_substring_match() -> None:
+    builder = build(search="%_")
+
+    assert builder.clauses == ["title ILIKE :search"]
+    assert builder.query_params["search"] == r"%\%\_%"
+
+
+def test_relevance_order_ranks_before_keyset_order() -> None:
+    order = build(search="bern", sort="relevance").order_by()
+
+    assert order.startswith("similarity(title, :search_term) + ts_rank(")
+    assert order.endswith(KEYSET_ORDER)
+    assert build(search="bern").order_by() == KEYSET_ORDER
+
+
+def test_cursor_requires_recent_sort() -> None:
+    with pytest.raises(ValueError):
+        build(search="bern", sort="relevance", cursor="abc")
@@ -0,0 +1,37 @@
+"""Added question page key index
+
+Revision ID: d81e5b0c4a62
+Revises: c3f1a9d2e7b4
+Create Date: 2026-10-19 11:02:47.120934
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d81e5b0c4a62"
+down_revision: str | Sequence[str] | None = "c3f1a9d2e7b4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Matches the keyset order used by question listings and table views, so
+    # each page is an index range scan
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_question_page_key ON question (
+            updated_at DESC NULLS LAST,
+            created_at DESC NULLS LAST,
+            id DESC
+        );
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS ix_question_page_key;")
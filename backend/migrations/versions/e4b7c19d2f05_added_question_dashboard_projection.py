@@ -0,0 +1,73 @@
+"""Added question dashboard projection
+
+Revision ID: e4b7c19d2f05
+Revises: d81e5b0c4a62
+Create Date: 2026-10-19 13:40:12.508317
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e4b7c19d2f05"
+down_revision: str | Sequence[str] | None = "d81e5b0c4a62"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# One row per question; collection memberships are folded into arrays
+query = """
+CREATE MATERIALIZED VIEW question_dashboard AS
+SELECT
+    qt.*,
+    coalesce(c.collection_ids, ARRAY[]::uuid[]) AS collection_ids,
+    coalesce(c.collection_titles, ARRAY[]::text[]) AS collection_titles
+FROM
+    question_table_view qt
+    LEFT JOIN (
+        SELECT
+            qcl.question_id,
+            array_agg(qcl.collection_id ORDER BY qc.title, qc.id) AS collection_ids,
+            array_agg(qc.title::text ORDER BY qc.title, qc.id) AS collection_titles
+        FROM
+            question_collection_link qcl
+            JOIN question_collection qc ON qc.id = qcl.collection_id
+        GROUP BY
+            qcl.question_id
+    ) c ON c.question_id = qt.question_id
+WITH DATA;
+"""
+
+indexes = [
+    # Required by REFRESH MATERIALIZED VIEW CONCURRENTLY
+    "CREATE UNIQUE INDEX ix_question_dashboard_question_id "
+    "ON question_dashboard (question_id);",
+    "CREATE INDEX ix_question_dashboard_page_key ON question_dashboard ("
+    "updated_at DESC NULLS LAST, created_at DESC NULLS LAST, question_id DESC);",
+    "CREATE INDEX ix_question_dashboard_developer_profile_id "
+    "ON question_dashboard (developer_profile_id);",
+    "CREATE INDEX ix_question_dashboard_user_id ON question_dashboard (user_id);",
+    "CREATE INDEX ix_question_dashboard_status ON question_dashboard (status);",
+    "CREATE INDEX ix_question_dashboard_topics "
+    "ON question_dashboard USING gin (topics);",
+    "CREATE INDEX ix_question_dashboard_question_type "
+    "ON question_dashboard USING gin (question_type);",
+    "CREATE INDEX ix_question_dashboard_available_runtimes "
+    "ON question_dashboard USING gin (available_runtimes);",
+    "CREATE INDEX ix_question_dashboard_collection_ids "
+    "ON question_dashboard USING gin (collection_ids);",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS question_dashboard;")
+    op.execute(query)
+    for statement in indexes:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS question_dashboard;")
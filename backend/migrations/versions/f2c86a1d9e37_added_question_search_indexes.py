@@ -0,0 +1,107 @@
+"""Added question search indexes
+
+Revision ID: f2c86a1d9e37
+Revises: e4b7c19d2f05
+Create Date: 2026-10-19 15:18:05.774120
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f2c86a1d9e37"
+down_revision: str | Sequence[str] | None = "e4b7c19d2f05"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Title words carry weight A and topic words weight B, so one GIN index serves
+# both title and topic searches (to_tsquery('bern:*A') only matches titles).
+search_columns = """,
+    coalesce(array_to_string(qt.topics, ' '), '') AS topics_text,
+    setweight(to_tsvector('simple', coalesce(qt.title, '')), 'A')
+        || setweight(
+            to_tsvector('simple', coalesce(array_to_string(qt.topics, ' '), '')),
+            'B'
+        ) AS search_document"""
+
+dashboard = """
+CREATE MATERIALIZED VIEW question_dashboard AS
+SELECT
+    qt.*,
+    coalesce(c.collection_ids, ARRAY[]::uuid[]) AS collection_ids,
+    coalesce(c.collection_titles, ARRAY[]::text[]) AS collection_titles{columns}
+FROM
+    question_table_view qt
+    LEFT JOIN (
+        SELECT
+            qcl.question_id,
+            array_agg(qcl.collection_id ORDER BY qc.title, qc.id) AS collection_ids,
+            array_agg(qc.title::text ORDER BY qc.title, qc.id) AS collection_titles
+        FROM
+            question_collection_link qcl
+            JOIN question_collection qc ON qc.id = qcl.collection_id
+        GROUP BY
+            qcl.question_id
+    ) c ON c.question_id = qt.question_id
+WITH DATA;
+"""
+
+dashboard_indexes = [
+    "CREATE UNIQUE INDEX ix_question_dashboard_question_id "
+    "ON question_dashboard (question_id);",
+    "CREATE INDEX ix_question_dashboard_page_key ON question_dashboard ("
+    "updated_at DESC NULLS LAST, created_at DESC NULLS LAST, question_id DESC);",
+    "CREATE INDEX ix_question_dashboard_developer_profile_id "
+    "ON question_dashboard (developer_profile_id);",
+    "CREATE INDEX ix_question_dashboard_user_id ON question_dashboard (user_id);",
+    "CREATE INDEX ix_question_dashboard_status ON question_dashboard (status);",
+    "CREATE INDEX ix_question_dashboard_topics "
+    "ON question_dashboard USING gin (topics);",
+    "CREATE INDEX ix_question_dashboard_question_type "
+    "ON question_dashboard USING gin (question_type);",
+    "CREATE INDEX ix_question_dashboard_available_runtimes "
+    "ON question_dashboard USING gin (available_runtimes);",
+    "CREATE INDEX ix_question_dashboard_collection_ids "
+    "ON question_dashboard USING gin (collection_ids);",
+]
+
+search_indexes = [
+    "CREATE INDEX ix_question_dashboard_search_document "
+    "ON question_dashboard USING gin (search_document);",
+    "CREATE INDEX ix_question_dashboard_title_trgm "
+    "ON question_dashboard USING gin (title gin_trgm_ops);",
+    "CREATE INDEX ix_question_dashboard_topics_trgm "
+    "ON question_dashboard USING gin (topics_text gin_trgm_ops);",
+]
+
+# Used by QuestionDB.filter_questions; the expression must match
+# backend.utils.database.search exactly for the planner to pick it up
+question_indexes = [
+    "CREATE INDEX IF NOT EXISTS ix_question_title_tsv ON question "
+    "USING gin (to_tsvector('simple', coalesce(title, '')));",
+    "CREATE INDEX IF NOT EXISTS ix_question_title_trgm ON question "
+    "USING gin (title gin_trgm_ops);",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+    for statement in question_indexes:
+        op.execute(statement)
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS question_dashboard;")
+    op.execute(dashboard.format(columns=search_columns))
+    for statement in dashboard_indexes + search_indexes:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS ix_question_title_trgm;")
+    op.execute("DROP INDEX IF EXISTS ix_question_title_tsv;")
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS question_dashboard;")
+    op.execute(dashboard.format(columns=""))
+    for statement in dashboard_indexes:
+        op.execute(statement)
@@ -19,8 +19,10 @@ from .runtime import (
     get_sandbox,
 )
 from .storage import (
+    ImageDerivativeDependency,
     StorageDependency,
     StorageTypeDep,
+    get_image_derivatives,
     get_storage_manager,
     get_storage_type,
 )
@@ -40,6 +42,7 @@ from .users import (
 __all__ = [
     "CurrentUser",
     "FireBaseToken",
+    "ImageDerivativeDependency",
     "MessageDBDependency",
     "QuestionDBDependency",
     "QuestionManagerDependency",
@@ -58,6 +61,7 @@ __all__ = [
     "get_app_settings",
     "get_current_user_id",
     "get_firebase_token",
+    "get_image_derivatives",
     "get_message_db",
     "get_qruntime",
     "get_question_database",
@@ -1,11 +1,20 @@
 from functools import lru_cache
+from pathlib import Path
 from typing import Annotated, Literal
 
 from fastapi import Depends
 
 from backend.core import logger
 from backend.core.config import get_settings
-from backend.storage import STORAGE_TYPE, FbStorage, LocalStorage, Storage
+from backend.storage import (
+    STORAGE_TYPE,
+    CachedStorage,
+    ContentAddressedStorage,
+    FbStorage,
+    ImageDerivativeCache,
+    LocalStorage,
+    Storage,
+)
 
 from .core import SettingDependency
 
@@ -29,7 +38,32 @@ def get_storage_manager() -> Storage:
             bucket=settings.STORAGE_BUCKET,
         )
     else:
-        storage_service = LocalStorage()
+        storage_service = LocalStorage(index=settings.STORAGE_LOCAL_INDEX_ENABLED)
+
+    if settings.STORAGE_DEDUP_ENABLED:
+        storage_service = ContentAddressedStorage(
+            storage_service,
+            blob_prefix=settings.STORAGE_DEDUP_BLOB_PREFIX,
+            gc_grace=settings.STORAGE_DEDUP_GC_GRACE_SECONDS,
+            gc_interval=settings.STORAGE_DEDUP_GC_INTERVAL_SECONDS,
+        )
+        logger.debug(
+            "Content-addressed storage enabled under %s",
+            settings.STORAGE_DEDUP_BLOB_PREFIX,
+        )
+
+    if settings.STORAGE_CACHE_ENABLED:
+        cache_dir = Path(settings.STORAGE_CACHE_DIR)
+        if not cache_dir.is_absolute():
+            cache_dir = Path(settings.PROJECT_ROOT) / cache_dir
+        storage_service = CachedStorage(
+            storage_service,
+            cache_dir,
+            max_disk_bytes=settings.STORAGE_CACHE_MAX_DISK_MB * 1024 * 1024,
+            max_memory_bytes=settings.STORAGE_CACHE_MAX_MEMORY_MB * 1024 * 1024,
+            revalidate_after=settings.STORAGE_CACHE_REVALIDATE_SECONDS,
+        )
+        logger.debug(f"Storage cache enabled at {cache_dir}")
 
     logger.debug(f"Question manager set to {settings.STORAGE_SERVICE}")
     logger.debug("Initialized Question Manager Success")
@@ -39,9 +73,27 @@ def get_storage_manager() -> Storage:
 
 StorageDependency = Annotated[Storage, Depends(get_storage_manager)]
 
+
+def get_image_derivatives(
+    storage: StorageDependency, settings: SettingDependency
+) -> ImageDerivativeCache:
+    prefix = settings.IMAGE_DERIVED_PREFIX
+    if storage.get_storage_type() == "local" and not Path(prefix).is_absolute():
+        prefix = (Path(settings.PROJECT_ROOT) / prefix).as_posix()
+    return ImageDerivativeCache(
+        storage, prefix, max_workers=settings.IMAGE_PROCESS_WORKERS
+    )
+
+
+ImageDerivativeDependency = Annotated[
+    ImageDerivativeCache, Depends(get_image_derivatives)
+]
+
 __all__ = [
+    "ImageDerivativeDependency",
     "StorageDependency",
     "StorageTypeDep",
+    "get_image_derivatives",
     "get_storage_manager",
     "get_storage_type",
 ]
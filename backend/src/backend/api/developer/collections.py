@@ -2,6 +2,7 @@ from collections.abc import Sequence
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from starlette import status
 
@@ -232,6 +233,32 @@ async def get_collection_questions(
         ) from e
 
 
+@router.post("/{collection_id}/download")
+async def download_collection_as_zip(
+    collection_id: ID,
+    current_user: CurrentUser,
+    collections: DevCollectionManager,
+) -> StreamingResponse:
+    try:
+        name, entries = await collections.prepare_collection_download(
+            current_user, collection_id
+        )
+        return StreamingResponse(
+            collections.stream_download(entries),
+            media_type="application/zip",
+            headers={"Content-Disposition": f'attachment; filename="{name}.zip"'},
+        )
+    except DeveloperAccessDenied as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e)) from e
+    except QuestionCollectionNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    except QuestionCollectionError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+
 @router.delete("/{collection_id}/questions/{question_id}", response_model=bool)
 async def remove_question_from_collection(
     collection_id: ID,
@@ -144,11 +144,13 @@ def get_dev_collection_manager(
     profile: DeveloperProfileDependency,
     collections: QuestionCollectionServiceDependency,
     collection_access: QuestionCollectionAccessDependency,
+    qm: QuestionManagerDependency,
 ) -> DeveloperCollectionService:
     return DeveloperCollectionService(
         developer_profiles=profile,
         collections=collections,
         collection_access=collection_access,
+        question_manager=qm,
     )
 
 
@@ -2,7 +2,7 @@ import asyncio
 from collections.abc import Sequence
 
 from fastapi import APIRouter, HTTPException, UploadFile
-from fastapi.responses import Response
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from pydantic import BaseModel
 from starlette import status
 
@@ -14,8 +14,12 @@ from backend.question import (
     QuestionRead,
     QuestionUpdate,
 )
+from backend.question_manager.schemas import (
+    QuestionImportItem,
+    QuestionImportReport,
+)
 from backend.shared import ID
-from backend.storage import FileData, UploadFileDataConverter, download_zip
+from backend.storage import FileData, LazyFileData, UploadFileDataConverter
 
 from .dependencies import DevQManager
 
@@ -44,6 +48,21 @@ async def create_question(
         ) from e
 
 
+@router.post("/import")
+async def import_questions(
+    current_user: CurrentUser,
+    dev_q_manager: DevQManager,
+    items: list[QuestionImportItem],
+) -> QuestionImportReport:
+    try:
+        return await dev_q_manager.import_questions(current_user, items)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Failed to import questions: {e}",
+        ) from e
+
+
 @router.post("/filter")
 async def filter(
     current_user: CurrentUser,
@@ -129,12 +148,11 @@ async def download_question_as_zip(
 ):
     try:
         q = await dev_q_manager.get_question(current_user, question_id)
-        payload = await dev_q_manager.prepare_question_download(
-            current_user, question_id
+        entries = await dev_q_manager.prepare_question_download(
+            current_user, question_id, folder_name=q.title or "Untitled Questions"
         )
-        response = download_zip(payload, folder_name=q.title or "Untitled Questions")
-        return Response(
-            content=response,
+        return StreamingResponse(
+            dev_q_manager.stream_download(entries),
             media_type="application/zip",
             headers={"Content-Disposition": f'attachment; filename="{q.title}.zip"'},
         )
@@ -153,6 +171,14 @@ async def donwload_question_file(
 ):
     try:
         await dev_q_manager.get_question(current_user, question_id)
+        path = await dev_q_manager.get_local_file_path(
+            current_user, question_id, filename
+        )
+        if path is not None:
+            # Served with sendfile; Range requests are handled by FileResponse
+            return FileResponse(
+                path, media_type="application/octet-stream", filename=filename
+            )
         content = await dev_q_manager.read_file(current_user, question_id, filename)
         if content is None:
             content = b""
@@ -189,7 +215,24 @@ async def get_question_filedata(
     dev_q_manager: DevQManager,
 ) -> Sequence[FileData]:
     try:
-        return await dev_q_manager.get_question_filedata(current_user, question_id)
+        files = await dev_q_manager.get_question_filedata(current_user, question_id)
+        # Raw bytes are encoded (base64 for images) only for the JSON response
+        return [f.encoded() for f in files]
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Failed to list question files: {e}",
+        ) from e
+
+
+@router.get("/{question_id}/filedata/metadata")
+async def get_question_file_metadata(
+    question_id: ID,
+    current_user: CurrentUser,
+    dev_q_manager: DevQManager,
+) -> Sequence[LazyFileData]:
+    try:
+        return await dev_q_manager.get_question_file_handles(current_user, question_id)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -1,11 +1,13 @@
 from collections.abc import Sequence
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from starlette import status
 
 from backend.api.dependencies.users import CurrentUser
+from backend.api.pagination import set_next_cursor
 from backend.developer.exceptions import DeveloperProfileError
 from backend.question_views.schema import QuestionSearchParams, QuestionTableRow
+from backend.question_views.service.table_query_service import TableQueryService
 
 from .dependencies import DeveloperProfileDependency, DeveloperTablesDependency
 
@@ -20,16 +22,31 @@ async def search_my_questions(
     current_user: CurrentUser,
     profiles: DeveloperProfileDependency,
     tables: DeveloperTablesDependency,
+    response: Response,
     params: QuestionSearchParams | None = None,
 ) -> Sequence[QuestionTableRow]:
+    """
+    Search the current developer's questions.
+
+    Reads the question dashboard view, so a question created or edited a
+    moment ago may not be listed yet (see ``/question-tables/search``).
+    """
+    params = params or QuestionSearchParams()
     try:
         profile = await profiles.get_profile(current_user)
-        return tables.search_my_questions(profile, params)
+        rows = await tables.search_my_questions(profile, params)
     except DeveloperProfileError as e:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=str(e),
         ) from e
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e),
+        ) from e
+    set_next_cursor(response, rows, params.limit, TableQueryService.page_cursor)
+    return rows
 
 
 @router.post("/questions/collections/search", response_model=list[QuestionTableRow])
@@ -37,11 +54,18 @@ async def search_my_collection_questions(
     current_user: CurrentUser,
     profiles: DeveloperProfileDependency,
     tables: DeveloperTablesDependency,
+    response: Response,
     params: QuestionSearchParams,
 ) -> Sequence[QuestionTableRow]:
+    """
+    Search the questions of one of the current developer's collections.
+
+    Collection changes reach the dashboard view after its next refresh
+    (see ``/question-tables/search``).
+    """
     try:
         profile = await profiles.get_profile(current_user)
-        return tables.get_questions_by_collection(profile, params)
+        rows = await tables.get_questions_by_collection(profile, params)
     except DeveloperProfileError as e:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -52,3 +76,5 @@ async def search_my_collection_questions(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail=str(e),
         ) from e
+    set_next_cursor(response, rows, params.limit, TableQueryService.page_cursor)
+    return rows
@@ -1,66 +1,196 @@
 import base64
+from email.utils import formatdate, parsedate_to_datetime
 from mimetypes import guess_type
+from typing import Annotated
 
-from fastapi import APIRouter, HTTPException, Query, status
-from fastapi.responses import Response
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import JSONResponse, Response
 
-from backend.api.deps import StorageDependency
+from backend.api.deps import (
+    ImageDerivativeDependency,
+    SettingDependency,
+    StorageDependency,
+)
+from backend.core.config import AppSettings
+from backend.storage import (
+    ImageTransform,
+    Storage,
+    StorageEntry,
+    file_response,
+    run_blocking,
+)
+from backend.storage.constant import BASE64_IMAGE_PREFIXES, MAX_DERIVED_IMAGE_WIDTH
+from backend.storage.services.image_derivatives import DERIVED_FORMAT
 
 router = APIRouter(prefix="/images", tags=["Images"])
 
 
-@router.get("/firebase")
-async def get_firebase_image(storage: StorageDependency, path: str = Query(...)):
-    content = storage.read(path)
+def _image_media_type(path: str) -> str:
+    media_type = guess_type(path)[0] or "application/octet-stream"
+    if not media_type.startswith("image/"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"File is not an image: {media_type}",
+        )
+    return media_type
+
+
+def _cache_headers(
+    entry: StorageEntry, settings: AppSettings, version: str | None
+) -> dict[str, str]:
+    """Validators plus Cache-Control for a stored image.
+
+    URLs that pin the current content version (``?v=<etag>``) can be cached
+    forever; everything else is revalidated with the ETag.
+    """
+    headers: dict[str, str] = {}
+    if entry.version:
+        headers["ETag"] = f'"{entry.version}"'
+    if entry.updated is not None:
+        headers["Last-Modified"] = formatdate(entry.updated, usegmt=True)
+    if settings.IMAGE_IMMUTABLE_CACHING and version and version == entry.version:
+        headers["Cache-Control"] = (
+            f"public, max-age={settings.IMAGE_IMMUTABLE_MAX_AGE}, immutable"
+        )
+    else:
+        headers["Cache-Control"] = settings.IMAGE_CACHE_CONTROL
+    return headers
+
+
+def _is_not_modified(request: Request, entry: StorageEntry) -> bool:
+    """Evaluate If-None-Match, falling back to If-Modified-Since."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if not entry.version:
+            return False
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or f'"{entry.version}"' in tags
 
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and entry.updated is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(entry.updated) <= since
+    return False
+
+
+def _read_base64(storage: Storage, path: str) -> str | None:
+    """Read a stored image as base64 text, or None if it does not exist."""
+    try:
+        content = storage.read(path)
+    except FileNotFoundError:
+        return None
     if content is None:
+        return None
+    if content.startswith(BASE64_IMAGE_PREFIXES):
+        # Legacy images stored as base64 text
+        return content.decode("utf-8", errors="replace").strip()
+    return base64.b64encode(content).decode("utf-8")
+
+
+async def _stat_image(storage: Storage, path: str) -> StorageEntry:
+    entry = await run_blocking(storage.stat, path)
+    if entry is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Image not found",
         )
+    return entry
 
-    media_type = guess_type(path)[0] or "application/octet-stream"
-    if not media_type.startswith("image/"):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File is not an image: {media_type}",
-        )
 
-    return Response(
-        content=content,
-        media_type=media_type,
-        headers={"Cache-Control": "no-store"},
+@router.get("/firebase")
+async def get_firebase_image(
+    request: Request,
+    storage: StorageDependency,
+    settings: SettingDependency,
+    path: str = Query(...),
+    v: str | None = Query(default=None, description="Pinned content version"),
+) -> Response:
+    media_type = _image_media_type(path)
+    entry = await _stat_image(storage, path)
+    headers = _cache_headers(entry, settings, v)
+    if _is_not_modified(request, entry):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    # Local files are sent with sendfile and support Range requests
+    response = await run_blocking(
+        file_response, storage, path, media_type=media_type, headers=headers
     )
+    if response is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Image not found",
+        )
+    return response
 
 
 @router.get("/firebase-data-url")
 async def get_firebase_image_data_url(
+    request: Request,
     storage: StorageDependency,
+    settings: SettingDependency,
     path: str = Query(...),
-):
-    content = storage.read(path)
+    v: str | None = Query(default=None, description="Pinned content version"),
+) -> Response:
+    media_type = _image_media_type(path)
+    entry = await _stat_image(storage, path)
+    headers = _cache_headers(entry, settings, v)
+    if _is_not_modified(request, entry):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
 
-    if content is None:
+    encoded = await run_blocking(_read_base64, storage, path)
+    if encoded is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Image not found",
         )
 
-    media_type = guess_type(path)[0] or "application/octet-stream"
-    if not media_type.startswith("image/"):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"File is not an image: {media_type}",
-        )
+    return JSONResponse({"src": f"data:{media_type};base64,{encoded}"}, headers=headers)
 
+
+@router.get("/derived")
+async def get_derived_image(
+    request: Request,
+    derivatives: ImageDerivativeDependency,
+    settings: SettingDependency,
+    path: str = Query(...),
+    width: int | None = Query(default=None, ge=1, le=MAX_DERIVED_IMAGE_WIDTH),
+    format: Annotated[DERIVED_FORMAT, Query()] = "webp",
+    quality: int = Query(default=80, ge=1, le=100),
+    v: str | None = Query(default=None, description="Pinned derivative version"),
+) -> Response:
+    _image_media_type(path)
+    transform = ImageTransform(format=format, width=width, quality=quality)
     try:
-        text = content.decode("utf-8")
-        encoded = (
-            text
-            if text.startswith(("iVBOR", "/9j/", "R0lGOD", "UklGR"))
-            else base64.b64encode(content).decode("utf-8")
+        derived = await derivatives.get(path, transform)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e),
+        ) from e
+    if derived is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Image not found",
         )
-    except UnicodeDecodeError:
-        encoded = base64.b64encode(content).decode("utf-8")
 
-    return {"src": f"data:{media_type};base64,{encoded}"}
+    derived_path, entry = derived
+    headers = _cache_headers(entry, settings, v)
+    if _is_not_modified(request, entry):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response = await run_blocking(
+        file_response,
+        derivatives.storage,
+        derived_path,
+        media_type=transform.media_type,
+        headers=headers,
+    )
+    if response is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Image not found",
+        )
+    return response
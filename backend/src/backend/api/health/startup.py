@@ -1,9 +1,12 @@
+from typing import Any
+
 import firebase_admin
 from fastapi import APIRouter, HTTPException
 from sqlalchemy import text
 from starlette import status
 
 from backend.api.deps import SessionDep, SettingDependency
+from backend.database import pool_status
 
 router = APIRouter(tags=["Health"], prefix="/health")
 
@@ -14,9 +17,9 @@ def startup_connection():
 
 
 @router.get("/db", status_code=status.HTTP_200_OK)
-def database_health(session: SessionDep):
+async def database_health(session: SessionDep):
     try:
-        result = session.execute(text("SELECT 1")).scalar_one()
+        result = (await session.execute(text("SELECT 1"))).scalar_one()
         return {
             "status": "ok",
             "database": "connected",
@@ -29,6 +32,12 @@ def database_health(session: SessionDep):
         ) from e
 
 
+@router.get("/db/pool", status_code=status.HTTP_200_OK)
+def database_pool_health() -> dict[str, Any]:
+    """Return pool occupancy with checkout, wait and connect counters."""
+    return {"status": "ok", "pools": pool_status()}
+
+
 @router.get("/firebase")
 def firebase_health():
     try:
@@ -0,0 +1,17 @@
+from collections.abc import Callable, Sequence
+
+from fastapi import Response
+
+# Listings return a plain list; the cursor for the next page travels here
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def set_next_cursor[T](
+    response: Response,
+    items: Sequence[T],
+    limit: int,
+    cursor_for: Callable[[T], str],
+) -> None:
+    """Advertise the cursor of the next page when the current page is full."""
+    if items and len(items) >= limit:
+        response.headers[NEXT_CURSOR_HEADER] = cursor_for(items[-1])
@@ -1,28 +1,61 @@
 from collections.abc import Sequence
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Response
+from starlette import status
 
+from backend.api.pagination import set_next_cursor
 from backend.question_views.schema import QuestionSearchParams, QuestionTableRow
+from backend.question_views.service.table_query_service import TableQueryService
 
 from .dependencies import TableQueryDependecy
 
 router = APIRouter(prefix="/question-tables", tags=["Question Tables"])
 
 
+async def _search_page(
+    service: TableQueryService, params: QuestionSearchParams, response: Response
+) -> Sequence[QuestionTableRow]:
+    try:
+        rows = await service.search(params)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e),
+        ) from e
+    set_next_cursor(response, rows, params.limit, service.page_cursor)
+    return rows
+
+
 @router.post("/search")
 async def search_questions(
     service: TableQueryDependecy,
+    response: Response,
     params: QuestionSearchParams | None = None,
 ) -> Sequence[QuestionTableRow]:
-    return service.search(params)
+    """
+    Search the question dashboard.
+
+    Results come from a materialized view that is refreshed after writes, so
+    they can lag behind: by about a second for changes made through the same
+    worker, and by up to ``DASHBOARD_REFRESH_INTERVAL_SECONDS`` for changes
+    made through another worker.
+    """
+    return await _search_page(service, params or QuestionSearchParams(), response)
 
 
 @router.post("/published/search")
 async def search_published_questions(
     service: TableQueryDependecy,
+    response: Response,
     params: QuestionSearchParams | None = None,
 ) -> Sequence[QuestionTableRow]:
+    """
+    Search published questions on the dashboard.
+
+    Reads the same refreshed view as ``/question-tables/search`` and can lag
+    behind recent writes in the same way.
+    """
     params = (params or QuestionSearchParams()).model_copy(
         update={"published": True, "status": None}
     )
-    return service.search(params)
+    return await _search_page(service, params, response)
@@ -1,11 +1,25 @@
 from collections.abc import Sequence
+from datetime import datetime
+from typing import Annotated
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Response
 from starlette import status
 
-from backend.api.deps import QuestionDBDependency, QuestionQueryDependency
+from backend.api.deps import (
+    QuestionDBDependency,
+    QuestionManagerDependency,
+    QuestionQueryDependency,
+)
+from backend.api.pagination import NEXT_CURSOR_HEADER, set_next_cursor
 from backend.core import logger
-from backend.question import Question, QuestionFilter, QuestionRead, QuestionTableRow
+from backend.question import (
+    Question,
+    QuestionFileManifest,
+    QuestionFilter,
+    QuestionRead,
+    QuestionTableRow,
+)
+from backend.question_manager.exceptions import QuestionNotFoundError
 from backend.shared import ID
 
 router = APIRouter(
@@ -47,12 +61,44 @@ async def get_question(qid: ID, qdb: QuestionDBDependency) -> Question:
         ) from e
 
 
+@router.get("/{qid}/files/manifest")
+async def get_file_manifest(
+    qid: ID,
+    qm: QuestionManagerDependency,
+    since: Annotated[
+        datetime | None,
+        Query(description="Only return entries changed after this cursor"),
+    ] = None,
+) -> QuestionFileManifest:
+    try:
+        return await qm.get_file_manifest(qid, since)
+    except QuestionNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Could not find question {qid}",
+        ) from e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Failed to get file manifest {e}",
+        ) from e
+
+
 @router.get("/{offset:int}/{limit:int}")
 async def get_all_questions(
-    qdb: QuestionDBDependency, offset: int = 0, limit: int = 100
+    qdb: QuestionDBDependency,
+    response: Response,
+    offset: int = 0,
+    limit: int = 100,
+    cursor: str | None = Query(
+        default=None,
+        description=f"Continue after the page that returned this {NEXT_CURSOR_HEADER}",
+    ),
 ) -> Sequence[Question | QuestionRead]:
     try:
-        return await qdb.get_all_questions(offset, limit)
+        questions = await qdb.get_all_questions(offset, limit, cursor=cursor)
+        set_next_cursor(response, questions, limit, qdb.page_cursor)
+        return questions
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
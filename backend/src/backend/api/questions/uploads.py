@@ -1,8 +1,9 @@
-from fastapi import APIRouter, UploadFile
+from fastapi import APIRouter, HTTPException, UploadFile
 from pydantic import BaseModel
 
 from backend.api.deps import StorageDependency
-from backend.storage import extract_zip_files
+from backend.storage import extract_zip_to_storage, run_blocking, spool_upload
+from backend.storage.exceptions import StorageBatchError, ZipArchiveError
 from backend.utils import safe_dir_name
 
 router = APIRouter(
@@ -21,37 +22,37 @@ class UploadZipResponse(BaseModel):
 async def upload_zip(file: UploadFile, storage: StorageDependency) -> UploadZipResponse:
     filename = file.filename
 
-    # Validate the zip file
-    if not filename:
-        raise ValueError(f"File {file} has no name")
-    if not filename.endswith(".zip"):
-        ext = filename.split(".")[-1]
-        raise ValueError(f"Expected zip file extension, received '{ext}'")
-    content = await file.read()
-    if not content:
-        raise ValueError("Zip file is empty")
+    try:
+        # Validate the zip file
+        if not filename:
+            raise ZipArchiveError(f"File {file} has no name")
+        if not filename.endswith(".zip"):
+            ext = filename.split(".")[-1]
+            raise ZipArchiveError(f"Expected zip file extension, received '{ext}'")
 
-    # Create the base path to store the content
-    name = filename.removesuffix(".zip")
-    safe_name = safe_dir_name(name)
-    base = f"questions/{safe_name}"
-    # Extract and reset file
+        # Create the base path to store the content
+        name = filename.removesuffix(".zip")
+        safe_name = safe_dir_name(name)
+        base = f"questions/{safe_name}"
 
-    extracted_files = extract_zip_files(content)
-    await file.seek(0)
-
-    # Write the content
-    # Ensure dir exist
-    storage.create_dir(base)
-
-    for filename, content in extracted_files.items():
-        target = f"{base}/{filename}"
-        storage.write(target, content)
+        # Spool to disk and stream members into storage
+        archive = await spool_upload(file)
+        try:
+            # Ensure dir exist
+            await storage.acreate_dir(base)
+            written = await run_blocking(extract_zip_to_storage, archive, storage, base)
+        finally:
+            archive.close()
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except StorageBatchError as exc:
+        # Extracted files were already removed; the storage backend failed
+        raise HTTPException(status_code=502, detail=str(exc)) from exc
 
     return UploadZipResponse(
         detail=f"Uploaded zip and extracted files to {base}",
         zip_path=base,
-        file_count=len(extracted_files),
+        file_count=len(written),
     )
 
 
@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID, uuid4
+
 from sqlalchemy.orm import Mapped
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -42,10 +43,17 @@ class User(SQLModel, table=True):
     username: str | None = Field(default=None, unique=True)
     email: str = Field(index=True, unique=True)
 
-    roles: Mapped[list["Role"]] = Relationship(back_populates="users", link_model=UserRoleLink)
+    # Roles and institution are part of every user read, so load them eagerly
+    roles: Mapped[list["Role"]] = Relationship(
+        back_populates="users",
+        link_model=UserRoleLink,
+        sa_relationship_kwargs={"lazy": "selectin"},
+    )
 
     institution_id: UUID | None = Field(default=None, foreign_key="institution.id")
-    institution: Optional["Institution"] = Relationship(back_populates="users")
+    institution: Optional["Institution"] = Relationship(
+        back_populates="users", sa_relationship_kwargs={"lazy": "selectin"}
+    )
 
     developer_profile: Optional["DeveloperProfile"] = Relationship(
         back_populates="user"
@@ -1,7 +1,8 @@
 from typing import overload
 
 from sqlalchemy.exc import SQLAlchemyError
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.auth.exceptions import (
     InstitutionCreateError,
@@ -13,11 +14,15 @@ from backend.auth.model import Institution
 from backend.auth.schemas import ValidInstitutions
 from backend.core import logger
 from backend.shared import ID
-from backend.utils import convert_uuid
+from backend.utils import LookupCache, convert_uuid
 
 
 class InstitutionDB:
-    def __init__(self, session: Session) -> None:
+    # Institutions are seeded at startup and only change through
+    # create_institution
+    cache = LookupCache(Institution)
+
+    def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
     async def create_institution(
@@ -31,13 +36,14 @@ class InstitutionDB:
                 description=description,
             )
             self.session.add(inst)
-            self.session.commit()
-            self.session.refresh(inst)
+            await self.session.commit()
+            await self.session.refresh(inst)
+            self.cache.invalidate()
             logger.debug("[DB] Institution created successfully")
             return inst
 
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
             logger.error(f"[DB] Failed to create institution: {e}")
             raise InstitutionCreateError(details=str(e)) from e
 
@@ -58,17 +64,12 @@ class InstitutionDB:
     ) -> Institution | None:
         try:
             if isinstance(identifier, ValidInstitutions):
-                return self.session.exec(
-                    select(Institution).where(Institution.name == identifier.name)
-                ).first()
+                return await self.cache.get(self.session, identifier)
             if not identifier:
                 raise InstitutionValidationError(
                     "Institution identifier cannot be None"
                 )
-            institution_id = convert_uuid(identifier)
-            return self.session.exec(
-                select(Institution).where(Institution.id == institution_id)
-            ).first()
+            return await self.cache.get_by_id(self.session, convert_uuid(identifier))
 
         except SQLAlchemyError as e:
             logger.error(f"[DB] Could not get institution: {e}")
@@ -104,7 +105,7 @@ class InstitutionDB:
 
     async def get_all_institutions(self):
         try:
-            return self.session.exec(select(Institution)).all()
+            return (await self.session.exec(select(Institution))).all()
         except SQLAlchemyError as e:
             logger.error(f"[DB] Could not get institutions: {e}")
             raise InstitutionReadError(details=str(e)) from e
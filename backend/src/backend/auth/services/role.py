@@ -1,14 +1,19 @@
 from sqlalchemy.exc import SQLAlchemyError
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.auth.exceptions import RoleCreateError, RoleReadError, RoleSeedError
 from backend.auth.model import Role
 from backend.auth.schemas import UserRoles
 from backend.core import logger
+from backend.utils import LookupCache
 
 
 class RoleDB:
-    def __init__(self, session: Session) -> None:
+    # Roles are seeded at startup and only change through create_role
+    cache = LookupCache(Role)
+
+    def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
     async def create_role(
@@ -19,23 +24,22 @@ class RoleDB:
         try:
             r = Role(name=role.value, description=description)
             self.session.add(r)
-            self.session.commit()
-            self.session.refresh(r)
+            await self.session.commit()
+            await self.session.refresh(r)
+            self.cache.invalidate()
             logger.debug("[DB] Role created successfully")
             return r
 
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
             logger.error(f"[DB] Failed to create role: {e}")
             raise RoleCreateError(details=str(e)) from e
 
     async def get_role(self, role: UserRoles):
         try:
-            return self.session.exec(
-                select(Role).where(Role.name == role.value)
-            ).first()
+            return await self.cache.get(self.session, role.value)
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
             logger.error(f"[DB] Failed to get role: {e}")
             raise RoleReadError(details=str(e)) from e
 
@@ -44,9 +48,9 @@ class RoleDB:
         role: str,
     ) -> Role | None:
         try:
-            return self.session.exec(select(Role).where(Role.name == role)).first()
+            return await self.cache.get(self.session, role)
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
             logger.error(f"[DB] Failed to get role data: {e}")
             raise RoleReadError(details=str(e)) from e
 
@@ -84,9 +88,11 @@ class RoleDB:
     ) -> bool | None:
         try:
             return bool(
-                self.session.exec(select(Role).where(Role.name == role.value)).first()
+                (
+                    await self.session.exec(select(Role).where(Role.name == role.value))
+                ).first()
             )
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
             logger.error(f"[DB] Failed to get role: {e}")
             raise RoleReadError(details=str(e)) from e
@@ -2,7 +2,8 @@ from collections.abc import Sequence
 
 from pydantic import ValidationError
 from sqlalchemy.exc import SQLAlchemyError
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.auth.exceptions import (
     UserCreateError,
@@ -20,7 +21,7 @@ from backend.utils import convert_uuid
 
 
 class UserDB:
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
     async def create_user(self, data: UserCreate | dict) -> User:
@@ -33,11 +34,11 @@ class UserDB:
                 email=data.email,
             )
             self.session.add(user)
-            self.session.commit()
-            self.session.refresh(user)
+            await self.session.commit()
+            await self.session.refresh(user)
             return user
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
             error_message = f"[DB] Failed to create user: {e}"
             logger.error(error_message)
             raise UserCreateError(details=str(e)) from e
@@ -48,9 +49,9 @@ class UserDB:
         try:
             id = convert_uuid(id)
             stmt = select(User).where(User.id == id)
-            return self.session.exec(stmt).first()
+            return (await self.session.exec(stmt)).first()
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
             error_message = f"[DB] Failed to get user: {e}"
             raise UserReadError(details=error_message) from e
         except ValueError as e:
@@ -59,18 +60,18 @@ class UserDB:
     async def get_user_by_email(self, email: str) -> User | None:
         try:
             stmt = select(User).where(User.email == email.strip())
-            return self.session.exec(stmt).first()
+            return (await self.session.exec(stmt)).first()
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
             error_message = f"[DB] Failed to get user: {e}"
             raise UserReadError(details=error_message) from e
 
     async def get_all_users(self, offset: int = 0, limit: int = 100) -> Sequence[User]:
         try:
             stmt = select(User).offset(offset).limit(limit)
-            return self.session.exec(stmt).all()
+            return (await self.session.exec(stmt)).all()
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
             error_message = "[DB] failed to get all users"
             raise UserReadError(error_message, details=str(e)) from e
 
@@ -80,12 +81,12 @@ class UserDB:
             logger.warning("DB User not found cannot delete")
             raise UserNotFound(str(id))
         try:
-            self.session.delete(user)
-            self.session.commit()
+            await self.session.delete(user)
+            await self.session.commit()
             logger.info(f"[DB] Deleted user {user.id} successfully")
             return True
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
             error_message = f"[DB] Failed to delete user: {e}"
             logger.error(error_message)
             raise UserDeleteError(details=error_message) from e
@@ -98,11 +99,11 @@ class UserDB:
             for key, value in data.model_dump(exclude_none=True).items():
                 setattr(user, key, value)
             self.session.add(user)
-            self.session.commit()
-            self.session.refresh(user)
+            await self.session.commit()
+            await self.session.refresh(user)
             return user
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
             logger.error(f"[DB] Failed to edit user: {e}")
             raise UserUpdateError(details=str(e)) from e
 
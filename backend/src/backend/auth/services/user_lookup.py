@@ -1,16 +1,18 @@
 from collections.abc import Sequence
-from sqlalchemy import or_
-from sqlmodel import Session, col, select
-from backend.auth import Institution, User, UserReadError, UserRoles, Role
 from typing import List
 
+from sqlalchemy import or_
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.auth import Institution, Role, User, UserReadError, UserRoles
 
 
 class UserLookup:
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         self._session = session
 
-    def find_users(
+    async def find_users(
         self,
         roles: List[UserRoles],
         *,
@@ -34,7 +36,7 @@ class UserLookup:
             if institution:
                 stmt = stmt.where(User.institution == institution)
             stmt = stmt.offset(offset).limit(limit)
-            return self._session.exec(stmt).all()
+            return (await self._session.exec(stmt)).all()
         except Exception as e:
-            self._session.rollback()
+            await self._session.rollback()
             raise UserReadError(details=f"[DB] Failed to find users: {e}") from e
@@ -2,7 +2,7 @@ from typing import Union
 
 from firebase_admin import auth
 from sqlalchemy.exc import SQLAlchemyError
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.auth.exceptions import (
     FirebaseUserError,
@@ -26,7 +26,7 @@ from .user import UserDB
 
 
 class UserManager:
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: AsyncSession) -> None:
         """Initialize user and role repositories for the provided session."""
         self.udb = UserDB(session)
         self.rm = RoleDB(session)
@@ -89,7 +89,7 @@ class UserManager:
 
         try:
             # Ensure same session
-            r = self.session.merge(r)
+            r = await self.session.merge(r)
 
             # Avoid duplicates
             if r not in user_orm.roles:
@@ -97,10 +97,10 @@ class UserManager:
 
             # Persist
             self.session.add(user_orm)
-            self.session.commit()
-            self.session.refresh(user_orm)
+            await self.session.commit()
+            await self.session.refresh(user_orm)
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
             raise RoleAssignmentError(details=str(e)) from e
 
         return user_orm
@@ -116,10 +116,10 @@ class UserManager:
         try:
             user_orm.institution = inst
             self.session.add(user_orm)
-            self.session.commit()
-            self.session.refresh(user_orm)
+            await self.session.commit()
+            await self.session.refresh(user_orm)
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
             raise InstitutionAssignmentError(details=str(e)) from e
         return user_orm
 
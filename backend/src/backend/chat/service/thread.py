@@ -4,7 +4,8 @@ from uuid import UUID
 
 from fastapi import HTTPException
 from sqlalchemy.exc import SQLAlchemyError
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from starlette import status
 
 from backend.chat.model import Message, Thread
@@ -13,7 +14,7 @@ from backend.utils import convert_uuid
 
 
 class ThreadDB:
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
     async def create_thread(self, user_id: UUID | str, thread_id: UUID | str) -> Thread:
@@ -24,25 +25,27 @@ class ThreadDB:
                 # created_at/updated_at handled automatically
             )
             self.session.add(thread_orm)
-            self.session.commit()
-            self.session.flush()
+            await self.session.commit()
+            await self.session.flush()
             return thread_orm
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
             message = f"[ThreadDB] failed to create thread {e}"
             logger.error(message)
             raise ValueError(message) from e
 
     async def get_thread(self, id: UUID) -> Thread:
         try:
-            thread = self.session.exec(
-                select(Thread).where(Thread.id == convert_uuid(id))
+            thread = (
+                await self.session.exec(
+                    select(Thread).where(Thread.id == convert_uuid(id))
+                )
             ).first()
             if not thread:
                 raise ValueError(f"Could not retrieve thread, Thread {id} is None")
             return thread
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
             message = f"[ThreadDB] failed to get thread {e}"
             logger.error(message)
             raise ValueError(message) from e
@@ -55,7 +58,7 @@ class ThreadDB:
                 Thread.id == convert_uuid(thread_id),
                 Thread.user_id == convert_uuid(user_id),
             )
-            thread = self.session.exec(stmt).first()
+            thread = (await self.session.exec(stmt)).first()
             if not thread:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -65,7 +68,7 @@ class ThreadDB:
         except HTTPException:
             raise
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
             message = f"[ThreadDB] failed to get user thread {e}"
             logger.error(message)
             raise ValueError(message) from e
@@ -77,9 +80,9 @@ class ThreadDB:
         try:
             stmt = select(Thread).where(Thread.user_id == convert_uuid(user_id))
             stmt = stmt.order_by(Thread.updated_at.desc())  # type: ignore
-            return list(self.session.exec(stmt).all())
+            return list((await self.session.exec(stmt)).all())
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
             message = f"[ThreadDB] failed to list threads {e}"
             logger.error(message)
             raise ValueError(message) from e
@@ -91,18 +94,18 @@ class ThreadDB:
             thread = await self.get_thread(convert_uuid(id))
             thread.updated_at = datetime.now()
             self.session.add(thread)
-            self.session.commit()
-            self.session.flush()
+            await self.session.commit()
+            await self.session.flush()
             return thread
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
             message = f"[ThreadDB] failed to update thread timestamp {e}"
             logger.error(message)
             raise ValueError(message) from e
 
 
 class MessageDB:
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
     async def create_message(
@@ -119,23 +122,25 @@ class MessageDB:
                 # created_at handled automatically
             )
             self.session.add(msg_orm)
-            self.session.commit()
-            self.session.flush()
+            await self.session.commit()
+            await self.session.flush()
             return msg_orm
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
             message = f"[MessageDB] failed to create message {e}"
             logger.error(message)
             raise ValueError(message) from e
 
     async def get_message(self, id: UUID) -> Message:
         try:
-            msg = self.session.exec(select(Message).where(Message.id == id)).first()
+            msg = (
+                await self.session.exec(select(Message).where(Message.id == id))
+            ).first()
             if not msg:
                 raise ValueError(f"Could not retrieve message, Message {id} is None")
             return msg
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
             message = f"[MessageDB] failed to get message {e}"
             logger.error(message)
             raise ValueError(message) from e
@@ -147,9 +152,9 @@ class MessageDB:
                 .where(Message.thread_id == thread_id)
                 .order_by(Message.created_at.asc())  # type: ignore
             )
-            return list(self.session.exec(stmt).all())
+            return list((await self.session.exec(stmt)).all())
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
             message = f"[MessageDB] failed to list messages {e}"
             logger.error(message)
             raise ValueError(message) from e
@@ -167,9 +172,9 @@ class MessageDB:
                 )
                 .order_by(Message.created_at.asc())  # type: ignore
             )
-            return list(self.session.exec(stmt).all())
+            return list((await self.session.exec(stmt)).all())
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
             message = f"[MessageDB] failed to list user thread messages {e}"
             logger.error(message)
             raise ValueError(message) from e
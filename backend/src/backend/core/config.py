@@ -50,6 +50,33 @@ class AppSettings(BaseSettings):
         default=Environment.DEV, validation_alias=AliasChoices("MODE", "mode")
     )
     STORAGE_SERVICE: Literal["local", "cloud"] = "cloud"
+    # In-memory directory index for local storage (single-process deployments)
+    STORAGE_LOCAL_INDEX_ENABLED: bool = False
+    # Local read-through cache in front of the storage backend
+    STORAGE_CACHE_ENABLED: bool = False
+    STORAGE_CACHE_DIR: str = ".storage_cache"
+    STORAGE_CACHE_MAX_DISK_MB: int = 512
+    STORAGE_CACHE_MAX_MEMORY_MB: int = 64
+    # Seconds a cached copy is served before its version is checked again
+    STORAGE_CACHE_REVALIDATE_SECONDS: float = 5.0
+    # Content-addressed layout: deduplicated blobs plus per-folder manifests
+    STORAGE_DEDUP_ENABLED: bool = False
+    STORAGE_DEDUP_BLOB_PREFIX: str = "blobs"
+    # Unreferenced blobs are kept this long, then swept after a delete
+    STORAGE_DEDUP_GC_GRACE_SECONDS: float = 3600.0
+    STORAGE_DEDUP_GC_INTERVAL_SECONDS: float = 3600.0
+    # Question dashboard view: periodic refresh that picks up writes made by
+    # other worker processes (0 disables it)
+    DASHBOARD_REFRESH_INTERVAL_SECONDS: float = 60.0
+
+    # Image delivery caching. Responses always carry ETag/Last-Modified;
+    # URLs pinned to a content version (?v=<etag>) may be cached as immutable.
+    IMAGE_CACHE_CONTROL: str = "no-cache"
+    IMAGE_IMMUTABLE_CACHING: bool = True
+    IMAGE_IMMUTABLE_MAX_AGE: int = 31536000
+    # Resized/re-encoded images, stored alongside the originals
+    IMAGE_DERIVED_PREFIX: str = "derived"
+    IMAGE_PROCESS_WORKERS: int = 2
 
     # Allowed origins for http request
     BACKEND_CORS_ORIGINS: Sequence[str] | str = []
@@ -60,6 +87,21 @@ class AppSettings(BaseSettings):
             "POSTGRES_URL", "postgres_url", "database_url", "DATABASE_URL"
         ),
     )
+    # Engine and pool tuning. Pool settings only apply to server databases;
+    # recycle is in seconds (-1 disables) and a timeout of 0 means no limit.
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_TIMEOUT_MS: int = 0
+    # Prepared statements cached per asyncpg connection; set to 0 behind
+    # pgbouncer in transaction mode
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    # SQLAlchemy's cache of compiled SQL strings
+    DB_QUERY_CACHE_SIZE: int = 500
+
     # FIREBASE CONFIG
     FIREBASE_CRED: str | None = None
     STORAGE_BUCKET: str | None = None
@@ -1,3 +1,21 @@
-from .config import engine, get_session
+from .config import (
+    AsyncSessionLocal,
+    async_engine,
+    engine,
+    engine_options,
+    get_session,
+    get_sync_session,
+    pool_status,
+    to_async_url,
+)
 
-__all__ = ["engine", "get_session"]
+__all__ = [
+    "AsyncSessionLocal",
+    "async_engine",
+    "engine",
+    "engine_options",
+    "get_session",
+    "get_sync_session",
+    "pool_status",
+    "to_async_url",
+]
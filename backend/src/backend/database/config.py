@@ -1,16 +1,25 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
+from typing import Any
 
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.core import get_settings, logger
+from backend.core.config import AppSettings
 
 from .exceptions import (
     DatabaseConfigError,
     DatabaseInitializationError,
 )
+from .pool_metrics import PoolMetrics, TimedAsyncQueuePool, TimedQueuePool
 
 app_settings = get_settings()
 
+# Async drivers used by the request path, keyed by backend name
+ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
 
 # Define choosing the settings
 if app_settings.ENV == "testing":
@@ -25,12 +34,112 @@ if not DATABASE_URL:
 
 logger.debug(f"[DATABASE Intialization]: Database path set to {DATABASE_URL}")
 
+
+def to_async_url(url: str | URL) -> tuple[URL, dict[str, Any]]:
+    """
+    Swap the driver of a database URL for its asyncio counterpart.
+
+    ``postgres://`` and ``postgresql+psycopg2://`` URLs become
+    ``postgresql+asyncpg://`` and SQLite URLs use ``aiosqlite``. asyncpg does
+    not understand libpq's ``sslmode`` query argument, so it is moved into the
+    connect arguments.
+
+    Returns:
+        The async URL and the connect arguments to create the engine with.
+    """
+    parsed = make_url(str(url).replace("postgres://", "postgresql://", 1))
+    backend = parsed.get_backend_name()
+    driver = ASYNC_DRIVERS.get(backend)
+    if driver is None:
+        raise DatabaseConfigError(f"No async driver configured for '{backend}'")
+
+    connect_args: dict[str, Any] = {}
+    if driver == "asyncpg" and "sslmode" in parsed.query:
+        connect_args["ssl"] = parsed.query["sslmode"]
+        parsed = parsed.difference_update_query(["sslmode"])
+    return parsed.set(drivername=f"{backend}+{driver}"), connect_args
+
+
+def engine_options(url: URL, settings: AppSettings) -> dict[str, Any]:
+    """
+    Build the ``create_engine`` keyword arguments for a database URL.
+
+    Pool sizing, pre-ping and recycling only apply to server databases; SQLite
+    keeps SQLAlchemy's default pool. The statement timeout and prepared
+    statement cache are passed to the driver in the form it expects.
+
+    Args:
+        url: Database URL including the driver, as returned by ``to_async_url``.
+        settings: Application settings holding the ``DB_*`` values.
+
+    Returns:
+        Keyword arguments for ``create_engine`` or ``create_async_engine``.
+        ``connect_args`` is always present and a ``url`` key is included when
+        the URL has to change.
+    """
+    options: dict[str, Any] = {
+        "echo": settings.DB_ECHO,
+        "query_cache_size": settings.DB_QUERY_CACHE_SIZE,
+        "connect_args": {},
+    }
+    if url.get_backend_name() == "sqlite":
+        return options
+
+    driver = url.get_driver_name()
+    options.update(
+        poolclass=TimedAsyncQueuePool if driver == "asyncpg" else TimedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+
+    connect_args = options["connect_args"]
+    timeout = settings.DB_STATEMENT_TIMEOUT_MS
+    if driver == "asyncpg":
+        # asyncpg keeps its own statement cache and SQLAlchemy's dialect
+        # caches prepared statements on top of it; size them together
+        cache_size = settings.DB_STATEMENT_CACHE_SIZE
+        connect_args["statement_cache_size"] = cache_size
+        options["url"] = url.update_query_dict(
+            {"prepared_statement_cache_size": str(cache_size)}
+        )
+        if timeout:
+            connect_args["server_settings"] = {"statement_timeout": str(timeout)}
+    elif driver.startswith("psycopg"):
+        if driver == "psycopg" and not settings.DB_STATEMENT_CACHE_SIZE:
+            # psycopg 3 prepares repeated statements unless disabled
+            connect_args["prepare_threshold"] = None
+        if timeout:
+            connect_args["options"] = f"-c statement_timeout={timeout}"
+    return options
+
+
+def _create_engines(settings: AppSettings) -> tuple[Engine, AsyncEngine]:
+    sync_url = make_url(DATABASE_URL.replace("postgres://", "postgresql://", 1))
+    sync_options = engine_options(sync_url, settings)
+    sync_url = sync_options.pop("url", sync_url)
+
+    async_url, async_connect_args = to_async_url(DATABASE_URL)
+    async_options = engine_options(async_url, settings)
+    async_url = async_options.pop("url", async_url)
+    async_options["connect_args"].update(async_connect_args)
+
+    return (
+        create_engine(sync_url, **sync_options),
+        create_async_engine(async_url, **async_options),
+    )
+
+
 try:
-    connect_args = {}
-    engine = create_engine(
-        url=DATABASE_URL,
-        echo=True,
-        connect_args=connect_args,  # always a dict, never None
+    # Sync engine for scripts, migrations and table creation; the async engine
+    # serves requests
+    engine, async_engine = _create_engines(app_settings)
+    sync_pool_metrics = PoolMetrics().attach(engine)
+    async_pool_metrics = PoolMetrics().attach(async_engine.sync_engine)
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine, class_=AsyncSession, expire_on_commit=False
     )
     Base = SQLModel
 except DatabaseConfigError:
@@ -39,13 +148,27 @@ except Exception as e:
     raise DatabaseInitializationError(f"Error initializing database engine {e}") from e
 
 
+def pool_status() -> dict[str, dict[str, Any]]:
+    """Pool occupancy and checkout, wait and connect counters for both engines."""
+    return {
+        "async": async_pool_metrics.snapshot(async_engine.pool),
+        "sync": sync_pool_metrics.snapshot(engine.pool),
+    }
+
+
 def create_db_and_tables(engine=engine):
     Base.metadata.create_all(engine)
     return engine
 
 
-def get_session() -> Generator[Session, None, None]:
-    """Yield a SQLModel session per request."""
+async def get_session() -> AsyncGenerator[AsyncSession, None]:
+    """Yield an async SQLModel session per request."""
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+def get_sync_session() -> Generator[Session, None, None]:
+    """Yield a blocking session for scripts and maintenance tasks."""
     with Session(engine, expire_on_commit=False) as session:
         yield session
 
@@ -0,0 +1,185 @@
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.interfaces import DBAPIConnection
+from sqlalchemy.pool import (
+    AsyncAdaptedQueuePool,
+    ConnectionPoolEntry,
+    Pool,
+    PoolProxiedConnection,
+    QueuePool,
+)
+
+# Seconds spent opening new connections during the current checkout. Context
+# local, so concurrent checkouts on the async engine's greenlets stay apart.
+_opening_s: ContextVar[float] = ContextVar("_opening_s", default=0.0)
+
+
+@dataclass
+class PoolMetrics:
+    """Running counters for one connection pool.
+
+    Checkouts, checkins and new connections come from pool events. The
+    instrumented queue pools created by ``engine_options`` also time each
+    checkout, split into two parts: wait time is spent queueing for a pooled
+    connection (or an overflow slot), connect time is spent opening a new
+    database connection.
+    """
+
+    checkouts: int = 0
+    checkins: int = 0
+    connects: int = 0
+    invalidations: int = 0
+    timeouts: int = 0
+    wait_count: int = 0
+    wait_total_s: float = 0.0
+    wait_max_s: float = 0.0
+    connect_count: int = 0
+    connect_total_s: float = 0.0
+    connect_max_s: float = 0.0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def record_wait(self, seconds: float, *, timed_out: bool = False) -> None:
+        with self._lock:
+            self.wait_count += 1
+            self.wait_total_s += seconds
+            self.wait_max_s = max(self.wait_max_s, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def record_connect(self, seconds: float) -> None:
+        with self._lock:
+            self.connect_count += 1
+            self.connect_total_s += seconds
+            self.connect_max_s = max(self.connect_max_s, seconds)
+
+    def attach(self, engine: Engine) -> "PoolMetrics":
+        """Listen to the pool events of ``engine``."""
+        pool = engine.pool
+        if isinstance(pool, _TimedPoolMixin):
+            pool._metrics = self
+
+        @event.listens_for(pool, "connect")
+        def _on_connect(
+            _dbapi_connection: DBAPIConnection,
+            _connection_record: ConnectionPoolEntry,
+        ) -> None:
+            with self._lock:
+                self.connects += 1
+
+        @event.listens_for(pool, "checkout")
+        def _on_checkout(
+            _dbapi_connection: DBAPIConnection,
+            _connection_record: ConnectionPoolEntry,
+            _connection_proxy: PoolProxiedConnection,
+        ) -> None:
+            with self._lock:
+                self.checkouts += 1
+
+        @event.listens_for(pool, "checkin")
+        def _on_checkin(
+            _dbapi_connection: DBAPIConnection | None,
+            _connection_record: ConnectionPoolEntry,
+        ) -> None:
+            with self._lock:
+                self.checkins += 1
+
+        @event.listens_for(pool, "invalidate")
+        def _on_invalidate(
+            _dbapi_connection: DBAPIConnection,
+            _connection_record: ConnectionPoolEntry,
+            _exception: BaseException | None,
+        ) -> None:
+            with self._lock:
+                self.invalidations += 1
+
+        return self
+
+    def snapshot(self, pool: Pool) -> dict[str, Any]:
+        """Current pool occupancy together with the running counters."""
+        with self._lock:
+            data: dict[str, Any] = {
+                "pool": pool.__class__.__name__,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "wait_count": self.wait_count,
+                "wait_avg_ms": _average_ms(self.wait_total_s, self.wait_count),
+                "wait_max_ms": self.wait_max_s * 1000,
+                "connect_count": self.connect_count,
+                "connect_avg_ms": _average_ms(self.connect_total_s, self.connect_count),
+                "connect_max_ms": self.connect_max_s * 1000,
+            }
+        if isinstance(pool, QueuePool):
+            data.update(
+                size=pool.size(),
+                checked_in=pool.checkedin(),
+                checked_out=pool.checkedout(),
+                overflow=pool.overflow(),
+            )
+        return data
+
+
+def _average_ms(total_s: float, count: int) -> float:
+    return total_s / count * 1000 if count else 0.0
+
+
+class _TimedPoolMixin:
+    """Measure how long callers wait for a connection from the pool.
+
+    Time spent opening new connections during a checkout is recorded as
+    connect time and left out of the wait time.
+    """
+
+    _metrics: PoolMetrics | None = None
+
+    def connect(self) -> PoolProxiedConnection:  # type: ignore[override]
+        start = time.perf_counter()
+        token = _opening_s.set(0.0)
+        timed_out = False
+        try:
+            return super().connect()  # type: ignore[misc]
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            if self._metrics is not None:
+                self._metrics.record_wait(
+                    time.perf_counter() - start - _opening_s.get(),
+                    timed_out=timed_out,
+                )
+            _opening_s.reset(token)
+
+    def _create_connection(self) -> ConnectionPoolEntry:  # type: ignore[override]
+        start = time.perf_counter()
+        try:
+            record = super()._create_connection()  # type: ignore[misc]
+        finally:
+            elapsed = time.perf_counter() - start
+            _opening_s.set(_opening_s.get() + elapsed)
+        if self._metrics is not None:
+            self._metrics.record_connect(elapsed)
+        return record
+
+    def recreate(self) -> Pool:  # type: ignore[override]
+        # Keep counting across engine.dispose()
+        pool = super().recreate()  # type: ignore[misc]
+        pool._metrics = self._metrics
+        return pool
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    pass
+
+
+class TimedAsyncQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
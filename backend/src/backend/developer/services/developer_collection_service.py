@@ -1,5 +1,5 @@
 import asyncio
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from uuid import UUID
 
 from backend.developer.access import QuestionCollectionAccessService
@@ -11,7 +11,10 @@ from backend.developer.exceptions import DeveloperAccessDenied
 from backend.developer.model import DeveloperProfile
 from backend.developer.services.developer_profile_service import DeveloperProfileService
 from backend.question import Question
-from backend.question_collections.exceptions import QuestionCollectionNotFoundError
+from backend.question_collections.exceptions import (
+    QuestionCollectionError,
+    QuestionCollectionNotFoundError,
+)
 from backend.question_collections.model import (
     QuestionCollection,
     QuestionCollectionLink,
@@ -20,7 +23,9 @@ from backend.question_collections.schema import QuestionCollectionRead
 from backend.question_collections.service.question_collection_service import (
     QuestionCollectionService,
 )
+from backend.question_manager import QuestionManager
 from backend.shared import ID
+from backend.utils import safe_dir_name
 
 
 class DeveloperCollectionService:
@@ -31,10 +36,12 @@ class DeveloperCollectionService:
         developer_profiles: DeveloperProfileService,
         collections: QuestionCollectionService[DeveloperProfile],
         collection_access: QuestionCollectionAccessService,
+        question_manager: QuestionManager | None = None,
     ) -> None:
         self._developer_profiles = developer_profiles
         self._collections = collections
         self._collection_access = collection_access
+        self._question_manager = question_manager
         self._policy = DeveloperCollectionPolicy()
 
     async def create_collection(
@@ -52,7 +59,7 @@ class DeveloperCollectionService:
                 parent_id,
                 DeveloperCollectionAction.CREATE_CHILD,
             )
-            parent = self._require_collection(parent_id)
+            parent = await self._require_collection(parent_id)
 
         return await self._collections.create_collection(owner, title, parent)
 
@@ -69,9 +76,12 @@ class DeveloperCollectionService:
         collections = await self._collections.search_collections(
             owner, collection_id=collection_id, title=title, offset=offset, limit=limit
         )
-        collection_reads = await asyncio.gather(
-            *(self._collections.get_collection_read(c.id) for c in collections if c.id)
-        )
+        # One session cannot run queries concurrently, so read them in turn
+        collection_reads = [
+            await self._collections.get_collection_read(c.id)
+            for c in collections
+            if c.id
+        ]
 
         return [collection for collection in collection_reads if collection is not None]
 
@@ -85,7 +95,7 @@ class DeveloperCollectionService:
             collection_id,
             DeveloperCollectionAction.VIEW,
         )
-        return self._require_collection(collection_id)
+        return await self._require_collection(collection_id)
 
     async def update_collection(
         self,
@@ -109,7 +119,7 @@ class DeveloperCollectionService:
                 parent_id,
                 DeveloperCollectionAction.CREATE_CHILD,
             )
-            parent = self._require_collection(parent_id)
+            parent = await self._require_collection(parent_id)
 
         return await self._collections.update_collection(
             owner,
@@ -159,7 +169,7 @@ class DeveloperCollectionService:
         offset: int | None = None,
         limit: int | None = 100,
     ) -> Sequence[QuestionCollection]:
-        return self._collections.list_collections_by_owner(
+        return await self._collections.list_collections_by_owner(
             await self._developer_profiles.get_profile(user_id), offset, limit
         )
 
@@ -182,6 +192,51 @@ class DeveloperCollectionService:
         )
         return await self._collections.get_all_questions(collection_id)
 
+    async def prepare_collection_download(
+        self, user_id: ID, collection_id: ID
+    ) -> tuple[str, list[tuple[str, str]]]:
+        """Resolve the archive name and entries for a collection export.
+
+        Every question is placed in its own folder under the collection folder.
+        Files are listed up front so failures surface before streaming starts.
+        """
+        question_manager = self._require_question_manager()
+        collection = await self.get_collection(user_id, collection_id)
+        questions = await self.get_all_questions(user_id, collection_id)
+        root = safe_dir_name(collection.title or "Collection")
+
+        folders: list[tuple[str, str]] = []
+        used: set[str] = set()
+        for question in questions:
+            if not question.storage_path:
+                continue
+            base = safe_dir_name(question.title or str(question.id))
+            name, n = base, 1
+            while name in used:
+                n += 1
+                name = f"{base}_{n}"
+            used.add(name)
+            folders.append((question.storage_path, f"{root}/{name}"))
+
+        try:
+            listed = await asyncio.gather(
+                *(
+                    question_manager.storage.archive_entries(path, folder)
+                    for path, folder in folders
+                )
+            )
+        except Exception as e:
+            raise QuestionCollectionError(
+                f"Failed to list files for collection {collection_id}: {e}"
+            ) from e
+        return root, [entry for entries in listed for entry in entries]
+
+    def stream_download(
+        self, entries: Sequence[tuple[str, str]]
+    ) -> AsyncIterator[bytes]:
+        """Stream a ZIP archive for entries returned by a prepare step."""
+        return self._require_question_manager().stream_archive(entries)
+
     async def _require_action(
         self,
         user_id: ID,
@@ -201,8 +256,15 @@ class DeveloperCollectionService:
                 question_id=str(collection_id),
             )
 
-    def _require_collection(self, collection_id: ID) -> QuestionCollection:
-        collection = self._collections.get_collection(collection_id)
+    def _require_question_manager(self) -> QuestionManager:
+        if self._question_manager is None:
+            raise QuestionCollectionError(
+                "Collection downloads require a question manager"
+            )
+        return self._question_manager
+
+    async def _require_collection(self, collection_id: ID) -> QuestionCollection:
+        collection = await self._collections.get_collection(collection_id)
         if collection is None:
             raise QuestionCollectionNotFoundError(str(collection_id))
         return collection
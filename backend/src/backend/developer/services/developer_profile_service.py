@@ -1,7 +1,8 @@
 import re
 
 from sqlalchemy.exc import SQLAlchemyError
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.access_policy import RoleAccessPolicy
 from backend.access_policy.service.profile_service import ProfileService
@@ -24,7 +25,7 @@ class DeveloperProfileService(ProfileService[DeveloperProfile]):
 
     def __init__(
         self,
-        session: Session,
+        session: AsyncSession,
         storage: Storage,
         user_manager: UserManager,
     ) -> None:
@@ -42,9 +43,11 @@ class DeveloperProfileService(ProfileService[DeveloperProfile]):
         """Fetch the developer profile for a user."""
         try:
             logger.debug("Fetching developer profile for user %s", user_id)
-            return self._session.exec(
-                select(DeveloperProfile).where(
-                    DeveloperProfile.user_id == convert_uuid(user_id)
+            return (
+                await self._session.exec(
+                    select(DeveloperProfile).where(
+                        DeveloperProfile.user_id == convert_uuid(user_id)
+                    )
                 )
             ).first()
         except SQLAlchemyError as e:
@@ -57,9 +60,11 @@ class DeveloperProfileService(ProfileService[DeveloperProfile]):
             storage_path = await self.generate_storage_path(user_id)
             logger.debug("Setting developer profile for user %s", user_id)
 
-            dev_profile = self._session.exec(
-                select(DeveloperProfile).where(
-                    DeveloperProfile.user_id == convert_uuid(user_id)
+            dev_profile = (
+                await self._session.exec(
+                    select(DeveloperProfile).where(
+                        DeveloperProfile.user_id == convert_uuid(user_id)
+                    )
                 )
             ).first()
 
@@ -72,18 +77,18 @@ class DeveloperProfileService(ProfileService[DeveloperProfile]):
 
             self._storage.create_dir(storage_path)
             self._session.add(dev_profile)
-            self._session.commit()
-            self._session.refresh(dev_profile)
+            await self._session.commit()
+            await self._session.refresh(dev_profile)
             return dev_profile
         except SQLAlchemyError as e:
-            self._session.rollback()
+            await self._session.rollback()
             logger.warning(
                 "Database error setting developer profile for user %s",
                 user_id,
             )
             raise self._operation_error("set_up", str(user_id), str(e)) from e
         except Exception as e:
-            self._session.rollback()
+            await self._session.rollback()
             logger.warning(
                 "Failed setting developer profile for user %s: %s",
                 user_id,
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import json
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
+from pathlib import Path
 from typing import Any, Literal
 
 from sqlalchemy.exc import SQLAlchemyError
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.core import logger
 from backend.developer.access import QuestionAccessService
@@ -27,9 +27,15 @@ from backend.question_manager.exceptions import (
     DeveloperQuestionServiceError,
     QuestionNotFoundError,
 )
+from backend.question_manager.schemas import (
+    QuestionImportItem,
+    QuestionImportReport,
+)
+from backend.question_manager.services.importer import QuestionImporter
 from backend.question_manager.services.manager import QuestionManager
 from backend.shared import ID
-from backend.storage import FileData
+from backend.storage import FileData, LazyFileData
+from backend.utils import safe_dir_name
 
 
 class DeveloperQuestionService:
@@ -37,7 +43,7 @@ class DeveloperQuestionService:
 
     def __init__(
         self,
-        session: Session,
+        session: AsyncSession,
         question_manager: QuestionManager,
         developer_profiles: DeveloperProfileService,
         question_access: QuestionAccessService,
@@ -67,7 +73,17 @@ class DeveloperQuestionService:
             storage_base_path=storage_path,
             files=files,
         )
-        return self._assign_creator(user_id, question, profile)
+        return await self._assign_creator(user_id, question, profile)
+
+    async def import_questions(
+        self, user_id: ID, items: Sequence[QuestionImportItem]
+    ) -> QuestionImportReport:
+        """Bulk create questions owned by the developer profile."""
+        profile = await self._developer_profiles.get_profile(user_id)
+        storage_path = self._require_profile_storage_path(user_id, profile)
+        return await QuestionImporter(self._question_manager).import_questions(
+            items, storage_path, created_by_id=profile.id
+        )
 
     async def copy_question(self, qid: ID, user_id: ID):
         """Create a copy question under the developer profile and assign ownership."""
@@ -76,7 +92,7 @@ class DeveloperQuestionService:
         storage_path = self._require_profile_storage_path(user_id, profile)
 
         question = await self._question_manager.copy_question(qid, storage_path)
-        return self._assign_creator(user_id, question, profile)
+        return await self._assign_creator(user_id, question, profile)
 
     async def get_question(
         self, user_id: ID, qid: ID, method: Literal["full", "simple"] = "simple"
@@ -123,21 +139,17 @@ class DeveloperQuestionService:
             ) from e
 
     async def prepare_question_download(
-        self, user_id: ID, qid: ID
-    ) -> dict[str, bytes | bytearray]:
+        self, user_id: ID, qid: ID, folder_name: str | None = None
+    ) -> list[tuple[str, str]]:
+        """Resolve the archive entries for a question download.
+
+        Access is checked and files are listed up front so failures surface
+        before the response starts streaming.
+        """
         try:
             await self._require_action(user_id, qid, DeveloperQuestionAction.DOWNLOAD)
-            qfiles = await self._question_manager.get_question_filedata(qid)
-            file_payload: dict[str, bytes | bytearray] = {}
-            for f in qfiles:
-                content = f.content
-                if isinstance(content, str):
-                    content = content.encode()
-                elif isinstance(content, dict):
-                    content = (json.dumps(content)).encode()
-
-                file_payload[f.filename] = content
-            return file_payload
+            folder = safe_dir_name(folder_name) if folder_name else "Download_Zip"
+            return await self._question_manager.get_archive_entries(qid, folder)
 
         except QuestionNotFoundError:
             raise
@@ -148,6 +160,12 @@ class DeveloperQuestionService:
                 f"Failed to download question {qid}: {e}"
             ) from e
 
+    def stream_download(
+        self, entries: Sequence[tuple[str, str]]
+    ) -> AsyncIterator[bytes]:
+        """Stream a ZIP archive for entries returned by a prepare step."""
+        return self._question_manager.stream_archive(entries)
+
     # ------------------------------------------------------------------
     # Question Files
     # ------------------------------------------------------------------
@@ -161,11 +179,25 @@ class DeveloperQuestionService:
         await self._require_action(user_id, qid, DeveloperQuestionAction.READ_FILE)
         return await self._question_manager.get_question_filedata(qid)
 
+    async def get_question_file_handles(
+        self, user_id: ID, qid: ID
+    ) -> Sequence[LazyFileData]:
+        """List question files with metadata only; content is not downloaded."""
+        await self._require_action(user_id, qid, DeveloperQuestionAction.READ_FILE)
+        return await self._question_manager.get_question_file_handles(qid)
+
     async def read_file(self, user_id: ID, qid: ID, filename: str) -> bytes | None:
         """Read a stored question file after checking developer question control."""
         await self._require_action(user_id, qid, DeveloperQuestionAction.READ_FILE)
         return await self._question_manager.read_file(qid, filename)
 
+    async def get_local_file_path(
+        self, user_id: ID, qid: ID, filename: str
+    ) -> Path | None:
+        """Resolve a question file to a local path after checking file access."""
+        await self._require_action(user_id, qid, DeveloperQuestionAction.READ_FILE)
+        return await self._question_manager.get_local_file_path(qid, filename)
+
     async def write_file(self, user_id: ID, qid: ID, filename: str, data: Any):
         """Write or replace a question file after checking developer question control."""
         await self._require_action(user_id, qid, DeveloperQuestionAction.WRITE_FILE)
@@ -193,7 +225,7 @@ class DeveloperQuestionService:
             )
         return profile.storage_path
 
-    def _assign_creator(
+    async def _assign_creator(
         self, user_id: ID, question: Question, profile: DeveloperProfile
     ) -> Question:
         """Assign the developer profile as the creator of a question."""
@@ -203,11 +235,11 @@ class DeveloperQuestionService:
             )
             question.created_by = profile
             self._session.add(question)
-            self._session.commit()
-            self._session.refresh(question)
+            await self._session.commit()
+            await self._session.refresh(question)
             return question
         except SQLAlchemyError as e:
-            self._session.rollback()
+            await self._session.rollback()
             logger.warning("Failed assigning creator to question %s", question.id)
             raise DeveloperProfileError(
                 "assign question creator", str(user_id), str(e)
@@ -14,16 +14,16 @@ class DeveloperTables:
     def __init__(self, table_service: TableQueryService) -> None:
         self._table_service = table_service
 
-    def search_my_questions(
+    async def search_my_questions(
         self,
         dev: DeveloperProfile,
         params: QuestionSearchParams | None = None,
     ) -> Sequence[QuestionTableRow]:
         assert dev.id
         context = QuestionTableSearchContext(developer_profile_id=dev.id)
-        return self._table_service.search(params=params, context=context)
+        return await self._table_service.search(params=params, context=context)
 
-    def get_questions_by_collection(
+    async def get_questions_by_collection(
         self,
         dev: DeveloperProfile,
         params: QuestionSearchParams | None = None,
@@ -47,4 +47,4 @@ class DeveloperTables:
             }
         )
         context = QuestionTableSearchContext(developer_profile_id=dev.id)
-        return self._table_service.search(params=params, context=context)
+        return await self._table_service.search(params=params, context=context)
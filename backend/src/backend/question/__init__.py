@@ -17,6 +17,7 @@ from backend.question.exceptions import (
 )
 from backend.question.models import (
     Question,
+    QuestionFile,
     QuestionQTypeLink,
     QuestionTopicLink,
     QuestionType,
@@ -25,6 +26,8 @@ from backend.question.models import (
 from backend.question.schema import (
     QType,
     QuestionCreate,
+    QuestionFileEntry,
+    QuestionFileManifest,
     QuestionFilter,
     QuestionInternalCreate,
     QuestionRead,
@@ -36,6 +39,7 @@ from backend.question.schema import (
 )
 from backend.question.services.qtype import QuestionQTypeDB
 from backend.question.services.question import QuestionDB
+from backend.question.services.question_file import QuestionFileDB
 from backend.question.services.question_storage_service import (
     InvalidQuestionFile,
     QuestionStorageService,
@@ -51,6 +55,10 @@ __all__ = [
     "QuestionDB",
     "QuestionDBError",
     "QuestionDeleteError",
+    "QuestionFile",
+    "QuestionFileDB",
+    "QuestionFileEntry",
+    "QuestionFileManifest",
     "QuestionFilter",
     "QuestionInternalCreate",
     "QuestionNotFoundError",
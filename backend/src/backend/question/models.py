@@ -1,7 +1,8 @@
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID, uuid4
 
+from sqlalchemy import Column, DateTime, ForeignKey, Index, UniqueConstraint
 from sqlmodel import Field as SQLField
 from sqlmodel import Relationship, SQLModel
 
@@ -97,6 +98,32 @@ class Question(SQLModel, table=True):
     updated_at: datetime | None = SQLField(default_factory=datetime.now)
 
 
+# Per-file manifest kept in step with writes to the question's storage folder.
+class QuestionFile(SQLModel, table=True):
+    __tablename__ = "question_file"  # type: ignore
+    __table_args__ = (
+        UniqueConstraint("question_id", "filename", name="uq_question_file_filename"),
+        Index("ix_question_file_question_updated", "question_id", "updated_at"),
+    )
+
+    id: UUID = SQLField(default_factory=uuid4, primary_key=True)
+    question_id: UUID = SQLField(
+        sa_column=Column(
+            ForeignKey("question.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+    )
+    filename: str
+    size: int = 0
+    sha256: str | None = None
+    # Deleted files are kept as tombstones so incremental syncs see them
+    deleted: bool = SQLField(default=False)
+    updated_at: datetime = SQLField(
+        sa_column=Column(DateTime(timezone=True), nullable=False),
+        default_factory=lambda: datetime.now(UTC),
+    )
+
+
 # Topic taxonomy for grouping questions.
 class Topic(SQLModel, table=True):
     __tablename__ = "topic"  # type: ignore
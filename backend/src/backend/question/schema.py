@@ -1,8 +1,11 @@
 from collections.abc import Sequence
+from datetime import datetime
 from enum import StrEnum
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from backend.utils import as_utc
 
 
 class Status(StrEnum):
@@ -81,6 +84,8 @@ class QuestionRead(QuestionRelationships):
     created_by_id: UUID | None = None
     ai_generated: bool
     isAdaptive: bool
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -96,6 +101,32 @@ class QuestionTableRow(BaseModel):
     institution: str
 
 
+# Question file manifest models
+class QuestionFileEntry(BaseModel):
+    filename: str
+    size: int
+    sha256: str | None = None
+    deleted: bool = False
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @field_validator("updated_at")
+    @classmethod
+    def _utc(cls, value: datetime) -> datetime:
+        # SQLite returns stored timestamps without their offset
+        return as_utc(value)
+
+
+class QuestionFileManifest(BaseModel):
+    question_id: UUID
+    # Pass back as ``since`` to receive entries changed afterwards. Entries
+    # from a short window before the cursor are sent again, so clients skip
+    # those whose filename and updated_at they have already applied.
+    cursor: datetime | None = None
+    files: list[QuestionFileEntry]
+
+
 # Question query models
 class QuestionFilter(BaseModel):
     title: str
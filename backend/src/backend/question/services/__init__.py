@@ -2,6 +2,7 @@
 
 from backend.question.services.qtype import QuestionQTypeDB
 from backend.question.services.question import QuestionDB
+from backend.question.services.question_file import QuestionFileDB
 from backend.question.services.question_storage_service import (
     InvalidQuestionFile,
     QuestionStorageService,
@@ -11,6 +12,7 @@ from backend.question.services.question_table import QuestionQueryService
 __all__ = [
     "InvalidQuestionFile",
     "QuestionDB",
+    "QuestionFileDB",
     "QuestionQTypeDB",
     "QuestionQueryService",
     "QuestionStorageService",
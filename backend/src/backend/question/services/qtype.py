@@ -1,62 +1,67 @@
+from collections.abc import Iterable
 from typing import overload
 
 from sqlalchemy.exc import SQLAlchemyError
-from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.core import logger
 from backend.question.models import QuestionType
 from backend.question.schema import QType
 from backend.shared import ID
-from backend.utils import convert_uuid
+from backend.utils import LookupCache, convert_uuid
 
 
 class QuestionQTypeDB:
-    def __init__(self, session: Session) -> None:
+    # Question types are seeded at startup and only change through create
+    cache = LookupCache(QuestionType)
+
+    def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
-    def create(self, t: QType, description: str | None = None) -> QuestionType:
+    async def create(self, t: QType, description: str | None = None) -> QuestionType:
         qtype = QuestionType(
             name=t, description=description, display_name=t.display_name
         )
         try:
             self._session.add(qtype)
-            self._session.commit()
-            self._session.refresh(qtype)
+            await self._session.commit()
+            await self._session.refresh(qtype)
+            self.cache.invalidate()
             return qtype
         except SQLAlchemyError as e:
-            self._session.rollback()
+            await self._session.rollback()
             logger.exception("[QuestionQTypeDB] Failed to create question")
             raise ValueError("Failed to create qtype") from e
 
     @overload
-    def get_qtype(self, identifier: QType) -> QuestionType | None: ...
+    async def get_qtype(self, identifier: QType) -> QuestionType | None: ...
     @overload
-    def get_qtype(self, identifier: ID) -> QuestionType | None: ...
+    async def get_qtype(self, identifier: ID) -> QuestionType | None: ...
 
-    def get_qtype(self, identifier: ID | QType) -> QuestionType | None:
+    async def get_qtype(self, identifier: ID | QType) -> QuestionType | None:
         try:
             if isinstance(identifier, QType):
-                return self._session.exec(
-                    select(QuestionType).where(QuestionType.name == identifier)
-                ).first()
+                return await self.cache.get(self._session, identifier)
             if not identifier:
                 raise ValueError("[DB] Identifier cannot be none")
-            identifier_id = convert_uuid(identifier)
-            return self._session.exec(
-                select(QuestionType).where(QuestionType.id == identifier_id)
-            ).first()
+            return await self.cache.get_by_id(self._session, convert_uuid(identifier))
 
         except SQLAlchemyError as e:
             logger.error(f"[DB] Could not get institution: {e}")
             raise
 
-    def get_qtype_by_name(self, name: QType | str) -> QuestionType | None:
+    async def get_qtype_by_name(self, name: QType | str) -> QuestionType | None:
         qtype = name if isinstance(name, QType) else QType(name.lower())
-        return self._session.exec(
-            select(QuestionType).where(QuestionType.name == qtype)
-        ).first()
+        return await self.cache.get(self._session, qtype)
+
+    async def get_qtypes_by_name(
+        self, names: Iterable[QType | str]
+    ) -> dict[QType, QuestionType]:
+        """Fetch several question types at once; unknown names are absent."""
+        wanted = {n if isinstance(n, QType) else QType(n.lower()) for n in names}
+        return await self.cache.get_many(self._session, wanted)
 
-    def seed_types(self) -> None:
+    async def seed_types(self) -> None:
         valid_types: dict[QType, str] = {
             QType.MC: "A question where the learner selects one correct option from a set of choices.",
             QType.MCQ: "A multiple choice question with one correct answer among several options.",
@@ -66,5 +71,5 @@ class QuestionQTypeDB:
             QType.NUM: "A question where the learner provides a numeric answer.",
         }
         for qtype, description in valid_types.items():
-            if not self.get_qtype(qtype):
-                self.create(qtype, description)
+            if not await self.get_qtype(qtype):
+                await self.create(qtype, description)
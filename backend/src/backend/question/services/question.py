@@ -1,14 +1,17 @@
-import asyncio
 from collections.abc import Sequence
+from datetime import datetime
 from pathlib import Path, PurePosixPath
 from typing import Any, Literal
 from uuid import UUID
 
 from pydantic import ValidationError
-from sqlalchemy import func
+from sqlalchemy import insert, inspect
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import joinedload, selectinload
 from sqlalchemy.sql.elements import ColumnElement
-from sqlmodel import Session, delete, select
+from sqlmodel import col, delete, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.sql.expression import SelectOfScalar
 
 from backend.core import logger
 from backend.question.exceptions import (
@@ -20,24 +23,43 @@ from backend.question.exceptions import (
     QuestionUpdateError,
     QuestionValidationError,
 )
-from backend.question.models import Question, Topic
+from backend.question.models import (
+    Question,
+    QuestionFile,
+    QuestionQTypeLink,
+    QuestionTopicLink,
+    QuestionType,
+    Topic,
+)
 from backend.question.schema import (
+    QType,
     QuestionCreate,
     QuestionFilter,
+    QuestionInternalCreate,
     QuestionRead,
     QuestionRelationships,
     QuestionUpdate,
     Status,
 )
 from backend.shared import ID
-from backend.utils import convert_uuid
+from backend.utils import (
+    convert_uuid,
+    decode_cursor,
+    encode_cursor,
+    keyset_after,
+    title_rank,
+    title_search,
+)
 from backend.utils import database_generics as gdb
 
 from .qtype import QuestionQTypeDB
 
 
 class QuestionDB:
-    def __init__(self, session: Session) -> None:
+    # Listing order; the id breaks ties so the order is total
+    PAGE_KEY = (Question.updated_at, Question.created_at, Question.id)
+
+    def __init__(self, session: AsyncSession) -> None:
         """
         Initialize the question data access layer.
 
@@ -48,6 +70,9 @@ class QuestionDB:
         self._qtype = QuestionQTypeDB(self.session)
         self.metadata_rel = ["topics", "qType"]
         self.excluded_fields = self.metadata_rel
+        # Questions loaded by this instance. The session's identity map only
+        # holds weak references, so keep them alive for the request.
+        self._loaded: dict[UUID, Question] = {}
 
     async def create_question(
         self,
@@ -69,19 +94,120 @@ class QuestionDB:
             **question.model_dump(exclude=set(self.excluded_fields)),
         )
 
-        self.session.add(question_orm)
+        # Attach relationships while the question is still transient; once it
+        # is flushed, assigning a collection would need a lazy load first
         question_orm = await self._attach_question_relationships(question_orm, question)
         self.session.add(question_orm)
         # persist to database
         try:
-            self.session.commit()
-            self.session.refresh(question_orm)
+            await self.session.commit()
+            await self.session.refresh(question_orm)
+            await self.session.refresh(question_orm, attribute_names=self.metadata_rel)
             return question_orm
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
             logger.exception("[QuestionDB] Failed to create question")
             raise QuestionCreateError(f"Failed to create question: {e}") from e
 
+    async def bulk_create_questions(
+        self,
+        questions: Sequence[QuestionInternalCreate],
+        files: Sequence[QuestionFile] = (),
+    ) -> list[UUID]:
+        """
+        Insert many questions, their relationships and file manifests at once.
+
+        Topics are resolved with ``get_or_create_many`` and question types with
+        one query. Questions, link rows and manifest rows are then written with
+        one multi-row INSERT per table, all in one transaction.
+
+        Args:
+            questions: Validated payloads. Each must carry its ``id``.
+            files: Manifest rows for files already written to storage.
+
+        Returns:
+            The ids of the inserted questions, in input order.
+
+        Raises:
+            QuestionValidationError: If a question has no id or references a
+                question type that is not seeded.
+            QuestionCreateError: If the transaction fails; nothing is written.
+        """
+        if not questions:
+            return []
+        if any(q.id is None for q in questions):
+            raise QuestionValidationError("Bulk created questions need an id.")
+
+        rows = [
+            Question.model_validate(
+                q.model_dump(exclude=set(self.metadata_rel), exclude_none=True)
+            )
+            for q in questions
+        ]
+        try:
+            qtypes = await self._resolve_qtypes(
+                [qtype for q in questions for qtype in q.qType]
+            )
+            qtype_ids = {name: qtype.id for name, qtype in qtypes.items()}
+            names = [name for q in questions for name in q.topics]
+            topics = await gdb.get_or_create_many(self.session, Topic, names)
+            topic_ids = {
+                name.lower(): topic.id
+                for name, topic in zip(names, topics, strict=True)
+            }
+
+            topic_links = {
+                (row.id, topic_ids[name.lower()])
+                for row, q in zip(rows, questions, strict=True)
+                for name in q.topics
+            }
+            qtype_links = {
+                (row.id, qtype_ids[qtype])
+                for row, q in zip(rows, questions, strict=True)
+                for qtype in q.qType
+            }
+
+            await self.session.execute(
+                insert(Question), [row.model_dump() for row in rows]
+            )
+            if topic_links:
+                await self.session.execute(
+                    insert(QuestionTopicLink),
+                    [{"question_id": q, "topic_id": t} for q, t in topic_links],
+                )
+            if qtype_links:
+                await self.session.execute(
+                    insert(QuestionQTypeLink),
+                    [{"question_id": q, "qtype_id": t} for q, t in qtype_links],
+                )
+            if files:
+                await self.session.execute(
+                    insert(QuestionFile), [f.model_dump() for f in files]
+                )
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logger.exception("[QuestionDB] Failed to bulk create questions")
+            raise QuestionCreateError(f"Failed to bulk create questions: {e}") from e
+        logger.info("[QuestionDB] Bulk created %s questions", len(rows))
+        return [row.id for row in rows if row.id is not None]
+
+    async def existing_ids(self, ids: Sequence[ID]) -> set[UUID]:
+        """Return which of ``ids`` already belong to a question."""
+        if not ids:
+            return set()
+        try:
+            found = await self.session.exec(
+                select(Question.id).where(
+                    col(Question.id).in_([convert_uuid(i) for i in ids])
+                )
+            )
+            return {qid for qid in found.all() if qid is not None}
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logger.exception("[QuestionDB] Failed to look up question ids")
+            raise QuestionReadError(f"Failed to look up question ids: {e}") from e
+
     async def get_questions_by_creator(
         self, created_by_id: UUID | str
     ) -> Sequence[Question]:
@@ -95,13 +221,15 @@ class QuestionDB:
             A sequence of Question ORM instances owned by the creator.
         """
         try:
-            return self.session.exec(
-                select(Question).where(
-                    Question.created_by_id == convert_uuid(created_by_id)
+            return (
+                await self.session.exec(
+                    select(Question).where(
+                        Question.created_by_id == convert_uuid(created_by_id)
+                    )
                 )
             ).all()
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
             logger.exception("[QuestionDB] Failed to retrieve questions by creator")
             raise QuestionReadError(
                 f"Failed to retrieve questions for creator '{created_by_id}': {e}"
@@ -120,52 +248,79 @@ class QuestionDB:
         if qid is None:
             raise QuestionValidationError("Question id cannot be None.")
 
+        question_id = convert_uuid(qid)
+        if (cached := self._cached(question_id)) is not None:
+            return cached
         try:
-            question_id = convert_uuid(qid)
-            return self.session.exec(
-                select(Question).where(Question.id == question_id)
-            ).first()
+            question = await self.session.get(Question, question_id)
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
             logger.exception("[QuestionDB] Failed to retrieve question")
             raise QuestionReadError(f"Failed to retrieve question '{qid}': {e}") from e
+        if question is not None:
+            self._loaded[question_id] = question
+        return question
 
     async def get_all_questions(
         self,
         offset: int = 0,
         limit: int = 100,
         method: Literal["default", "full"] = "default",
+        *,
+        cursor: str | None = None,
     ) -> Sequence[Question | QuestionRead]:
         """
-        Retrieve a paginated list of questions.
+        Retrieve a page of questions, most recently updated first.
+
+        Pages are ordered by ``(updated_at, created_at, id)``. Passing the
+        ``cursor`` of the previous page's last item (see ``page_cursor``)
+        continues after it with an index range scan instead of an OFFSET, so
+        every page costs the same.
 
         Args:
-            offset: Number of rows to skip.
+            offset: Number of rows to skip. Ignored when ``cursor`` is given.
             limit: Maximum number of rows to return.
             method: Return raw ORM models with ``default`` or expanded data with ``full``.
+            cursor: Opaque cursor returned by ``page_cursor``.
 
         Returns:
             A sequence of Question models or QuestionData models depending on ``method``.
-        """
-        try:
-            all_questions = self.session.exec(
-                select(Question).offset(offset).limit(limit)
-            ).all()
 
-            if method == "default":
-                return all_questions
-            if method == "full":
-                return await asyncio.gather(
-                    *[self.get_question_data(q.id) for q in all_questions]
-                )
+        Raises:
+            QuestionValidationError: If ``method`` or ``cursor`` is invalid.
+        """
+        if method not in ("default", "full"):
             raise QuestionValidationError(
                 f"Unsupported get_all_questions method '{method}'."
             )
+        stmt = select(Question).order_by(
+            *(column.desc().nullslast() for column in self.PAGE_KEY)
+        )
+        if cursor is not None:
+            try:
+                after = decode_cursor(cursor, (datetime, datetime, UUID))
+            except ValueError as e:
+                raise QuestionValidationError(str(e)) from e
+            stmt = stmt.where(keyset_after(self.PAGE_KEY, after))
+        else:
+            stmt = stmt.offset(offset)
+        stmt = stmt.limit(limit)
+        try:
+            if method == "default":
+                return (await self.session.exec(stmt)).all()
+            # One query for the page plus one per relationship, whatever the size
+            questions = (await self.session.exec(self._with_relationships(stmt))).all()
+            return [self._to_read(q) for q in questions]
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
             logger.exception("[QuestionDB] Failed to retrieve questions")
             raise QuestionReadError(f"Failed to retrieve questions: {e}") from e
 
+    @staticmethod
+    def page_cursor(question: Question | QuestionRead) -> str:
+        """Cursor that continues a ``get_all_questions`` listing after ``question``."""
+        return encode_cursor(question.updated_at, question.created_at, question.id)
+
     async def get_question_data(self, qid: ID) -> QuestionRead:
         """
         Retrieve a question and expand its relationship fields into QuestionData.
@@ -176,13 +331,51 @@ class QuestionDB:
         Returns:
             A QuestionData representation of the stored question.
         """
-        q = await self.get_question(qid)
+        q = await self.load_question(qid)
         if not q:
             raise QuestionNotFoundError(f"Question '{qid}' was not found.")
-        question_data = q.model_dump(exclude=set(self.metadata_rel))
-        relationship_data = await self.get_question_relationship_data(q)
+        return self._to_read(q)
+
+    async def load_question(self, qid: ID) -> Question | None:
+        """
+        Retrieve a question with its topics and question types loaded.
+
+        Loaded questions are kept for the lifetime of this instance, which is
+        one request: a question already loaded with both relationships is
+        returned without a query, as long as it is still current in the
+        session. Otherwise a single SELECT joins the question to its topics
+        and question types, including the storage path used by file
+        operations, and later calls for the same id are free.
 
-        return QuestionRead(**question_data, **relationship_data)
+        Args:
+            qid: Question identifier.
+
+        Returns:
+            The Question ORM instance, or None if not found.
+        """
+        if qid is None:
+            raise QuestionValidationError("Question id cannot be None.")
+        question_id = convert_uuid(qid)
+        cached = self._cached(question_id, self.metadata_rel)
+        if cached is not None:
+            return cached
+        try:
+            stmt = (
+                select(Question)
+                .where(Question.id == question_id)
+                .options(
+                    joinedload(Question.topics),  # type: ignore[arg-type]
+                    joinedload(Question.qType),  # type: ignore[arg-type]
+                )
+            )
+            question = (await self.session.exec(stmt)).unique().first()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logger.exception("[QuestionDB] Failed to retrieve question")
+            raise QuestionReadError(f"Failed to retrieve question '{qid}': {e}") from e
+        if question is not None:
+            self._loaded[question_id] = question
+        return question
 
     async def update_question(
         self,
@@ -200,7 +393,16 @@ class QuestionDB:
             The updated question as QuestionData.
         """
 
-        q = await self.get_question(qid)
+        if qid is None:
+            raise QuestionValidationError("Question id cannot be None.")
+        try:
+            # Replacing the collections below needs their current contents
+            stmt = select(Question).where(Question.id == convert_uuid(qid))
+            q = (await self.session.exec(self._with_relationships(stmt))).first()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logger.exception("[QuestionDB] Failed to retrieve question")
+            raise QuestionReadError(f"Failed to retrieve question '{qid}': {e}") from e
         if not q:
             raise QuestionNotFoundError(f"Question '{qid}' was not found.")
         update_data = self._validate_update_data(update)
@@ -213,13 +415,13 @@ class QuestionDB:
             ).items():
                 setattr(q, k, v)
 
-            self.session.commit()
-            self.session.refresh(q)
+            await self.session.commit()
+            await self.session.refresh(q)
 
             return await self.get_question_data(q.id)
 
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
             logger.exception("[QuestionDB] Failed to update question")
             raise QuestionUpdateError(f"Failed to update question '{qid}': {e}") from e
 
@@ -241,12 +443,12 @@ class QuestionDB:
             logger.warning("[QuestionDB] Cannot delete question '%s'; not found.", qid)
             return False
         try:
-            self.session.delete(q)
-            self.session.commit()
-            self.session.flush()
+            await self.session.delete(q)
+            await self.session.commit()
+            await self.session.flush()
             return True
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
             logger.exception("[QuestionDB] Failed to delete question")
             raise QuestionDeleteError(f"Failed to delete question '{qid}': {e}") from e
 
@@ -259,11 +461,11 @@ class QuestionDB:
         """
         try:
             statement = delete(Question)
-            self.session.exec(statement)
-            self.session.commit()
+            await self.session.exec(statement)
+            await self.session.commit()
             return True
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
             logger.exception("[QuestionDB] Failed to delete all questions")
             raise QuestionDeleteError(f"Failed to delete all questions: {e}") from e
 
@@ -282,22 +484,26 @@ class QuestionDB:
         status = filter.status
 
         if title:
-            filters.append(func.lower(Question.title).like(f"%{title.lower()}%"))
+            # Index-backed full text/trigram match on PostgreSQL, best match first
+            dialect = self.session.get_bind().dialect.name
+            filters.append(title_search(Question.title, title, dialect))
+            stmt = stmt.order_by(
+                title_rank(Question.title, title, dialect).desc(),
+                Question.updated_at.desc().nullslast(),
+            )
         if status:
             filters.append(Question.status == Status(status))
         if additional_filters:
             filters.extend(additional_filters)
 
         try:
-            statement = stmt.where(*filters)
+            statement = self._with_relationships(stmt.where(*filters))
             logger.debug("The stmt %s", statement)
-            questions = self.session.exec(statement).all()
-            return await asyncio.gather(
-                *[self.get_question_data(q.id) for q in questions]
-            )
+            questions = (await self.session.exec(statement)).all()
+            return [self._to_read(q) for q in questions]
 
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
             logger.exception("[QuestionDB] Failed to filter all questions")
             raise ValueError(f"Failed to filter  questions: {e}") from e
 
@@ -326,12 +532,12 @@ class QuestionDB:
         try:
             question.storage_path = PurePosixPath(path).as_posix().rstrip("/") + "/"
             self.session.add(question)
-            self.session.commit()
-            self.session.refresh(question)
+            await self.session.commit()
+            await self.session.refresh(question)
             return question
 
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
             logger.exception("[QuestionDB] Failed to update question path")
             raise QuestionPathError(
                 f"Failed to update question path for '{id}': {e}"
@@ -344,23 +550,76 @@ class QuestionDB:
         """
         Attach topic and question-type relationships to a question.
         """
+        # Look everything up before assigning, so no query autoflushes a
+        # half-attached question
+        topics = None
         if data.topics is not None:
-            question.topics = await gdb.get_or_create_many(
+            topics = await gdb.get_or_create_many(
                 self.session,
                 Topic,
                 data.topics,
             )
 
+        qtypes = None
         if data.qType is not None:
-            qtypes = []
-            for qtype in data.qType:
-                existing = self._qtype.get_qtype_by_name(qtype)
-                qtypes.append(existing)
-
+            found = await self._resolve_qtypes(data.qType)
+            qtypes = [
+                found[q if isinstance(q, QType) else QType(q.lower())]
+                for q in dict.fromkeys(data.qType)
+            ]
+
+        if topics is not None:
+            question.topics = topics
+        if qtypes is not None:
             question.qType = qtypes
 
         return question
 
+    async def _resolve_qtypes(
+        self, qtypes: Sequence[QType | str]
+    ) -> dict[QType, QuestionType]:
+        """Look up question types from the lookup cache; all must be seeded."""
+        found = await self._qtype.get_qtypes_by_name(qtypes)
+        unknown = {q if isinstance(q, QType) else QType(q.lower()) for q in qtypes}
+        if unknown := unknown - found.keys():
+            raise QuestionValidationError(
+                f"Unknown question types: {', '.join(sorted(unknown))}"
+            )
+        return found
+
+    @staticmethod
+    def _with_relationships(
+        stmt: SelectOfScalar[Question],
+    ) -> SelectOfScalar[Question]:
+        """Eager-load topics and question types with one extra query each."""
+        return stmt.options(
+            selectinload(Question.topics),  # type: ignore[arg-type]
+            selectinload(Question.qType),  # type: ignore[arg-type]
+        )
+
+    def _cached(self, qid: UUID, loaded: Sequence[str] = ()) -> Question | None:
+        """A previously loaded question that is still current in the session."""
+        question = self._loaded.get(qid)
+        if question is None:
+            return None
+        state = inspect(question)
+        # Deleted, expired (after a rollback) or missing relationships all
+        # need a fresh query
+        if not state.persistent or state.expired_attributes:
+            del self._loaded[qid]
+            return None
+        if state.unloaded & set(loaded):
+            return None
+        return question
+
+    def _to_read(self, q: Question) -> QuestionRead:
+        """Build QuestionRead from a question whose relationships are loaded."""
+        return QuestionRead(
+            **q.model_dump(exclude=set(self.metadata_rel)),
+            topics=[topic.name for topic in q.topics],
+            qType=[qtype.name for qtype in q.qType],
+        )
+
     async def get_question_relationship_data(self, q: Question) -> dict[str, Any]:
         """
         Read relationship names from a stored question.
@@ -372,6 +631,7 @@ class QuestionDB:
             A mapping containing topic, language, and question-type name lists.
         """
         # Get the topics,languages and qtypes
+        await self.session.refresh(q, attribute_names=self.metadata_rel)
         topics = await gdb.get_relationship_data(q, "topics", mode="list")
         qtypes = await gdb.get_relationship_data(q, "qType", mode="list")
         return {"topics": topics, "qType": qtypes}
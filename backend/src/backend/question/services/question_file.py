@@ -0,0 +1,183 @@
+import hashlib
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.core import logger
+from backend.question.exceptions import QuestionReadError, QuestionUpdateError
+from backend.question.models import QuestionFile
+from backend.shared import ID
+from backend.utils import as_utc, convert_uuid
+
+
+class QuestionFileDB:
+    """Database access layer for the per-question file manifest.
+
+    Each row records a file's size and SHA-256 digest together with the UTC
+    time it last changed, so clients can fetch only the files that changed
+    since their previous sync.
+
+    Timestamps are taken before the transaction commits, so a slow writer can
+    commit an entry older than one a client has already seen. Incremental
+    reads therefore re-send entries from ``SYNC_OVERLAP`` before the cursor;
+    entries are full file states, so applying one twice is harmless.
+    """
+
+    # Longest a manifest write may take between timestamp and commit
+    SYNC_OVERLAP = timedelta(seconds=30)
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def record_files(
+        self, question_id: ID, files: Sequence[tuple[str, bytes]]
+    ) -> list[QuestionFile]:
+        """Upsert manifest entries for files written to a question.
+
+        Entries whose digest is unchanged keep their previous ``updated_at``.
+
+        Args:
+            question_id: Question the files belong to.
+            files: (filename, stored bytes) pairs.
+
+        Returns:
+            The manifest rows for ``files``.
+        """
+        qid = convert_uuid(question_id)
+        try:
+            existing = await self._by_filename(qid, [name for name, _ in files])
+            now = datetime.now(UTC)
+            rows: list[QuestionFile] = []
+            for filename, content in files:
+                digest = hashlib.sha256(content).hexdigest()
+                row = existing.get(filename)
+                if row is None:
+                    row = QuestionFile(question_id=qid, filename=filename)
+                    existing[filename] = row
+                elif row.sha256 == digest and not row.deleted:
+                    rows.append(row)
+                    continue
+                row.size = len(content)
+                row.sha256 = digest
+                row.deleted = False
+                row.updated_at = now
+                self._session.add(row)
+                rows.append(row)
+            await self._session.commit()
+            return rows
+        except SQLAlchemyError as e:
+            await self._session.rollback()
+            logger.exception("[QuestionFileDB] Failed to record question files")
+            raise QuestionUpdateError(
+                f"Failed to record files for question '{question_id}': {e}"
+            ) from e
+
+    @staticmethod
+    def new_entry(question_id: UUID, filename: str, content: bytes) -> QuestionFile:
+        """Manifest row for a file written to a question without an entry yet."""
+        return QuestionFile(
+            question_id=question_id,
+            filename=filename,
+            size=len(content),
+            sha256=hashlib.sha256(content).hexdigest(),
+        )
+
+    async def mark_deleted(self, question_id: ID, filenames: Sequence[str]) -> None:
+        """Turn manifest entries into tombstones for deleted files."""
+        qid = convert_uuid(question_id)
+        try:
+            now = datetime.now(UTC)
+            for row in (await self._by_filename(qid, filenames)).values():
+                if row.deleted:
+                    continue
+                row.deleted = True
+                row.size = 0
+                row.sha256 = None
+                row.updated_at = now
+                self._session.add(row)
+            await self._session.commit()
+        except SQLAlchemyError as e:
+            await self._session.rollback()
+            logger.exception("[QuestionFileDB] Failed to mark question files deleted")
+            raise QuestionUpdateError(
+                f"Failed to mark files deleted for question '{question_id}': {e}"
+            ) from e
+
+    async def copy_manifest(self, source_id: ID, destination_id: ID) -> None:
+        """Copy the live entries of one question's manifest to another."""
+        try:
+            now = datetime.now(UTC)
+            for row in await self.list_files(source_id):
+                self._session.add(
+                    QuestionFile(
+                        question_id=convert_uuid(destination_id),
+                        filename=row.filename,
+                        size=row.size,
+                        sha256=row.sha256,
+                        updated_at=now,
+                    )
+                )
+            await self._session.commit()
+        except SQLAlchemyError as e:
+            await self._session.rollback()
+            logger.exception("[QuestionFileDB] Failed to copy question manifest")
+            raise QuestionUpdateError(
+                f"Failed to copy file manifest to question '{destination_id}': {e}"
+            ) from e
+
+    async def list_files(
+        self, question_id: ID, since: datetime | None = None
+    ) -> Sequence[QuestionFile]:
+        """Return manifest entries for a question.
+
+        Args:
+            question_id: Question identifier.
+            since: When given, only entries changed after this time, less
+                ``SYNC_OVERLAP``, are returned, including tombstones for
+                deleted files. Naive values are taken as UTC.
+
+        Returns:
+            Manifest rows ordered by ``updated_at`` then filename.
+        """
+        try:
+            stmt = select(QuestionFile).where(
+                QuestionFile.question_id == convert_uuid(question_id)
+            )
+            if since is None:
+                stmt = stmt.where(col(QuestionFile.deleted).is_(False))
+            else:
+                after = as_utc(since) - self.SYNC_OVERLAP
+                stmt = stmt.where(col(QuestionFile.updated_at) > after)
+            stmt = stmt.order_by(
+                col(QuestionFile.updated_at), col(QuestionFile.filename)
+            )
+            return list((await self._session.exec(stmt)).all())
+        except SQLAlchemyError as e:
+            await self._session.rollback()
+            logger.exception("[QuestionFileDB] Failed to list question files")
+            raise QuestionReadError(
+                f"Failed to list files for question '{question_id}': {e}"
+            ) from e
+
+    async def has_manifest(self, question_id: ID) -> bool:
+        """Whether any manifest entry, live or deleted, exists for a question."""
+        stmt = select(QuestionFile.id).where(
+            QuestionFile.question_id == convert_uuid(question_id)
+        )
+        return (await self._session.exec(stmt.limit(1))).first() is not None
+
+    async def _by_filename(
+        self, question_id: UUID, filenames: Sequence[str]
+    ) -> dict[str, QuestionFile]:
+        if not filenames:
+            return {}
+        stmt = select(QuestionFile).where(
+            QuestionFile.question_id == question_id,
+            col(QuestionFile.filename).in_(list(filenames)),
+        )
+        rows = (await self._session.exec(stmt)).all()
+        return {row.filename: row for row in rows}
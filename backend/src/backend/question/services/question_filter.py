@@ -1,8 +1,8 @@
-import asyncio
 from collections.abc import Sequence
 
 from sqlalchemy import or_
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from src.data import generic as gdb
 from src.model.question import (
     Question,
@@ -27,9 +27,11 @@ async def get_question_relationship_data(question: Question) -> dict[str, list[s
     return {"topics": topics, "qtypes": qtypes}  # type: ignore
 
 
-async def get_question_data(session: Session, qid) -> QuestionData:
+async def get_question_data(session: AsyncSession, qid) -> QuestionData:
     question_id = convert_uuid(qid)
-    question = session.exec(select(Question).where(Question.id == question_id)).first()
+    question = (
+        await session.exec(select(Question).where(Question.id == question_id))
+    ).first()
     if not question:
         raise ValueError("Failed to retrieve question, question does not exist in DB")
 
@@ -39,7 +41,7 @@ async def get_question_data(session: Session, qid) -> QuestionData:
 
 
 async def filter_questions(
-    session: Session,
+    session: AsyncSession,
     data: QuestionData,
 ) -> Sequence[QuestionData]:
     filters = []
@@ -71,7 +73,6 @@ async def filter_questions(
         stmt = stmt.where(*filters)
 
     stmt = stmt.distinct()
-    results = session.exec(stmt).all()
-    return await asyncio.gather(
-        *[get_question_data(session, result.id) for result in results]
-    )
+    results = (await session.exec(stmt)).all()
+    # A session cannot run concurrent queries, so expand the rows one by one
+    return [await get_question_data(session, result.id) for result in results]
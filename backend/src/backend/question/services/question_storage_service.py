@@ -1,13 +1,20 @@
-import base64
 import mimetypes
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from pathlib import Path, PurePosixPath
 from typing import Any
 
 from google.cloud.storage.blob import Blob
 
 from backend.core import logger
-from backend.storage import FileData, Storage
+from backend.storage import (
+    BinaryFileData,
+    FileData,
+    LazyFileData,
+    Storage,
+    prefetch,
+    run_blocking,
+    stream_zip,
+)
 
 
 class InvalidQuestionFile(Exception):
@@ -36,7 +43,9 @@ class QuestionStorageService:
 
     # Core Operations
 
-    def read_file(self, dir_path: str, *, filename: str | None = None) -> bytes | None:
+    async def read_file(
+        self, dir_path: str, *, filename: str | None = None
+    ) -> bytes | None:
         """Read a file from storage.
 
         Args:
@@ -47,11 +56,31 @@ class QuestionStorageService:
         Returns:
             bytes | None: File content as bytes, or None if file doesn't exist
         """
-        file = self._construct_file_path(dir_path, filename=filename)
+        file = self.construct_file_path(dir_path, filename=filename)
         logger.debug("Reading question file %s", file)
-        return self.storage.read(file)
+        return await self.storage.aread(file)
+
+    async def local_path(
+        self, dir_path: str, *, filename: str | None = None
+    ) -> Path | None:
+        """Resolve a file to a local filesystem path when the backend has one.
+
+        Args:
+            dir_path (str): Directory path where the file is located
+            filename (str | None): Optional filename. If None, treats dir_path as
+            full file path.
+
+        Returns:
+            Path | None: Path that can be served directly, or None
+        """
+        return await run_blocking(
+            self.storage.local_path,
+            self.construct_file_path(dir_path, filename=filename),
+        )
 
-    def write_file(self, dir_path: str, data: Any, *, filename: str | None = None):
+    async def write_file(
+        self, dir_path: str, data: Any, *, filename: str | None = None
+    ):
         """Write data to storage.
 
         Args:
@@ -63,12 +92,16 @@ class QuestionStorageService:
         Returns:
             str: Path where file was written
         """
-        file = self._construct_file_path(dir_path, filename=filename)
-        written_path = self.storage.write(file, data)
+        file = self.construct_file_path(dir_path, filename=filename)
+        written_path = await self.storage.awrite(file, data)
         logger.info("Wrote question file %s", written_path)
         return written_path
 
-    def delete_file(self, dir_path: str, *, filename: str | None = None) -> None:
+    def encode_content(self, data: Any) -> bytes:
+        """Return the exact bytes ``write_file`` stores for ``data``."""
+        return self.storage._normalize_content(data)
+
+    async def delete_file(self, dir_path: str, *, filename: str | None = None) -> None:
         """Delete a file from storage.
 
         Args:
@@ -76,20 +109,22 @@ class QuestionStorageService:
             filename (str | None): Optional filename. If provided, deletes dir_path/filename.
             If None, treats dir_path as full file path.
         """
-        file = self._construct_file_path(dir_path, filename=filename)
+        file = self.construct_file_path(dir_path, filename=filename)
         logger.info("Deleting question file %s", file)
-        self.storage.delete(file)
+        await self.storage.adelete(file)
 
-    def delete_dir(self, dir_path: str) -> None:
+    async def delete_dir(self, dir_path: str) -> None:
         """Delete an entire directory and its contents from storage.
 
         Args:
             dir_path (str): Directory path to delete
         """
         logger.info("Deleting question storage directory %s", dir_path)
-        self.storage.delete(dir_path)
+        await self.storage.adelete(dir_path)
 
-    def list_files(self, dir_path: str, *, recursive: bool = False) -> Sequence[str]:
+    async def list_files(
+        self, dir_path: str, *, recursive: bool = False
+    ) -> Sequence[str]:
         """List all files in a directory.
 
         Args:
@@ -100,40 +135,107 @@ class QuestionStorageService:
         """
         normalized_path = self._norm_path(dir_path)
         files = [
-            str(p) for p in self.storage.list(normalized_path, recursive=recursive)
+            str(p)
+            for p in await self.storage.alist(normalized_path, recursive=recursive)
         ]
         logger.debug("Listed %s question files under %s", len(files), normalized_path)
         return files
 
-    def batch_save_files(self, dir_path: str, files: list[FileData]) -> list[str]:
+    async def batch_save_files(self, dir_path: str, files: list[FileData]) -> list[str]:
         """Save multiple files to storage in batch.
 
+        Files are written concurrently through the backend's batch API.
+
         Args:
             dir_path (str): Directory path where files will be saved
             files (List[FileData]): List of FileData objects to save
 
         Returns:
             List[str]: List of paths where files were saved
+
+        Raises:
+            StorageBatchError: If any file fails to save. Files that were
+            written are left in place for the caller to roll back.
         """
-        targets = []
         logger.debug("Batch saving %s question files under %s", len(files), dir_path)
-        for f in files:
-            self.write_file(dir_path, data=f.content, filename=f.filename)
-            targets.append(self._construct_file_path(dir_path, filename=f.filename))
+        targets = [
+            self.construct_file_path(dir_path, filename=f.filename) for f in files
+        ]
+        await self.write_files(
+            [(t, f.content) for t, f in zip(targets, files, strict=True)]
+        )
         return targets
 
-    def move(
+    async def write_files(self, items: Sequence[tuple[str, Any]]) -> list[str]:
+        """Write several full file paths concurrently.
+
+        Args:
+            items (Sequence[tuple[str, Any]]): (file path, content) pairs
+
+        Returns:
+            List[str]: Paths where files were written
+        """
+        written = await self.storage.awrite_many(items)
+        logger.info("Wrote %s question files", len(written))
+        return written
+
+    async def read_files(self, paths: Sequence[str]) -> dict[str, bytes | None]:
+        """Read several full file paths concurrently.
+
+        Args:
+            paths (Sequence[str]): Full file paths to read
+
+        Returns:
+            dict[str, bytes | None]: Content keyed by file path
+        """
+        logger.debug("Batch reading %s question files", len(paths))
+        return await self.storage.aread_many(paths)
+
+    async def delete_files(self, paths: Sequence[str]) -> None:
+        """Delete several full file paths concurrently.
+
+        Missing files are ignored.
+
+        Args:
+            paths (Sequence[str]): Full file paths to delete
+        """
+        logger.info("Batch deleting %s question files", len(paths))
+        await self.storage.adelete_many(paths)
+
+    async def copy_dir(self, source: str, destination: str) -> str:
+        """Copy every file under one directory to another.
+
+        Backends copy server-side where possible; with the content-addressed
+        layout only the manifests are duplicated.
+
+        Args:
+            source (str): Directory path to copy from
+            destination (str): Directory path to copy to
+
+        Returns:
+            str: Destination path
+        """
+        if not await self.storage.aexists(self._norm_path(source)):
+            logger.debug("Nothing to copy from empty folder %s", source)
+            return destination
+        copied = await self.storage.acopy(source, destination)
+        logger.info("Copied question storage from %s to %s", source, destination)
+        return copied
+
+    async def move(
         self,
         target: str,
         old: str,
     ) -> str:
 
-        new = self.storage.create_dir(target)
-        self.storage.move(old, new)
+        new = await self.storage.acreate_dir(target)
+        await self.storage.amove(old, new)
         logger.info("Moved question storage from %s to %s", old, target)
         return new
 
-    def get_filedata(self, target: str, *, filename: str | None = None) -> FileData:
+    async def get_filedata(
+        self, target: str, *, filename: str | None = None
+    ) -> BinaryFileData:
         """Read a stored file and return it as FileData.
 
         Args:
@@ -141,42 +243,82 @@ class QuestionStorageService:
             filename (str | None): Optional filename to append to target.
 
         Returns:
-            FileData: File metadata and content. Image bytes are base64 encoded;
-            other bytes are decoded as UTF-8 with replacement for invalid bytes.
+            BinaryFileData: File metadata and raw content. Call ``encoded`` for
+            the JSON form with base64 images.
         """
-        fpath = self._construct_file_path(target, filename=filename)
-        mime_type, _ = mimetypes.guess_type(fpath)
-        content = self.read_file(fpath)
-        is_image = bool(mime_type and mime_type.startswith("image/"))
-        if isinstance(content, bytes):
-            encoded = (
-                base64.b64encode(content).decode("utf-8")
-                if is_image
-                else content.decode("utf-8", errors="replace")
-            )
-        else:
-            encoded = content
-        return FileData(
-            filename=PurePosixPath(fpath).name,
-            content=encoded,
-            mime_type=mime_type or "application/octet-stream",
-        )
+        fpath = self.construct_file_path(target, filename=filename)
+        return self._to_filedata(fpath, await self.read_file(fpath))
 
-    def get_all_filedata(self, dir_path: str) -> list[FileData]:
+    async def get_all_filedata(self, dir_path: str) -> list[BinaryFileData]:
         """Return FileData for every file directly listed in a directory.
 
+        Files are read concurrently through the backend's batch API.
+
         Args:
             dir_path (str): Directory path to list and read from storage.
 
         Returns:
-            List[FileData]: FileData objects for each listed file.
+            List[BinaryFileData]: Raw FileData objects for each listed file.
+        """
+        handles = await self.list_filedata(dir_path)
+        await prefetch(handles)
+        return [await handle.load() for handle in handles]
+
+    async def list_filedata(self, dir_path: str) -> list[LazyFileData]:
+        """Return lazy handles for every file directly listed in a directory.
+
+        Only the listing is fetched; content is read when a handle is loaded.
+
+        Args:
+            dir_path (str): Directory path to list from storage.
+
+        Returns:
+            List[LazyFileData]: Handles carrying name, size and mime type.
+        """
+        normalized_path = self._norm_path(dir_path)
+        entries = await run_blocking(self.storage.list_entries, normalized_path)
+        return [LazyFileData.from_entry(self.storage, entry) for entry in entries]
+
+    async def archive_entries(
+        self, dir_path: str, folder: str
+    ) -> list[tuple[str, str]]:
+        """Map every file directly listed in a directory to an archive name.
+
+        Args:
+            dir_path (str): Directory path to list from storage.
+            folder (str): Folder name the files are placed under in the archive.
+
+        Returns:
+            List[tuple[str, str]]: (archive name, file path) pairs.
+        """
+        return [
+            (f"{folder}/{PurePosixPath(path).name}", path)
+            for path in await self.list_files(dir_path)
+        ]
+
+    def stream_zip(self, entries: Sequence[tuple[str, str]]) -> AsyncIterator[bytes]:
+        """Stream a ZIP archive of stored files without buffering it.
+
+        Args:
+            entries (Sequence[tuple[str, str]]): (archive name, file path) pairs
+
+        Returns:
+            AsyncIterator[bytes]: Chunks of the ZIP archive
         """
-        return [self.get_filedata(f) for f in self.list_files(dir_path)]
+        logger.debug("Streaming zip of %s question files", len(entries))
+        return stream_zip(self.storage, entries)
 
     # Private methods
-    def _construct_file_path(
-        self, dir_path: str, *, filename: str | None = None
-    ) -> str:
+    def _to_filedata(self, fpath: str, content: bytes | None) -> BinaryFileData:
+        """Wrap raw stored content as BinaryFileData without encoding it."""
+        mime_type, _ = mimetypes.guess_type(fpath)
+        return BinaryFileData(
+            filename=PurePosixPath(fpath).name,
+            content=content or b"",
+            mime_type=mime_type or "application/octet-stream",
+        )
+
+    def construct_file_path(self, dir_path: str, *, filename: str | None = None) -> str:
         """Construct full file path from directory and optional filename.
 
         Args:
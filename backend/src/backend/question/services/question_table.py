@@ -1,5 +1,6 @@
 from sqlalchemy import func
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.auth.model import User
 from backend.auth.services.institution import Institution
@@ -9,7 +10,7 @@ from backend.question.schema import QuestionTableRow
 
 
 class QuestionQueryService:
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
     async def get_table(self) -> list[QuestionTableRow]:
@@ -28,7 +29,7 @@ class QuestionQueryService:
             .join(User, User.id == DeveloperProfile.user_id)
             .join(Institution, Institution.id == User.institution_id)
         )
-        results = self.session.exec(stmt).all()
+        results = (await self.session.exec(stmt)).all()
 
         return self._parse_results(results)
 
@@ -52,7 +53,7 @@ class QuestionQueryService:
             .join(User, User.id == DeveloperProfile.user_id)
             .join(Institution, Institution.id == User.institution_id)
         ).where(func.lower(Question.title).like(f"%{title.lower()}%"))
-        results = self.session.exec(stmt).all()
+        results = (await self.session.exec(stmt)).all()
         return self._parse_results(results)
 
     def _parse_results(self, results) -> list[QuestionTableRow]:
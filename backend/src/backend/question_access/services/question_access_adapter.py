@@ -1,7 +1,8 @@
 from datetime import datetime
 
 from sqlalchemy.exc import SQLAlchemyError
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.access_policy import (
     AccessLevel,
@@ -20,14 +21,14 @@ from backend.utils import convert_uuid
 class QuestionAccessAdapter(ResourceAccessAdapter[QuestionAccess, ProfileT, Question]):
     def __init__(
         self,
-        session: Session,
+        session: AsyncSession,
     ) -> None:
         super().__init__("Question")
         self._session = session
 
     async def get_resource(self, resource_id: ID) -> Question | None:
         try:
-            return self._session.get(Question, convert_uuid(resource_id))
+            return await self._session.get(Question, convert_uuid(resource_id))
         except SQLAlchemyError as e:
             raise self._operation_error(
                 "retrieve resource",
@@ -45,7 +46,7 @@ class QuestionAccessAdapter(ResourceAccessAdapter[QuestionAccess, ProfileT, Ques
                 QuestionAccess.question_id == resource.id,
                 QuestionAccess.developer_id == profile.id,
             )
-            return self._session.exec(stmt).first()
+            return (await self._session.exec(stmt)).first()
         except SQLAlchemyError as e:
             raise self._operation_error(
                 "retrieve access",
@@ -66,11 +67,11 @@ class QuestionAccessAdapter(ResourceAccessAdapter[QuestionAccess, ProfileT, Ques
                 access_level=level,
             )
             self._session.add(qaccess)
-            self._session.commit()
-            self._session.refresh(qaccess)
+            await self._session.commit()
+            await self._session.refresh(qaccess)
             return qaccess
         except SQLAlchemyError as e:
-            self._session.rollback()
+            await self._session.rollback()
             raise self._operation_error(
                 "create access",
                 resource_id=self._resource_id(resource),
@@ -85,11 +86,11 @@ class QuestionAccessAdapter(ResourceAccessAdapter[QuestionAccess, ProfileT, Ques
             access.access_level = level
             access.updated_at = datetime.now()
             self._session.add(access)
-            self._session.commit()
-            self._session.refresh(access)
+            await self._session.commit()
+            await self._session.refresh(access)
             return access
         except SQLAlchemyError as e:
-            self._session.rollback()
+            await self._session.rollback()
             raise self._operation_error(
                 "update access",
                 resource_id=str(access.question_id),
@@ -110,13 +111,13 @@ class QuestionAccessAdapter(ResourceAccessAdapter[QuestionAccess, ProfileT, Ques
                     profile_id=str(target.id),
                 )
 
-            self._session.delete(existing)
-            self._session.commit()
+            await self._session.delete(existing)
+            await self._session.commit()
 
         except ResourceAccessValidationError:
             raise
         except SQLAlchemyError as e:
-            self._session.rollback()
+            await self._session.rollback()
             raise self._operation_error(
                 "remove access",
                 resource_id=self._resource_id(resource),
@@ -3,7 +3,8 @@ from typing import Any
 
 from sqlalchemy import desc
 from sqlalchemy.exc import SQLAlchemyError
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.core import logger
 from backend.question_attempt.model import QuestionAttempt
@@ -12,7 +13,7 @@ from backend.utils import convert_uuid
 
 
 class QuestionAttemptDB:
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
     async def create_attempt(
@@ -32,8 +33,8 @@ class QuestionAttemptDB:
 
         try:
             self.session.add(attempt)
-            self.session.commit()
-            self.session.refresh(attempt)
+            await self.session.commit()
+            await self.session.refresh(attempt)
 
             logger.debug(
                 "[DB] Created question attempt | question_id=%s user_id=%s attempt_id=%s",
@@ -45,7 +46,7 @@ class QuestionAttemptDB:
             return attempt
 
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
 
             logger.exception(
                 "[DB] Failed to create question attempt | question_id=%s user_id=%s",
@@ -60,7 +61,7 @@ class QuestionAttemptDB:
             stmt = select(QuestionAttempt).where(
                 QuestionAttempt.user_id == convert_uuid(user_id)
             )
-            results = self.session.exec(stmt).all()
+            results = (await self.session.exec(stmt)).all()
 
             logger.debug(
                 "[DB] Retrieved %d attempts for user | user_id=%s",
@@ -71,7 +72,7 @@ class QuestionAttemptDB:
             return results
 
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
 
             logger.exception(
                 "[DB] Failed to retrieve attempts for user | user_id=%s",
@@ -87,7 +88,7 @@ class QuestionAttemptDB:
             stmt = select(QuestionAttempt).where(
                 QuestionAttempt.question_id == convert_uuid(question_id)
             )
-            results = self.session.exec(stmt).all()
+            results = (await self.session.exec(stmt)).all()
 
             logger.debug(
                 "[DB] Retrieved %d attempts for question | question_id=%s",
@@ -98,7 +99,7 @@ class QuestionAttemptDB:
             return results
 
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
 
             logger.exception(
                 "[DB] Failed to retrieve attempts for question | question_id=%s",
@@ -115,7 +116,7 @@ class QuestionAttemptDB:
                 QuestionAttempt.question_id == convert_uuid(question_id)
                 and QuestionAttempt.user_id == convert_uuid(user_id)
             )
-            results = self.session.exec(stmt).all()
+            results = (await self.session.exec(stmt)).all()
             logger.debug(
                 "[DB] Retrieved %d attempts for question | question_id=%s",
                 len(results),
@@ -123,7 +124,7 @@ class QuestionAttemptDB:
             )
             return results
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
 
             logger.exception(
                 "[DB] Failed to retrieve attempts for question | question_id=%s",
@@ -145,7 +146,7 @@ class QuestionAttemptDB:
                 .order_by(desc(QuestionAttempt.attemption_time))  # type: ignore
             )
 
-            attempt = self.session.exec(stmt).first()
+            attempt = (await self.session.exec(stmt)).first()
 
             logger.debug(
                 "[DB] Retrieved latest attempt | question_id=%s user_id=%s found=%s",
@@ -157,7 +158,7 @@ class QuestionAttemptDB:
             return attempt
 
         except SQLAlchemyError as e:
-            self.session.rollback()
+            await self.session.rollback()
 
             logger.exception(
                 "[DB] Failed to retrieve latest attempt | question_id=%s user_id=%s",
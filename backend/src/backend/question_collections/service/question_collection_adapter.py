@@ -1,7 +1,8 @@
 from datetime import datetime
 
 from sqlalchemy.exc import SQLAlchemyError
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.access_policy import (
     AccessLevel,
@@ -23,13 +24,15 @@ class QuestionCollectionAdapter(
         QuestionCollectionAccess, DeveloperProfile, QuestionCollection
     ]
 ):
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: AsyncSession) -> None:
         super().__init__("Collection")
         self._session = session
 
     async def get_resource(self, resource_id: ID) -> QuestionCollection | None:
         try:
-            return self._session.get(QuestionCollection, convert_uuid(resource_id))
+            return await self._session.get(
+                QuestionCollection, convert_uuid(resource_id)
+            )
         except SQLAlchemyError as e:
             raise self._operation_error(
                 "retrieve resource",
@@ -49,7 +52,7 @@ class QuestionCollectionAdapter(
                 QuestionCollectionAccess.collection_id == resource.id,
                 QuestionCollectionAccess.developer_id == profile.id,
             )
-            return self._session.exec(stmt).first()
+            return (await self._session.exec(stmt)).first()
         except SQLAlchemyError as e:
             raise self._operation_error(
                 "retrieve access",
@@ -73,11 +76,11 @@ class QuestionCollectionAdapter(
                 access_level=level,
             )
             self._session.add(access)
-            self._session.commit()
-            self._session.refresh(access)
+            await self._session.commit()
+            await self._session.refresh(access)
             return access
         except SQLAlchemyError as e:
-            self._session.rollback()
+            await self._session.rollback()
             raise self._operation_error(
                 "create access",
                 resource_id=self._resource_id(resource),
@@ -94,11 +97,11 @@ class QuestionCollectionAdapter(
             access.access_level = level
             access.updated_at = datetime.now()
             self._session.add(access)
-            self._session.commit()
-            self._session.refresh(access)
+            await self._session.commit()
+            await self._session.refresh(access)
             return access
         except SQLAlchemyError as e:
-            self._session.rollback()
+            await self._session.rollback()
             raise self._operation_error(
                 "update access",
                 resource_id=str(access.collection_id),
@@ -123,12 +126,12 @@ class QuestionCollectionAdapter(
                     profile_id=str(target.id),
                 )
 
-            self._session.delete(existing)
-            self._session.commit()
+            await self._session.delete(existing)
+            await self._session.commit()
         except ResourceAccessValidationError:
             raise
         except SQLAlchemyError as e:
-            self._session.rollback()
+            await self._session.rollback()
             raise self._operation_error(
                 "remove access",
                 resource_id=self._resource_id(resource),
@@ -4,7 +4,8 @@ from typing import Generic
 from uuid import UUID
 
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.access_policy import ProfileT
 from backend.question import Question
@@ -24,7 +25,7 @@ from backend.utils import convert_uuid
 
 
 class QuestionCollectionService(Generic[ProfileT]):
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
     async def create_collection(
@@ -44,11 +45,11 @@ class QuestionCollectionService(Generic[ProfileT]):
                 parent_id=parent.id if parent else None,
             )
             self._session.add(collection)
-            self._session.commit()
-            self._session.refresh(collection)
+            await self._session.commit()
+            await self._session.refresh(collection)
             return collection
         except SQLAlchemyError as e:
-            self._session.rollback()
+            await self._session.rollback()
             raise QuestionCollectionOperationError("create", str(e)) from e
 
     async def delete_collection(
@@ -56,16 +57,16 @@ class QuestionCollectionService(Generic[ProfileT]):
         owner: ProfileT,
         collection_id: ID,
     ) -> bool:
-        collection = self.get_collection_by_owner(owner, collection_id)
+        collection = await self.get_collection_by_owner(owner, collection_id)
         if collection is None:
             raise QuestionCollectionNotFoundError(str(collection_id))
 
         try:
-            self._session.delete(collection)
-            self._session.commit()
+            await self._session.delete(collection)
+            await self._session.commit()
             return True
         except SQLAlchemyError as e:
-            self._session.rollback()
+            await self._session.rollback()
             raise QuestionCollectionOperationError("delete", str(e)) from e
 
     async def search_collections(
@@ -103,7 +104,7 @@ class QuestionCollectionService(Generic[ProfileT]):
             if limit is not None:
                 stmt = stmt.limit(limit)
 
-            return self._session.exec(stmt).all()
+            return (await self._session.exec(stmt)).all()
 
         except SQLAlchemyError as e:
             raise QuestionCollectionOperationError("retrieve", str(e)) from e
@@ -116,7 +117,7 @@ class QuestionCollectionService(Generic[ProfileT]):
         parent: QuestionCollection | None = None,
     ) -> QuestionCollection:
         owner_id = self._require_profile_id(owner)
-        collection = self.get_collection_by_owner(owner, collection_id)
+        collection = await self.get_collection_by_owner(owner, collection_id)
         if collection is None:
             raise QuestionCollectionNotFoundError(str(collection_id))
 
@@ -135,17 +136,17 @@ class QuestionCollectionService(Generic[ProfileT]):
             collection.updated_at = datetime.now(UTC)
 
             self._session.add(collection)
-            self._session.commit()
-            self._session.refresh(collection)
+            await self._session.commit()
+            await self._session.refresh(collection)
             return collection
         except SQLAlchemyError as e:
-            self._session.rollback()
+            await self._session.rollback()
             raise QuestionCollectionOperationError("update", str(e)) from e
 
-    def get_collection(self, collection_id: ID) -> QuestionCollection | None:
-        return self._session.get(QuestionCollection, convert_uuid(collection_id))
+    async def get_collection(self, collection_id: ID) -> QuestionCollection | None:
+        return await self._session.get(QuestionCollection, convert_uuid(collection_id))
 
-    def get_collection_by_owner(
+    async def get_collection_by_owner(
         self,
         owner: ProfileT,
         collection_id: ID,
@@ -157,11 +158,11 @@ class QuestionCollectionService(Generic[ProfileT]):
                 QuestionCollection.id == convert_uuid(collection_id),
                 QuestionCollection.owner_id == owner_id,
             )
-            return self._session.exec(stmt).first()
+            return (await self._session.exec(stmt)).first()
         except SQLAlchemyError as e:
             raise QuestionCollectionOperationError("retrieve", str(e)) from e
 
-    def list_collections_by_owner(
+    async def list_collections_by_owner(
         self,
         owner: ProfileT,
         offset: int | None = None,
@@ -178,7 +179,7 @@ class QuestionCollectionService(Generic[ProfileT]):
                 .offset(offset)
                 .limit(limit)
             )
-            return self._session.exec(stmt).all()
+            return (await self._session.exec(stmt)).all()
         except SQLAlchemyError as e:
             raise QuestionCollectionOperationError("retrieve", str(e)) from e
 
@@ -187,7 +188,7 @@ class QuestionCollectionService(Generic[ProfileT]):
         collection_id: ID,
         question_id: ID,
     ) -> QuestionCollectionLink:
-        collection = self.get_collection(collection_id)
+        collection = await self.get_collection(collection_id)
         if collection is None or collection.id is None:
             raise QuestionCollectionNotFoundError(str(collection_id))
 
@@ -197,18 +198,18 @@ class QuestionCollectionService(Generic[ProfileT]):
                 collection_id=convert_uuid(collection_id),
             )
             self._session.add(link)
-            self._session.commit()
-            self._session.refresh(link)
+            await self._session.commit()
+            await self._session.refresh(link)
             return link
         except IntegrityError as e:
-            self._session.rollback()
+            await self._session.rollback()
             raise QuestionAlreadyInCollectionError() from e
         except SQLAlchemyError as e:
-            self._session.rollback()
+            await self._session.rollback()
             raise QuestionCollectionOperationError("add question to", str(e)) from e
 
     async def get_all_questions(self, collection_id: ID) -> Sequence[Question]:
-        collection = self.get_collection(collection_id)
+        collection = await self.get_collection(collection_id)
         if collection is None or collection.id is None:
             raise QuestionCollectionNotFoundError(str(collection_id))
 
@@ -221,7 +222,7 @@ class QuestionCollectionService(Generic[ProfileT]):
                 )
                 .where(QuestionCollectionLink.collection_id == collection.id)
             )
-            return self._session.exec(stmt).all()
+            return (await self._session.exec(stmt)).all()
         except SQLAlchemyError as e:
             raise QuestionCollectionOperationError(
                 "retrieve questions from",
@@ -234,7 +235,7 @@ class QuestionCollectionService(Generic[ProfileT]):
         question_id: ID,
     ) -> bool:
         try:
-            link = self._session.get(
+            link = await self._session.get(
                 QuestionCollectionLink,
                 (
                     convert_uuid(question_id),
@@ -246,13 +247,13 @@ class QuestionCollectionService(Generic[ProfileT]):
                     f"{collection_id}/questions/{question_id}"
                 )
 
-            self._session.delete(link)
-            self._session.commit()
+            await self._session.delete(link)
+            await self._session.commit()
             return True
         except QuestionCollectionNotFoundError:
             raise
         except SQLAlchemyError as e:
-            self._session.rollback()
+            await self._session.rollback()
             raise QuestionCollectionOperationError(
                 "remove question from",
                 str(e),
@@ -262,7 +263,7 @@ class QuestionCollectionService(Generic[ProfileT]):
         self,
         collection_id: UUID | str,
     ) -> QuestionCollectionRead | None:
-        collection = self.get_collection(collection_id)
+        collection = await self.get_collection(collection_id)
         if collection is None:
             return None
 
@@ -279,7 +280,7 @@ class QuestionCollectionService(Generic[ProfileT]):
             question_ids=question_ids,
         )
 
-    def reconstruct_path(self, collection: QuestionCollection) -> str:
+    async def reconstruct_path(self, collection: QuestionCollection) -> str:
         parts: list[str] = []
         current: QuestionCollection | None = collection
 
@@ -287,7 +288,7 @@ class QuestionCollectionService(Generic[ProfileT]):
             parts.append(current.title)
             if current.parent_id is None:
                 break
-            current = self.get_collection(current.parent_id)
+            current = await self.get_collection(current.parent_id)
 
         return "->".join(reversed(parts))
 
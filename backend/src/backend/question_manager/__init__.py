@@ -1,3 +1,4 @@
+from .services.importer import QuestionImporter
 from .services.manager import QuestionManager
 
-__all__ = ["QuestionManager"]
+__all__ = ["QuestionImporter", "QuestionManager"]
@@ -1,7 +1,37 @@
 from dataclasses import dataclass
+from typing import Any, Literal
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from backend.storage import FileData
 
 
 @dataclass
 class AccessDecision:
     allowed: bool
     reason: str
+
+
+# Bulk import
+ImportStatus = Literal["created", "invalid", "failed"]
+
+
+class QuestionImportItem(BaseModel):
+    # Validated per item so one malformed entry does not reject the batch
+    question: dict[str, Any]
+    files: list[FileData] = Field(default_factory=list)
+
+
+class QuestionImportResult(BaseModel):
+    index: int
+    status: ImportStatus
+    title: str | None = None
+    question_id: UUID | None = None
+    error: str | None = None
+
+
+class QuestionImportReport(BaseModel):
+    created: int = 0
+    failed: int = 0
+    results: list[QuestionImportResult] = Field(default_factory=list)
@@ -0,0 +1,232 @@
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from uuid import UUID, uuid4
+
+from pydantic import ValidationError
+
+from backend.core import logger
+from backend.question.schema import QuestionCreate, QuestionInternalCreate
+from backend.question.services.question_file import QuestionFileDB
+from backend.question_manager.exceptions import (
+    InvalidQuestionDataError,
+    QuestionManagerException,
+)
+from backend.question_manager.schemas import (
+    ImportStatus,
+    QuestionImportItem,
+    QuestionImportReport,
+    QuestionImportResult,
+)
+from backend.storage.exceptions import StorageBatchError
+from backend.utils import convert_uuid
+
+from .manager import QuestionManager, question_storage_path
+
+
+@dataclass
+class _StagedQuestion:
+    """A validated import item with its id, folder and encoded files."""
+
+    index: int
+    data: QuestionInternalCreate
+    storage_path: str
+    # (filename, full storage path, stored bytes) per file
+    files: list[tuple[str, str, bytes]] = field(default_factory=list)
+
+    @property
+    def id(self) -> UUID:
+        return convert_uuid(self.data.id)
+
+
+class QuestionImporter:
+    """Create a batch of questions with a fixed number of round trips.
+
+    Items are validated up front and invalid ones are reported without
+    stopping the batch. The files of every valid item are uploaded
+    concurrently in one storage batch; items whose upload fails are cleaned up
+    and reported as failed. The remaining questions are written with
+    ``QuestionDB.bulk_create_questions`` in a single transaction, so either all
+    of them are created or, if the database rejects the batch, none are and
+    their uploaded files are removed again.
+    """
+
+    # Upper bound on items per call; larger migrations are sent in chunks
+    MAX_BATCH = 1000
+
+    def __init__(self, manager: QuestionManager) -> None:
+        self._manager = manager
+
+    async def import_questions(
+        self,
+        items: Sequence[QuestionImportItem],
+        storage_base_path: str,
+        *,
+        created_by_id: UUID | None = None,
+    ) -> QuestionImportReport:
+        """Import ``items`` under ``storage_base_path`` and report each outcome.
+
+        Args:
+            items: Question payloads with their initial files.
+            storage_base_path: Base folder of the owner, as for ``create_question``.
+            created_by_id: Developer profile recorded as the creator.
+
+        Returns:
+            A report with one result per item, in input order.
+
+        Raises:
+            InvalidQuestionDataError: If the batch exceeds ``MAX_BATCH`` items.
+        """
+        if len(items) > self.MAX_BATCH:
+            raise InvalidQuestionDataError(
+                "items", f"at most {self.MAX_BATCH} questions per import"
+            )
+        results: dict[int, QuestionImportResult] = {}
+        staged: list[_StagedQuestion] = []
+        seen_ids: set[UUID] = set()
+        for index, item in enumerate(items):
+            try:
+                entry = self._stage(index, item, storage_base_path, created_by_id)
+                if entry.id in seen_ids:
+                    raise InvalidQuestionDataError("id", "duplicated in the batch")
+                seen_ids.add(entry.id)
+                staged.append(entry)
+            except (QuestionManagerException, ValidationError, ValueError) as e:
+                results[index] = self._result(index, item, "invalid", error=str(e))
+
+        existing = await self._manager.qdb.existing_ids([s.id for s in staged])
+        for entry in [s for s in staged if s.id in existing]:
+            staged.remove(entry)
+            results[entry.index] = self._result(
+                entry.index,
+                items[entry.index],
+                "invalid",
+                error=f"Question {entry.id} already exists",
+            )
+
+        uploaded, upload_errors = await self._upload(staged)
+        for entry in [s for s in staged if s.index in upload_errors]:
+            staged.remove(entry)
+            results[entry.index] = self._result(
+                entry.index,
+                items[entry.index],
+                "failed",
+                error=upload_errors[entry.index],
+            )
+
+        if staged:
+            try:
+                await self._manager.qdb.bulk_create_questions(
+                    [s.data for s in staged],
+                    files=[
+                        QuestionFileDB.new_entry(s.id, filename, data)
+                        for s in staged
+                        for filename, _, data in s.files
+                    ],
+                )
+            except Exception as e:
+                logger.exception("Bulk import of %s questions failed", len(staged))
+                await self._manager.rollback_saved_files(uploaded)
+                for s in staged:
+                    results[s.index] = self._result(
+                        s.index, items[s.index], "failed", error=str(e)
+                    )
+            else:
+                for s in staged:
+                    results[s.index] = self._result(
+                        s.index, items[s.index], "created", question_id=s.id
+                    )
+
+        ordered = [results[i] for i in range(len(items))]
+        created = sum(r.status == "created" for r in ordered)
+        logger.info("Imported %s of %s questions", created, len(items))
+        return QuestionImportReport(
+            created=created, failed=len(ordered) - created, results=ordered
+        )
+
+    def _stage(
+        self,
+        index: int,
+        item: QuestionImportItem,
+        storage_base_path: str,
+        created_by_id: UUID | None,
+    ) -> _StagedQuestion:
+        """Validate one item and work out where its files will live."""
+        question = self._manager.validate_question_data(
+            QuestionCreate.model_validate(item.question)
+        )
+        qid = convert_uuid(question.id) if question.id else uuid4()
+        storage_path = question_storage_path(storage_base_path, question.title, qid)
+        data = QuestionInternalCreate(
+            **question.model_dump(exclude={"id"}),
+            id=qid,
+            storage_path=storage_path,
+            created_by_id=created_by_id,
+        )
+
+        filenames = [f.filename for f in item.files]
+        if duplicates := {name for name in filenames if filenames.count(name) > 1}:
+            raise InvalidQuestionDataError(
+                "files", f"duplicate filenames {sorted(duplicates)}"
+            )
+        storage = self._manager.storage
+        files = [
+            (
+                f.filename,
+                storage.construct_file_path(storage_path, filename=f.filename),
+                storage.encode_content(f.content),
+            )
+            for f in item.files
+        ]
+        return _StagedQuestion(index, data, storage_path, files)
+
+    async def _upload(
+        self, staged: Sequence[_StagedQuestion]
+    ) -> tuple[list[str], dict[int, str]]:
+        """Write every staged file in one concurrent batch.
+
+        Returns:
+            The paths written for items that uploaded completely, and an error
+            message per item index that had a file fail. Files already written
+            for failed items are removed.
+        """
+        writes = [(path, data) for s in staged for _, path, data in s.files]
+        if not writes:
+            return [], {}
+        try:
+            return await self._manager.storage.write_files(writes), {}
+        except StorageBatchError as e:
+            failures, succeeded = e.failures, e.succeeded
+
+        errors: dict[int, str] = {}
+        orphaned: list[str] = []
+        uploaded: list[str] = []
+        for s in staged:
+            paths = {path for _, path, _ in s.files}
+            failed = [path for path in paths if path in failures]
+            written = [path for path in succeeded if path in paths]
+            if failed:
+                errors[s.index] = f"Failed to save {', '.join(sorted(failed))}"
+                orphaned.extend(written)
+            else:
+                uploaded.extend(written)
+        logger.warning("File upload failed for %s imported questions", len(errors))
+        await self._manager.rollback_saved_files(orphaned)
+        return uploaded, errors
+
+    @staticmethod
+    def _result(
+        index: int,
+        item: QuestionImportItem,
+        status: ImportStatus,
+        *,
+        question_id: UUID | None = None,
+        error: str | None = None,
+    ) -> QuestionImportResult:
+        title = item.question.get("title")
+        return QuestionImportResult(
+            index=index,
+            status=status,
+            title=title if isinstance(title, str) else None,
+            question_id=question_id,
+            error=error,
+        )
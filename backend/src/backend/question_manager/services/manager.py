@@ -1,10 +1,19 @@
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from pathlib import Path, PurePosixPath
 from typing import Any, Literal, overload
 
 from backend.core import logger
 from backend.question.models import Question
-from backend.question.schema import QuestionCreate, QuestionRead, QuestionUpdate
+from backend.question.schema import (
+    QuestionCreate,
+    QuestionFileEntry,
+    QuestionFileManifest,
+    QuestionRead,
+    QuestionUpdate,
+)
 from backend.question.services.question import QuestionDB
+from backend.question.services.question_file import QuestionFileDB
 from backend.question.services.question_storage_service import QuestionStorageService
 from backend.question_manager.exceptions import (
     FileListError,
@@ -21,8 +30,15 @@ from backend.question_manager.exceptions import (
     StoragePathNotFoundError,
 )
 from backend.shared import ID
-from backend.storage import FileData, Storage
-from backend.utils import safe_dir_name
+from backend.storage import FileData, LazyFileData, Storage
+from backend.storage.exceptions import StorageBatchError
+from backend.utils import as_utc, safe_dir_name
+
+
+def question_storage_path(base_path: str, title: str | None, qid: ID) -> str:
+    """Folder holding a question's files under a developer's base path."""
+    slug = safe_dir_name(title or "Untitled Question", max_length=80)
+    return f"{base_path.rstrip('/')}/questions/{slug}_{str(qid)[:8]}/"
 
 
 class QuestionManager:
@@ -32,6 +48,7 @@ class QuestionManager:
         """Create a manager backed by a storage implementation and question DB."""
         self.qdb = qdb
         self.storage = QuestionStorageService(storage)
+        self.files = QuestionFileDB(qdb.session)
         logger.debug("QuestionManager initialized with %s", storage.__class__.__name__)
 
     async def create_question(
@@ -55,22 +72,18 @@ class QuestionManager:
                 len(files or []),
             )
             # Create the base question
-            qdata = self._validate_question_data(qdata)
+            qdata = self.validate_question_data(qdata)
             question = await self.qdb.create_question(qdata)
 
-            question_slug = safe_dir_name(
-                question.title or "Untitled Question", max_length=80
-            )
-            storage_path = (
-                f"{storage_base_path.rstrip('/')}/questions/"
-                f"{question_slug}_{str(question.id)[:8]}/"
+            storage_path = question_storage_path(
+                storage_base_path, question.title, question.id
             )
             question = await self.qdb.set_question_path(question.id, path=storage_path)
 
             if not question.storage_path:
                 raise StoragePathNotFoundError(str(question.id))
             if files:
-                saved_files = self._save_files(
+                saved_files = await self._save_files(
                     question.storage_path, files, question.id
                 )
             logger.info("Created question %s", question.id)
@@ -119,8 +132,14 @@ class QuestionManager:
         return q
 
     async def copy_question(self, qid: ID, storage_base_path: str) -> Question:
+        """Create a copy of a question and copy its files inside storage.
+
+        File bytes never pass through the application; the storage backend
+        copies the whole folder in place.
+        """
         try:
             question = await self.qdb.get_question_data(qid)
+            source_path = await self.get_storage_path(qid)
             qdata = QuestionCreate(
                 topics=question.topics,
                 qType=question.qType,
@@ -128,9 +147,8 @@ class QuestionManager:
                 ai_generated=question.ai_generated,
                 isAdaptive=question.isAdaptive,
             )
-            qfiles = await self.get_question_filedata(qid)
-            return await self.create_question(
-                qdata, storage_base_path=storage_base_path, files=qfiles
+            copy = await self.create_question(
+                qdata, storage_base_path=storage_base_path
             )
         except QuestionManagerException:
             raise
@@ -139,6 +157,20 @@ class QuestionManager:
                 reason="Failed to copy question ", details=str(e)
             ) from e
 
+        try:
+            if copy.storage_path:
+                await self.storage.copy_dir(source_path, copy.storage_path)
+                await self.files.copy_manifest(qid, copy.id)
+            return copy
+        except Exception as e:
+            logger.warning("Rolling back question %s after copy failure", copy.id)
+            await self._rollback_created_question(copy, [])
+            if copy.storage_path:
+                await self._rollback_copied_dir(copy.storage_path)
+            raise QuestionCopyFailure(
+                reason="Failed to copy question files ", details=str(e)
+            ) from e
+
     async def update_question_meta(
         self, id: ID, update: QuestionUpdate
     ) -> QuestionRead:
@@ -152,43 +184,43 @@ class QuestionManager:
             raise QuestionUpdateError(question_id=str(id), reason=str(e)) from e
 
     async def delete_question(self, qid: ID) -> bool:
-        """Delete a question record and its storage directory.
+        """Delete a question record and then its storage directory.
 
-        Storage files are snapshotted first so they can be restored if the
-        storage delete succeeds but the database delete fails.
+        The database delete commits first so a failure there leaves storage
+        untouched and nothing needs restoring. Storage cleanup runs afterwards;
+        if it fails the files are orphaned under a path no row references,
+        which is logged rather than surfaced to the caller.
         """
-        storage_path = ""
-        storage_snapshot: list[tuple[str, bytes]] = []
-
         try:
             logger.debug("Deleting question %s", qid)
             storage_path = await self.get_storage_path(qid)
-            storage_snapshot = self._snapshot_storage_dir(storage_path)
-            self.storage.delete_dir(storage_path)
-            logger.info(f"Deleted dir {storage_path}")
             await self.qdb.delete_question(qid)
             logger.info("Deleted question %s", qid)
-            return True
         except QuestionManagerException:
             raise
         except Exception as e:
-            if storage_path and storage_snapshot:
-                logger.warning(
-                    "Restoring storage files for question %s after delete failure",
-                    qid,
-                )
-                self._restore_storage_files(storage_path, storage_snapshot)
             raise QuestionDeletionError(
                 question_id=str(qid),
-                reason="database or storage error",
+                reason="database error",
                 details=str(e),
             ) from e
 
+        try:
+            await self.storage.delete_dir(storage_path)
+            logger.info("Deleted dir %s", storage_path)
+        except Exception:
+            logger.exception(
+                "Question %s deleted but storage cleanup of %s failed",
+                qid,
+                storage_path,
+            )
+        return True
+
     async def get_question_files(self, qid: ID) -> Sequence[str]:
         """Return storage paths for files attached to a question."""
         try:
             storage_path = await self.get_storage_path(qid)
-            return self.storage.list_files(storage_path)
+            return await self.storage.list_files(storage_path)
         except QuestionManagerException:
             raise
         except Exception as e:
@@ -198,7 +230,17 @@ class QuestionManager:
         """Read one file from a question's storage directory."""
         try:
             storage_path = await self.get_storage_path(qid)
-            return self.storage.read_file(storage_path, filename=filename)
+            return await self.storage.read_file(storage_path, filename=filename)
+        except QuestionManagerException:
+            raise
+        except Exception as e:
+            raise FileOperationError("read", filename, str(e)) from e
+
+    async def get_local_file_path(self, qid: ID, filename: str) -> Path | None:
+        """Return a servable local path for a question file, if available."""
+        try:
+            storage_path = await self.get_storage_path(qid)
+            return await self.storage.local_path(storage_path, filename=filename)
         except QuestionManagerException:
             raise
         except Exception as e:
@@ -208,7 +250,13 @@ class QuestionManager:
         """Write or replace one file in a question's storage directory."""
         try:
             storage_path = await self.get_storage_path(qid)
-            return self.storage.write_file(storage_path, data, filename=filename)
+            written = await self.storage.write_file(
+                storage_path, data, filename=filename
+            )
+            await self.files.record_files(
+                qid, [(filename, self.storage.encode_content(data))]
+            )
+            return written
         except QuestionManagerException:
             raise
         except Exception as e:
@@ -218,7 +266,8 @@ class QuestionManager:
         """Delete one file from a question's storage directory."""
         try:
             storage_path = await self.get_storage_path(qid)
-            return self.storage.delete_file(storage_path, filename=filename)
+            await self.storage.delete_file(storage_path, filename=filename)
+            await self.files.mark_deleted(qid, [filename])
         except QuestionManagerException:
             raise
         except Exception as e:
@@ -228,12 +277,61 @@ class QuestionManager:
         """Return every question file as FileData objects."""
         try:
             storage_path = await self.get_storage_path(qid)
-            return self.storage.get_all_filedata(storage_path)
+            return await self.storage.get_all_filedata(storage_path)
         except QuestionManagerException:
             raise
         except Exception as e:
             raise FileOperationError("read", str(qid), str(e)) from e
 
+    async def get_question_file_handles(self, qid: ID) -> list[LazyFileData]:
+        """Return lazy handles for the question files without reading them."""
+        try:
+            storage_path = await self.get_storage_path(qid)
+            return await self.storage.list_filedata(storage_path)
+        except QuestionManagerException:
+            raise
+        except Exception as e:
+            raise FileListError(str(qid), str(e)) from e
+
+    async def get_file_manifest(
+        self, qid: ID, since: datetime | None = None
+    ) -> QuestionFileManifest:
+        """Return the question's file manifest, or only entries changed since a time.
+
+        Questions whose files predate the manifest are indexed from storage
+        on first request.
+        """
+        try:
+            storage_path = await self.get_storage_path(qid)
+            if not await self.files.has_manifest(qid):
+                await self._index_files(qid, storage_path)
+            rows = await self.files.list_files(qid, since)
+        except QuestionManagerException:
+            raise
+        except Exception as e:
+            raise FileListError(str(qid), str(e)) from e
+
+        entries = [QuestionFileEntry.model_validate(row) for row in rows]
+        previous = as_utc(since) if since is not None else None
+        cursor = max((e.updated_at for e in entries), default=previous)
+        return QuestionFileManifest(question_id=qid, cursor=cursor, files=entries)
+
+    async def get_archive_entries(self, qid: ID, folder: str) -> list[tuple[str, str]]:
+        """Return (archive name, storage path) pairs for a question's files."""
+        try:
+            storage_path = await self.get_storage_path(qid)
+            return await self.storage.archive_entries(storage_path, folder)
+        except QuestionManagerException:
+            raise
+        except Exception as e:
+            raise FileListError(str(qid), str(e)) from e
+
+    def stream_archive(
+        self, entries: Sequence[tuple[str, str]]
+    ) -> AsyncIterator[bytes]:
+        """Stream a ZIP archive of previously resolved archive entries."""
+        return self.storage.stream_zip(entries)
+
     async def upload_files(self, qid: ID, files: list[FileData]):
         """Save additional files to an existing question.
 
@@ -243,12 +341,12 @@ class QuestionManager:
         saved_files: list[str] = []
         try:
             storage_path = await self.get_storage_path(qid)
-            return self._save_files(storage_path, files, qid)
+            return await self._save_files(storage_path, files, qid)
         except QuestionManagerException:
-            self._rollback_saved_files(saved_files)
+            await self.rollback_saved_files(saved_files)
             raise
         except Exception as e:
-            self._rollback_saved_files(saved_files)
+            await self.rollback_saved_files(saved_files)
             raise FileOperationError("upload", str(qid), str(e)) from e
 
     async def get_storage_path(self, qid: ID) -> str:
@@ -265,7 +363,7 @@ class QuestionManager:
             )
         return question.storage_path
 
-    def _validate_question_data(self, question_data: QuestionCreate) -> QuestionCreate:
+    def validate_question_data(self, question_data: QuestionCreate) -> QuestionCreate:
         """Validate the required fields needed to create a question."""
         try:
             if not question_data.title:
@@ -276,37 +374,41 @@ class QuestionManager:
         except Exception as e:
             raise InvalidQuestionDataError("question_data", str(e)) from e
 
-    def _save_files(
+    async def _save_files(
         self, storage_path: str, files: list[FileData], question_id: ID
     ) -> list[str]:
-        """Save files one at a time and roll back partial saves on failure."""
-        saved_files: list[str] = []
-        for file in files:
-            try:
-                saved_path = self.storage.write_file(
-                    storage_path,
-                    data=file.content,
-                    filename=file.filename,
-                )
-                saved_files.append(saved_path)
-                logger.debug(
-                    "Saved file %s for question %s", file.filename, question_id
-                )
-            except Exception as e:
-                logger.warning(
-                    "Failed to save file %s for question %s",
-                    file.filename,
-                    question_id,
-                )
-                self._rollback_saved_files(saved_files)
-                raise FileSaveError(file.filename, str(question_id), str(e)) from e
+        """Save files concurrently and roll back the whole batch on failure."""
+        try:
+            saved_files = await self.storage.batch_save_files(storage_path, files)
+        except StorageBatchError as e:
+            failed = PurePosixPath(next(iter(e.failures))).name
+            logger.warning(
+                "Failed to save file %s for question %s", failed, question_id
+            )
+            await self.rollback_saved_files(e.succeeded)
+            raise FileSaveError(failed, str(question_id), str(e)) from e
+        try:
+            await self.files.record_files(
+                question_id,
+                [(f.filename, self.storage.encode_content(f.content)) for f in files],
+            )
+        except Exception:
+            await self.rollback_saved_files(saved_files)
+            raise
+        logger.debug("Saved %s files for question %s", len(saved_files), question_id)
         return saved_files
 
+    async def _index_files(self, qid: ID, storage_path: str) -> None:
+        """Build manifest entries from the files currently in storage."""
+        files = await self.storage.get_all_filedata(storage_path)
+        await self.files.record_files(qid, [(f.filename, f.content) for f in files])
+        logger.info("Indexed %s files for question %s", len(files), qid)
+
     async def _rollback_created_question(
         self, question: Question, saved_files: list[str]
     ) -> None:
         """Best-effort cleanup for a question created during a failed operation."""
-        self._rollback_saved_files(saved_files)
+        await self.rollback_saved_files(saved_files)
         if not question.id:
             return
         try:
@@ -317,32 +419,18 @@ class QuestionManager:
                 question.id,
             )
 
-    def _rollback_saved_files(self, saved_files: list[str]) -> None:
+    async def rollback_saved_files(self, saved_files: list[str]) -> None:
         """Best-effort delete for files saved during a failed operation."""
-        for saved_file in reversed(saved_files):
-            try:
-                self.storage.delete_file(saved_file)
-            except Exception:
-                logger.exception("Failed to roll back saved file %s", saved_file)
-
-    def _snapshot_storage_dir(self, storage_path: str) -> list[tuple[str, bytes]]:
-        """Read all files under a storage directory for later restoration."""
-        snapshot: list[tuple[str, bytes]] = []
-        for file_path in self.storage.list_files(storage_path, recursive=True):
-            content = self.storage.read_file(file_path)
-            if content is not None:
-                snapshot.append((file_path, content))
-        return snapshot
-
-    def _restore_storage_files(
-        self, storage_path: str, snapshot: list[tuple[str, bytes]]
-    ) -> None:
-        """Best-effort restore of files captured by a storage snapshot."""
-        for file_path, content in snapshot:
-            try:
-                self.storage.write_file(file_path, content)
-            except Exception:
-                logger.exception(
-                    "Failed to restore storage file %s after delete rollback",
-                    file_path,
-                )
+        if not saved_files:
+            return
+        try:
+            await self.storage.delete_files(saved_files)
+        except Exception:
+            logger.exception("Failed to roll back saved files %s", saved_files)
+
+    async def _rollback_copied_dir(self, storage_path: str) -> None:
+        """Best-effort delete for a folder copied during a failed operation."""
+        try:
+            await self.storage.delete_dir(storage_path)
+        except Exception:
+            logger.exception("Failed to roll back copied folder %s", storage_path)
@@ -4,7 +4,7 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
-from backend.storage import FileData
+from backend.storage import BinaryFileData, FileData
 from backend.utils import normalize_content
 
 from .exceptions import MissingQuestionFileError
@@ -49,7 +49,7 @@ class QuestionFiles(BaseModel):
 
     @classmethod
     def from_file_data(cls, question_files: list[FileData]):
-        files = {fd.filename: normalize_content(fd.content) for fd in question_files}
+        files = {fd.filename: _file_text(fd) for fd in question_files}
 
         if "question.html" not in files:
             raise MissingQuestionFileError("Question must include question.html")
@@ -60,6 +60,12 @@ class QuestionFiles(BaseModel):
         )
 
 
+def _file_text(fd: FileData) -> str:
+    if isinstance(fd, BinaryFileData):
+        return fd.to_text()
+    return normalize_content(fd.content)
+
+
 class PreparedQuestionBase(BaseModel):
     kind: Literal["static", "adaptive"]
     question_files: QuestionFiles
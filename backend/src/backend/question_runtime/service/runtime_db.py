@@ -1,7 +1,8 @@
 from collections.abc import Sequence
 
 from sqlalchemy.exc import SQLAlchemyError
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.core import logger
 from backend.question_runtime.exceptions import (
@@ -19,7 +20,7 @@ from backend.utils import convert_uuid
 class QuestionRuntimeDB:
     """Database access layer for question runtime records."""
 
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: AsyncSession) -> None:
         """Initialize the repository with a database session."""
         self._session = session
 
@@ -32,10 +33,10 @@ class QuestionRuntimeDB:
                 QuestionRunTime.question_id == convert_uuid(question_id),
                 QuestionRunTime.enabled,
             )
-            return list(self._session.exec(stmt).all())
+            return list((await self._session.exec(stmt)).all())
 
         except SQLAlchemyError as e:
-            self._session.rollback()
+            await self._session.rollback()
             logger.exception(
                 "Failed to list question runtimes for question_id=%s", question_id
             )
@@ -53,9 +54,9 @@ class QuestionRuntimeDB:
                 QuestionRunTime.language == language,
                 QuestionRunTime.enabled,
             )
-            return self._session.exec(stmt).first()
+            return (await self._session.exec(stmt)).first()
         except SQLAlchemyError as e:
-            self._session.rollback()
+            await self._session.rollback()
             logger.exception(
                 "Failed to get question runtime for question_id=%s language=%s",
                 question_id,
@@ -73,9 +74,9 @@ class QuestionRuntimeDB:
                 QuestionRunTime.is_default == True,  # noqa: E712
                 QuestionRunTime.enabled == True,  # noqa: E712
             )
-            return self._session.exec(statement).first()
+            return (await self._session.exec(statement)).first()
         except SQLAlchemyError as e:
-            self._session.rollback()
+            await self._session.rollback()
             logger.exception(
                 "Failed to get default question runtime for question_id=%s", question_id
             )
@@ -92,11 +93,11 @@ class QuestionRuntimeDB:
                 question_id=convert_uuid(question_id), **data.model_dump()
             )
             self._session.add(runtime)
-            self._session.commit()
-            self._session.refresh(runtime)
+            await self._session.commit()
+            await self._session.refresh(runtime)
             return runtime
         except SQLAlchemyError as e:
-            self._session.rollback()
+            await self._session.rollback()
             logger.exception(
                 "Failed to create question runtime for question_id=%s", question_id
             )
@@ -110,11 +111,11 @@ class QuestionRuntimeDB:
             for key, value in data.model_dump(exclude_unset=True).items():
                 setattr(runtime, key, value)
             self._session.add(runtime)
-            self._session.commit()
-            self._session.refresh(runtime)
+            await self._session.commit()
+            await self._session.refresh(runtime)
             return runtime
         except SQLAlchemyError as e:
-            self._session.rollback()
+            await self._session.rollback()
             runtime_id = getattr(runtime, "id", None)
             logger.exception("Failed to update question runtime id=%s", runtime_id)
             raise QuestionRuntimeUpdateError(
@@ -141,7 +142,7 @@ class QuestionRuntimeDB:
                 ),
             )
         except SQLAlchemyError as e:
-            self._session.rollback()
+            await self._session.rollback()
             logger.exception(
                 "Failed to upsert question runtime for question_id=%s language=%s",
                 question_id,
@@ -3,7 +3,7 @@ from backend.question_runtime.model import (
     RuntimeConfigSource,
 )
 from backend.shared import ID
-from backend.storage import FileData
+from backend.storage import BinaryFileData, FileData
 from backend.utils import normalize_content
 
 from .runtime_db import QuestionRuntimeDB
@@ -51,5 +51,8 @@ class QuestionRunTimeSyncService:
     def _convert_filedata(files: list[FileData]) -> dict[str, str]:
         data = {}
         for f in files:
-            data[f.filename] = normalize_content(f.content)
+            if isinstance(f, BinaryFileData):
+                data[f.filename] = f.to_text()
+            else:
+                data[f.filename] = normalize_content(f.content)
         return data
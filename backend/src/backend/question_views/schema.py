@@ -1,8 +1,9 @@
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, model_validator
 
 from backend.auth import ValidInstitutions
 from backend.question import QType, Status
@@ -32,6 +33,10 @@ class QuestionSearchParams(BaseModel):
     # General offset and limits
     limit: int = 50
     offset: int = 0
+    # Opaque cursor from the previous page's X-Next-Cursor; replaces offset
+    cursor: str | None = None
+    # "relevance" ranks title matches for `search`; cursors need "recent"
+    sort: Literal["recent", "relevance"] = "recent"
 
 
 class QuestionTableRow(BaseModel):
@@ -46,11 +51,34 @@ class QuestionTableRow(BaseModel):
     topics: list[str | None] | None
     question_type: list[QType | str | None] | None
     available_runtimes: list[RuntimeLanguage | str]
-    collection_id: UUID | None
-    collection_title: str | None
+    collection_ids: list[UUID] = []
+    collection_titles: list[str] = []
+    # A single collection for clients that show one; the first by title
+    # unless the search was filtered by collection
+    collection_id: UUID | None = None
+    collection_title: str | None = None
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
+    @model_validator(mode="after")
+    def default_collection(self) -> "QuestionTableRow":
+        if self.collection_id is None and self.collection_ids:
+            self.collection_id = self.collection_ids[0]
+            self.collection_title = self.collection_titles[0]
+        return self
+
+    def in_collection(self, collection_id: UUID) -> "QuestionTableRow":
+        """Return the row with ``collection_id`` as its displayed collection."""
+        if collection_id not in self.collection_ids:
+            return self
+        index = self.collection_ids.index(collection_id)
+        return self.model_copy(
+            update={
+                "collection_id": collection_id,
+                "collection_title": self.collection_titles[index],
+            }
+        )
+
 
 @dataclass(frozen=True)
 class QuestionTableSearchContext:
@@ -0,0 +1,163 @@
+import asyncio
+from itertools import chain
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import ORMExecuteState, Session, UOWTransaction
+
+from backend.core import logger
+from backend.question.models import (
+    Question,
+    QuestionQTypeLink,
+    QuestionTopicLink,
+    Topic,
+)
+from backend.question_collections.model import (
+    QuestionCollection,
+    QuestionCollectionLink,
+)
+from backend.question_runtime.model import QuestionRunTime
+
+DASHBOARD_VIEW = "question_dashboard"
+
+# CONCURRENTLY needs a unique index on the view (see the dashboard migrations)
+REFRESH_SQL = f"REFRESH MATERIALIZED VIEW CONCURRENTLY {DASHBOARD_VIEW}"
+
+# Writes to these models change rows of the dashboard projection
+WATCHED_MODELS: tuple[type, ...] = (
+    Question,
+    QuestionTopicLink,
+    QuestionQTypeLink,
+    Topic,
+    QuestionRunTime,
+    QuestionCollection,
+    QuestionCollectionLink,
+)
+
+_STALE_KEY = "dashboard_stale"
+
+
+class DashboardRefresher:
+    """Keep the ``question_dashboard`` materialized view in step with writes.
+
+    Once installed with ``listen``, every committed session that inserted,
+    updated or deleted one of ``WATCHED_MODELS`` requests a refresh. Requests
+    are debounced: a burst of writes within ``delay`` seconds results in a
+    single ``REFRESH MATERIALIZED VIEW CONCURRENTLY``, which does not block
+    readers. Only PostgreSQL has materialized views; on other databases
+    requests are ignored.
+
+    The hooks only see writes made in this process. With ``interval`` set,
+    ``listen`` also refreshes the view every ``interval`` seconds, so writes
+    from other workers show up within that window.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        *,
+        delay: float = 1.0,
+        interval: float | None = None,
+    ) -> None:
+        self.engine = engine
+        self.delay = delay
+        self.interval = interval
+        self.enabled = engine.dialect.name == "postgresql"
+        self._stale = False
+        self._task: asyncio.Task | None = None
+        self._periodic: asyncio.Task | None = None
+        self._listeners = [
+            (Session, "after_flush", self._after_flush),
+            (Session, "do_orm_execute", self._after_bulk),
+            (Session, "after_commit", self._after_commit),
+        ]
+
+    # ---------------------------------------------------------
+    # Session hooks
+    # ---------------------------------------------------------
+
+    def listen(self) -> "DashboardRefresher":
+        for target, name, fn in self._listeners:
+            event.listen(target, name, fn)
+        self._start_periodic()
+        return self
+
+    def remove(self) -> None:
+        for target, name, fn in self._listeners:
+            if event.contains(target, name, fn):
+                event.remove(target, name, fn)
+        if self._periodic is not None:
+            self._periodic.cancel()
+            self._periodic = None
+
+    def _after_flush(self, session: Session, _flush_context: UOWTransaction) -> None:
+        changed = chain(session.new, session.dirty, session.deleted)
+        if any(isinstance(obj, WATCHED_MODELS) for obj in changed):
+            session.info[_STALE_KEY] = True
+
+    def _after_bulk(self, state: ORMExecuteState) -> None:
+        # Bulk update()/delete() statements bypass the flush
+        if not (state.is_update or state.is_delete or state.is_insert):
+            return
+        mapper = state.bind_mapper
+        if mapper is not None and issubclass(mapper.class_, WATCHED_MODELS):
+            state.session.info[_STALE_KEY] = True
+
+    def _after_commit(self, session: Session) -> None:
+        if session.info.pop(_STALE_KEY, False):
+            self.request()
+
+    # ---------------------------------------------------------
+    # Refreshing
+    # ---------------------------------------------------------
+
+    def request(self) -> None:
+        """Schedule a refresh, merging it with one that is already pending."""
+        if not self.enabled:
+            return
+        self._stale = True
+        if self._task is not None and not self._task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Scripts without an event loop refresh the view themselves
+            logger.debug("[DashboardRefresher]: No running loop, skipping refresh")
+            return
+        self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        while self._stale:
+            await asyncio.sleep(self.delay)
+            self._stale = False
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("[DashboardRefresher]: Failed to refresh dashboard")
+
+    def _start_periodic(self) -> None:
+        if not self.enabled or not self.interval or self._periodic is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.debug("[DashboardRefresher]: No running loop, no periodic refresh")
+            return
+        self._periodic = loop.create_task(self._run_periodic(self.interval))
+
+    async def _run_periodic(self, interval: float) -> None:
+        # Picks up writes committed by other processes
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("[DashboardRefresher]: Failed to refresh dashboard")
+
+    async def refresh(self) -> None:
+        """Rebuild the projection without locking out concurrent searches."""
+        if not self.enabled:
+            return
+        async with self.engine.begin() as conn:
+            await conn.execute(text(REFRESH_SQL))
+        logger.debug("[DashboardRefresher]: Refreshed %s", DASHBOARD_VIEW)
@@ -1,11 +1,27 @@
 from collections.abc import Sequence
+from datetime import datetime
 from enum import StrEnum
 from typing import Any
+from uuid import UUID
+
+from sqlalchemy import DateTime, Uuid, column
 
 from backend.question_views.schema import (
     QuestionSearchParams,
     QuestionTableSearchContext,
 )
+from backend.utils import decode_cursor, keyset_after, like_pattern, prefix_tsquery
+from backend.utils.database.search import TS_CONFIG
+
+# Sort key of the table views; KEYSET_ORDER is the matching ORDER BY
+PAGE_KEY = (
+    column("updated_at", DateTime),
+    column("created_at", DateTime),
+    column("question_id", Uuid),
+)
+KEYSET_ORDER = (
+    "updated_at DESC NULLS LAST, created_at DESC NULLS LAST, question_id DESC"
+)
 
 
 class QuestionTableFilterBuilder:
@@ -17,7 +33,7 @@ class QuestionTableFilterBuilder:
         self.clauses: list[str] = []
         self.query_params: dict[str, Any] = {
             "limit": params.limit,
-            "offset": params.offset,
+            "offset": 0 if params.cursor else params.offset,
         }
 
     def build(
@@ -32,6 +48,7 @@ class QuestionTableFilterBuilder:
         self.add_institution()
         self.add_is_adaptive()
         self.add_collection()
+        self.add_cursor()
 
         where_sql = ""
         if self.clauses:
@@ -42,14 +59,29 @@ class QuestionTableFilterBuilder:
         self.clauses.append(clause)
         self.query_params.update(params)
 
+    def order_by(self) -> str:
+        """ORDER BY clause for the search, by relevance when requested."""
+        if self.params.sort == "relevance" and self.params.search:
+            self.query_params["search_term"] = self.params.search
+            rank = "similarity(title, :search_term)"
+            if "search_query" in self.query_params:
+                rank += (
+                    f" + ts_rank(search_document, "
+                    f"to_tsquery('{TS_CONFIG}', :search_query))"
+                )
+            return f"{rank} DESC, {KEYSET_ORDER}"
+        return KEYSET_ORDER
+
+    # Title (weight A) and topic (weight B) words share the projection's
+    # search_document; prefix matches use its GIN index and substring
+    # matches the trigram indexes.
     def add_title(
         self,
     ) -> None:
         if not self.params.search:
             return
-        self.add(
-            "title ILIKE :search",
-            search=f"%{self.params.search}%",
+        self._add_text_search(
+            "title", "search", "search_query", self.params.search, weight="A"
         )
 
     def add_status(
@@ -67,13 +99,22 @@ class QuestionTableFilterBuilder:
     def add_topic(self) -> None:
         if not self.params.topic:
             return
+        self._add_text_search(
+            "topics_text", "topic", "topic_query", self.params.topic, weight="B"
+        )
 
+    def _add_text_search(
+        self, column: str, like_param: str, query_param: str, term: str, weight: str
+    ) -> None:
+        substring = f"{column} ILIKE :{like_param}"
+        query = prefix_tsquery(term, weight)
+        if query is None:
+            self.add(substring, **{like_param: like_pattern(term)})
+            return
         self.add(
-            "EXISTS ("
-            "SELECT 1 FROM unnest(topics) AS topic_item(topic) "
-            "WHERE topic ILIKE :topic"
-            ")",
-            topic=f"%{self.params.topic}%",
+            f"(search_document @@ to_tsquery('{TS_CONFIG}', :{query_param}) "
+            f"OR {substring})",
+            **{like_param: like_pattern(term), query_param: query},
         )
 
     def add_qtype(
@@ -114,7 +155,7 @@ class QuestionTableFilterBuilder:
 
     def add_context(self) -> None:
         if self.context.owner_id:
-            self.add("owner_id = :owner_id", owner_id=self.context.owner_id)
+            self.add("user_id = :owner_id", owner_id=self.context.owner_id)
         if self.context.developer_profile_id:
             self.add(
                 "developer_profile_id = :developer_profile_id",
@@ -133,16 +174,28 @@ class QuestionTableFilterBuilder:
     def add_collection(self) -> None:
         if self.params.collection_id is not None:
             self.add(
-                "collection_id = :collection_id",
+                ":collection_id = ANY(collection_ids)",
                 collection_id=self.params.collection_id,
             )
 
         if self.params.collection_title:
             self.add(
-                "collection_title ILIKE :collection_title",
+                "EXISTS ("
+                "SELECT 1 FROM unnest(collection_titles) AS collection_item(title) "
+                "WHERE title ILIKE :collection_title"
+                ")",
                 collection_title=self.params.collection_title,
             )
 
+    def add_cursor(self) -> None:
+        if not self.params.cursor:
+            return
+        if self.params.sort != "recent":
+            raise ValueError("Cursors are only supported with sort='recent'")
+        after = decode_cursor(self.params.cursor, (datetime, datetime, UUID))
+        compiled = keyset_after(PAGE_KEY, after).compile()
+        self.add(f"({compiled})", **compiled.params)
+
     @staticmethod
     def _enum_names(value: StrEnum | Sequence[StrEnum] | None) -> list[str]:
         if value is None:
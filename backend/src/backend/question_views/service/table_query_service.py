@@ -2,95 +2,91 @@ from collections.abc import Sequence
 from typing import Literal
 
 from sqlalchemy import TextClause, text
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.question_views.schema import (
     QuestionSearchParams,
     QuestionTableRow,
     QuestionTableSearchContext,
 )
+from backend.utils import encode_cursor
 
 from .table_filter_builder import QuestionTableFilterBuilder
 
-VALID_VIEWS = Literal["dashboard_with_collections"]
+VALID_VIEWS = Literal["question_dashboard"]
 
 
 class TableQueryService:
+    """Search the ``question_dashboard`` projection.
+
+    The projection is a materialized view with one row per question whose
+    collections are folded into arrays, so searches read a single indexed
+    relation. ``DashboardRefresher`` keeps it up to date.
+    """
+
     def __init__(
         self,
-        session: Session,
-        view_name: VALID_VIEWS = "dashboard_with_collections",
+        session: AsyncSession,
+        view_name: VALID_VIEWS = "question_dashboard",
     ) -> None:
         self._session = session
         self._view_name = view_name
 
-    def search(
+    async def search(
         self,
         params: QuestionSearchParams | None = None,
         *,
         context: QuestionTableSearchContext | None = None,
     ) -> Sequence[QuestionTableRow]:
+        params = params or QuestionSearchParams()
         query = self._build_query(params, context=context)
-        result = self._session.execute(query)
-        return [
+        result = await self._session.execute(query)
+        rows = [
             QuestionTableRow.model_validate(dict(row))
             for row in result.mappings().all()
         ]
+        if params.collection_id is not None:
+            rows = [row.in_collection(params.collection_id) for row in rows]
+        return rows
 
     def _build_query(
         self,
         params: QuestionSearchParams | None = None,
         *,
         context: QuestionTableSearchContext | None = None,
-        distinct_questions: bool = True,
     ) -> TextClause:
         params = params or QuestionSearchParams()
         context = context or QuestionTableSearchContext()
 
-        where_sql, query_params = QuestionTableFilterBuilder(
-            params=params,
-            context=context,
-        ).build()
-        if distinct_questions:
-            statement = self._distinct_query(where_sql)
-        else:
-            statement = text(f"""
-                SELECT *
-                FROM {self._view_name} table_view
-                {where_sql}
-                ORDER BY updated_at DESC NULLS LAST, created_at DESC
-                LIMIT :limit
-                OFFSET :offset
-            """)
-        return statement.bindparams(**query_params)
-
-    def _distinct_query(self, where_sql: str):
-        return text(f"""
+        builder = QuestionTableFilterBuilder(params=params, context=context)
+        where_sql, query_params = builder.build()
+        statement = text(f"""
             SELECT *
-            FROM (
-                SELECT
-                    table_view.*,
-                    row_number() OVER (
-                        PARTITION BY question_id
-                        ORDER BY updated_at DESC NULLS LAST, created_at DESC
-                    ) AS row_number
-                FROM {self._view_name} table_view
-                {where_sql}
-            ) deduped
-            WHERE row_number = 1
-            ORDER BY updated_at DESC NULLS LAST, created_at DESC
+            FROM {self._view_name} table_view
+            {where_sql}
+            ORDER BY {builder.order_by()}
             LIMIT :limit
             OFFSET :offset
         """)
+        return statement.bindparams(**query_params)
+
+    @staticmethod
+    def page_cursor(row: QuestionTableRow) -> str:
+        """Cursor that continues a search after ``row``."""
+        return encode_cursor(row.updated_at, row.created_at, row.question_id)
 
 
 if __name__ == "__main__":
+    import asyncio
     import json
 
-    from backend.database import engine
+    from backend.database import AsyncSessionLocal
+
+    async def _main() -> None:
+        async with AsyncSessionLocal() as session:
+            result = await TableQueryService(session).search(
+                params=QuestionSearchParams(search="energy")
+            )
+            print(json.dumps(result, indent=4, default=str))
 
-    with Session(engine) as session:
-        result = TableQueryService(session).search(
-            params=QuestionSearchParams(search="energy")
-        )
-        print(json.dumps(result, indent=4, default=str))
+    asyncio.run(_main())
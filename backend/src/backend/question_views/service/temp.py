@@ -3,7 +3,7 @@ from typing import Any
 from uuid import UUID
 
 from sqlalchemy import TextClause, text
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.question_views.schema import QuestionSearchParams, QuestionTableRow
 from backend.shared import ID
@@ -18,32 +18,32 @@ def _enum_names(value: StrEnum | list[StrEnum] | None) -> list[str]:
 
 
 class TableQueryService:
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
-    def search(
+    async def search(
         self,
         params: QuestionSearchParams | None = None,
     ) -> list[QuestionTableRow]:
-        return self._search(params)
+        return await self._search(params)
 
-    def search_user_questions(
+    async def search_user_questions(
         self,
         user_id: ID,
         params: QuestionSearchParams | None = None,
     ) -> list[QuestionTableRow]:
-        return self._search(params, owner_id=convert_uuid(user_id))
+        return await self._search(params, owner_id=convert_uuid(user_id))
 
-    def search_published_questions(
+    async def search_published_questions(
         self,
         params: QuestionSearchParams | None = None,
     ) -> list[QuestionTableRow]:
         params = (params or QuestionSearchParams()).model_copy(
             update={"published": True, "status": None}
         )
-        return self._search(params)
+        return await self._search(params)
 
-    def _search(
+    async def _search(
         self,
         params: QuestionSearchParams | None = None,
         *,
@@ -53,7 +53,7 @@ class TableQueryService:
         query = self._build_query(
             params, owner_id=owner_id, developer_profile_id=developer_profile_id
         )
-        result = self._session.execute(query)
+        result = await self._session.execute(query)
         return [
             QuestionTableRow.model_validate(dict(row))
             for row in result.mappings().all()
@@ -151,12 +151,16 @@ class TableQueryService:
 
 
 if __name__ == "__main__":
+    import asyncio
     import json
 
-    from backend.database import engine
+    from backend.database import AsyncSessionLocal
 
-    with Session(engine) as session:
-        result = TableQueryService(session).search(
-            params=QuestionSearchParams(search="energy")
-        )
-        print(json.dumps(result, indent=4, default=str))
+    async def _main() -> None:
+        async with AsyncSessionLocal() as session:
+            result = await TableQueryService(session).search(
+                params=QuestionSearchParams(search="energy")
+            )
+            print(json.dumps(result, indent=4, default=str))
+
+    asyncio.run(_main())
@@ -1,19 +1,48 @@
-from .schema import FileData
+from .schema import BinaryFileData, FileData, StorageEntry
 from .services import Storage
+from .services.async_storage import AsyncStorage, run_blocking
 from .services.base import STORAGE_TYPE
+from .services.cached_storage import CachedStorage
+from .services.content_addressed_storage import ContentAddressedStorage
 from .services.converter import UploadFileDataConverter
 from .services.firebase_storage import FbStorage
+from .services.image_derivatives import ImageDerivativeCache, ImageTransform
+from .services.lazy_files import LazyFileData, prefetch
 from .services.local_storage import LocalStorage
-from .services.zip_files import download_zip, extract_zip_files, upload_zip_and_extract
+from .services.serving import file_response
+from .services.zip_files import (
+    check_zip_archive,
+    download_zip,
+    extract_zip_files,
+    extract_zip_to_storage,
+    spool_upload,
+    stream_zip,
+    upload_zip_and_extract,
+)
 
 __all__ = [
     "STORAGE_TYPE",
+    "AsyncStorage",
+    "BinaryFileData",
+    "CachedStorage",
+    "ContentAddressedStorage",
     "FbStorage",
     "FileData",
+    "ImageDerivativeCache",
+    "ImageTransform",
+    "LazyFileData",
     "LocalStorage",
     "Storage",
+    "StorageEntry",
     "UploadFileDataConverter",
+    "check_zip_archive",
     "download_zip",
     "extract_zip_files",
+    "extract_zip_to_storage",
+    "file_response",
+    "prefetch",
+    "run_blocking",
+    "spool_upload",
+    "stream_zip",
     "upload_zip_and_extract",
 ]
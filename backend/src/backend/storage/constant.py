@@ -44,3 +44,29 @@ ALLOWED_IMAGE_EXTENSIONS = {
     "image/jpeg",
     "image/jpg",
 }
+
+# Maximum number of concurrent per-object requests issued to cloud storage
+MAX_CONCURRENT_STORAGE_OPS = 16
+
+# Maximum number of sub-requests sent in a single GCS batch request
+GCS_BATCH_SIZE = 100
+
+# Limits applied to uploaded ZIP archives
+MAX_ZIP_ARCHIVE_SIZE_MB = 100
+MAX_ZIP_EXTRACTED_SIZE_MB = 250
+MAX_ZIP_MEMBERS = 1000
+
+# Per-directory manifest used by the content-addressed storage layout
+MANIFEST_FILENAME = ".manifest.json"
+
+# Attempts made to apply a manifest change that keeps losing to other writers
+MANIFEST_UPDATE_ATTEMPTS = 8
+
+# Leading bytes of images that were stored as base64 text rather than raw bytes
+BASE64_IMAGE_PREFIXES = (b"iVBOR", b"/9j/", b"R0lGOD", b"UklGR")
+
+# Largest width, in pixels, a derived image may be requested at
+MAX_DERIVED_IMAGE_WIDTH = 4096
+
+# Threads used to run blocking storage calls from async code
+STORAGE_IO_THREADS = 32
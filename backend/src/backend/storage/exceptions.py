@@ -20,3 +20,37 @@ class FileContentDecodeError(FileConverterError):
 
 class UnsupportedFileInputError(FileConverterError):
     """Raised when input type cannot be converted to FileData."""
+
+
+class StorageBatchError(Exception):
+    """Raised when one or more operations in a storage batch fail."""
+
+    def __init__(
+        self,
+        operation: str,
+        failures: dict[str, Exception],
+        succeeded: list[str] | None = None,
+    ) -> None:
+        self.operation = operation
+        self.failures = failures
+        self.succeeded = succeeded or []
+        targets = ", ".join(failures)
+        super().__init__(
+            f"Storage batch {operation} failed for {len(failures)} target(s): {targets}"
+        )
+
+
+class StorageConflictError(Exception):
+    """Raised when a conditional write finds the target at another version."""
+
+    def __init__(self, target: str) -> None:
+        self.target = target
+        super().__init__(f"{target} changed since it was read")
+
+
+class ZipArchiveError(ValueError):
+    """Raised when an uploaded ZIP archive is missing, empty or malformed."""
+
+
+class ZipLimitExceededError(ZipArchiveError):
+    """Raised when a ZIP archive exceeds configured size or member limits."""
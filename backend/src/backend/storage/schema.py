@@ -1,15 +1,65 @@
+import base64
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from fastapi import UploadFile
 from pydantic import BaseModel
 
+from backend.storage.constant import BASE64_IMAGE_PREFIXES
+
 
 class FileData(BaseModel):
     filename: str
     content: dict | str | Any | bytes
     mime_type: str = "application/octet-stream"
 
+    def encoded(self) -> "FileData":
+        """Return a JSON-safe copy of this file (already JSON-safe here)."""
+        return self
+
+
+class BinaryFileData(FileData):
+    """FileData that keeps its content as raw bytes.
+
+    Files read from storage and uploaded images use this variant so image
+    bytes are not base64 encoded and decoded as they move between storage,
+    services and the sandbox payload. Encode only at the API boundary with
+    ``encoded`` or ``to_text``.
+    """
+
+    content: bytes
+
+    @property
+    def is_image(self) -> bool:
+        return self.mime_type.startswith("image/")
+
+    def to_text(self) -> str:
+        """Text form of the content: base64 for images, UTF-8 otherwise."""
+        if not self.is_image:
+            return self.content.decode("utf-8", errors="replace")
+        if self.content.startswith(BASE64_IMAGE_PREFIXES):
+            # Legacy images stored as base64 text
+            return self.content.decode("utf-8", errors="replace").strip()
+        return base64.b64encode(self.content).decode("utf-8")
+
+    def encoded(self) -> FileData:
+        return FileData(
+            filename=self.filename, content=self.to_text(), mime_type=self.mime_type
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class StorageEntry:
+    """A listed file with the metadata the listing already provided."""
+
+    path: str
+    size: int | None = None
+    # Last modification time as a POSIX timestamp
+    updated: float | None = None
+    # Opaque token that changes with the content (see Storage.get_version)
+    version: str | None = None
+
 
 class FilesData(BaseModel):
     files: list[FileData]
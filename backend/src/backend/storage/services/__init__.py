@@ -1,5 +1,17 @@
+from .async_storage import AsyncStorage, run_blocking
 from .base import STORAGE_TYPE, Storage
+from .cached_storage import CachedStorage
+from .content_addressed_storage import ContentAddressedStorage
 from .firebase_storage import FbStorage
 from .local_storage import LocalStorage
 
-__all__ = ["STORAGE_TYPE", "FbStorage", "LocalStorage", "Storage"]
+__all__ = [
+    "STORAGE_TYPE",
+    "AsyncStorage",
+    "CachedStorage",
+    "ContentAddressedStorage",
+    "FbStorage",
+    "LocalStorage",
+    "Storage",
+    "run_blocking",
+]
@@ -0,0 +1,103 @@
+import asyncio
+import functools
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from backend.storage.constant import STORAGE_IO_THREADS
+
+
+@functools.lru_cache(maxsize=1)
+def _io_executor() -> ThreadPoolExecutor:
+    # Dedicated pool so slow storage calls cannot starve the loop's default
+    # executor, and so the number of in-flight backend calls stays bounded.
+    return ThreadPoolExecutor(
+        max_workers=STORAGE_IO_THREADS, thread_name_prefix="storage-io"
+    )
+
+
+async def run_blocking[T](func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Run a blocking storage call on the bounded storage I/O pool.
+
+    Args:
+        func: Synchronous callable to run.
+        *args: Positional arguments for ``func``.
+        **kwargs: Keyword arguments for ``func``.
+
+    Returns:
+        Whatever ``func`` returns.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _io_executor(), functools.partial(func, *args, **kwargs)
+    )
+
+
+class AsyncStorage(ABC):
+    """
+    Asynchronous interface for a storage backend.
+
+    Async handlers and services use these methods so that slow disk or network
+    I/O never blocks the event loop. ``Storage`` implements them by offloading
+    its synchronous methods to a bounded thread pool; a backend with a native
+    asyncio client can override them directly.
+    """
+
+    @abstractmethod
+    async def aread(self, target: str) -> bytes | None:
+        """
+        Read the contents of a stored object without blocking the event loop.
+
+        Args:
+            target: The storage path/key to read.
+
+        Returns:
+            Raw bytes of the stored object.
+        """
+        ...
+
+    @abstractmethod
+    async def awrite(
+        self,
+        target: str,
+        data: str | dict | list | bytes | bytearray,
+        *,
+        overwrite: bool = True,
+    ) -> str:
+        """
+        Write data to the given storage target without blocking the event loop.
+
+        Args:
+            target: The storage path/key to write to.
+            data: Content to store.
+            overwrite: Whether to overwrite existing content.
+
+        Returns:
+            The normalized storage target.
+        """
+        ...
+
+    @abstractmethod
+    async def alist(self, target: str, *, recursive: bool = False) -> Sequence[str]:
+        """
+        List objects under a prefix or directory without blocking the event loop.
+
+        Args:
+            target: Directory or prefix to list.
+            recursive: If True, include nested objects.
+
+        Returns:
+            Sequence of storage targets.
+        """
+        ...
+
+    @abstractmethod
+    async def adelete(self, target: str) -> None:
+        """
+        Delete the specified storage target without blocking the event loop.
+
+        Args:
+            target: The storage path/key to delete.
+        """
+        ...
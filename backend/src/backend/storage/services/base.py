@@ -1,16 +1,26 @@
 import builtins
 import json
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Literal
+from typing import BinaryIO, Literal, TypeVar
 
 from google.cloud.storage.blob import Blob
 
+from backend.storage.constant import MAX_CONCURRENT_STORAGE_OPS
+from backend.storage.exceptions import StorageBatchError
+from backend.storage.schema import StorageEntry
+
+from .async_storage import AsyncStorage, run_blocking
+
 STORAGE_TYPE = Literal["cloud", "local"]
+WRITE_DATA = str | dict | list | bytes | bytearray
+
+_T = TypeVar("_T")
 
 
-class Storage(ABC):
+class Storage(AsyncStorage, ABC):
     """
     Abstract interface for a storage backend.
 
@@ -181,6 +191,24 @@ class Storage(ABC):
         """
         ...
 
+    def list_entries(
+        self, target: str, *, recursive: bool = False
+    ) -> builtins.list[StorageEntry]:
+        """
+        List files under a prefix together with their size and modification time.
+
+        Backends override this when their listing call already returns the
+        metadata; the default only knows the paths.
+
+        Args:
+            target: Directory or prefix to list.
+            recursive: If True, include nested objects.
+
+        Returns:
+            Entries for every listed file.
+        """
+        return [StorageEntry(path) for path in self.list(target, recursive=recursive)]
+
     # ---------------------------------------------------------
     # Object management operations
     # ---------------------------------------------------------
@@ -216,6 +244,284 @@ class Storage(ABC):
         """
         ...
 
+    def write_fileobj(self, target: str, fileobj: BinaryIO) -> str:
+        """
+        Stream a binary file object to the given storage target.
+
+        The default implementation buffers the whole object; backends that
+        can upload incrementally should override it.
+
+        Args:
+            target: The storage path/key to write to.
+            fileobj: Readable binary file object positioned at its start.
+
+        Returns:
+            The normalized storage target.
+        """
+        return self.write(target, fileobj.read())
+
+    # ---------------------------------------------------------
+    # Batch operations
+    # ---------------------------------------------------------
+
+    def write_many(
+        self,
+        items: Sequence[tuple[str, WRITE_DATA]],
+        *,
+        overwrite: bool = True,
+    ) -> builtins.list[str]:
+        """
+        Write several objects concurrently.
+
+        Args:
+            items: (target, data) pairs to write.
+            overwrite: Whether to overwrite existing content.
+
+        Returns:
+            The normalized storage targets, in the same order as items.
+
+        Raises:
+            StorageBatchError if any write fails. Writes that succeeded are
+            left in place; callers decide whether to roll them back.
+        """
+        return self._run_batch(
+            "write",
+            [
+                (target, lambda t=target, d=data: self.write(t, d, overwrite=overwrite))
+                for target, data in items
+            ],
+        )
+
+    def read_many(self, targets: Sequence[str]) -> dict[str, bytes | None]:
+        """
+        Read several objects concurrently.
+
+        Args:
+            targets: Storage paths/keys to read.
+
+        Returns:
+            Mapping of each target to its content (None if unreadable).
+
+        Raises:
+            StorageBatchError if any read raises.
+        """
+        results = self._run_batch(
+            "read", [(target, lambda t=target: self.read(t)) for target in targets]
+        )
+        return dict(zip(targets, results, strict=True))
+
+    def delete_many(self, targets: Sequence[str]) -> None:
+        """
+        Delete several objects concurrently.
+
+        Missing targets are ignored so the call can be used for rollbacks.
+
+        Args:
+            targets: Storage paths/keys to delete.
+
+        Raises:
+            StorageBatchError if any delete fails.
+        """
+        self._run_batch(
+            "delete", [(target, lambda t=target: self.delete(t)) for target in targets]
+        )
+
+    def _run_batch(
+        self, operation: str, calls: Sequence[tuple[str, Callable[[], _T]]]
+    ) -> builtins.list[_T]:
+        """Run per-target calls on a bounded thread pool and collect failures."""
+        if not calls:
+            return []
+        if len(calls) == 1:
+            target, call = calls[0]
+            try:
+                return [call()]
+            except Exception as e:
+                raise StorageBatchError(operation, {target: e}) from e
+
+        workers = min(MAX_CONCURRENT_STORAGE_OPS, len(calls))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [(target, pool.submit(call)) for target, call in calls]
+
+        results: builtins.list[_T] = []
+        succeeded: builtins.list[str] = []
+        failures: dict[str, Exception] = {}
+        for target, future in futures:
+            error = future.exception()
+            if error is not None:
+                failures[target] = error  # type: ignore[assignment]
+                continue
+            results.append(future.result())
+            succeeded.append(target)
+        if failures:
+            first = next(iter(failures.values()))
+            raise StorageBatchError(operation, failures, succeeded) from first
+        return results
+
+    # ---------------------------------------------------------
+    # Async operations
+    # ---------------------------------------------------------
+
+    async def aread(self, target: str) -> bytes | None:
+        return await run_blocking(self.read, target)
+
+    async def awrite(
+        self,
+        target: str,
+        data: str | dict | builtins.list | bytes | bytearray,
+        *,
+        overwrite: bool = True,
+    ) -> str:
+        return await run_blocking(self.write, target, data, overwrite=overwrite)
+
+    async def alist(self, target: str, *, recursive: bool = False) -> Sequence[str]:
+        return await run_blocking(self.list, target, recursive=recursive)
+
+    async def adelete(self, target: str) -> None:
+        await run_blocking(self.delete, target)
+
+    async def aexists(self, target: str) -> bool:
+        """Async variant of ``exists``."""
+        return await run_blocking(self.exists, target)
+
+    async def acreate_dir(self, target: str) -> str:
+        """Async variant of ``create_dir``."""
+        return await run_blocking(self.create_dir, target)
+
+    async def acopy(self, source: str, destination: str) -> str:
+        """Async variant of ``copy``."""
+        return await run_blocking(self.copy, source, destination)
+
+    async def amove(self, source: str, destination: str) -> str:
+        """Async variant of ``move``."""
+        return await run_blocking(self.move, source, destination)
+
+    async def awrite_many(
+        self,
+        items: Sequence[tuple[str, WRITE_DATA]],
+        *,
+        overwrite: bool = True,
+    ) -> builtins.list[str]:
+        """Async variant of ``write_many``."""
+        return await run_blocking(self.write_many, items, overwrite=overwrite)
+
+    async def aread_many(self, targets: Sequence[str]) -> dict[str, bytes | None]:
+        """Async variant of ``read_many``."""
+        return await run_blocking(self.read_many, targets)
+
+    async def adelete_many(self, targets: Sequence[str]) -> None:
+        """Async variant of ``delete_many``."""
+        await run_blocking(self.delete_many, targets)
+
+    # ---------------------------------------------------------
+    # Optional capabilities
+    # ---------------------------------------------------------
+
+    def get_version(self, target: str) -> str | None:
+        """
+        Return an opaque version token for a stored object.
+
+        The token changes whenever the object content changes (for example a
+        GCS generation or a local mtime/size pair). Backends that cannot
+        provide one return None, which callers treat as "always stale".
+
+        Args:
+            target: The storage path/key to inspect.
+
+        Returns:
+            Version token, or None if the object is missing or unsupported.
+        """
+        _ = target
+        return None
+
+    def stat(self, target: str) -> StorageEntry | None:
+        """
+        Return metadata for a single stored file without reading it.
+
+        The default only knows the version token; backends fill in size and
+        modification time where a metadata call provides them.
+
+        Args:
+            target: The storage path/key to inspect.
+
+        Returns:
+            Entry for the file, or None if it does not exist.
+        """
+        version = self.get_version(target)
+        if version is None:
+            return None
+        return StorageEntry(self._to_storage_path(target), version=version)
+
+    def read_versioned(self, target: str) -> tuple[bytes | None, str | None]:
+        """
+        Read a file together with the version token of the content returned.
+
+        Pairs with ``write_if_version`` for optimistic read-modify-write
+        updates. Backends that cannot return both from one consistent read
+        raise NotImplementedError.
+
+        Args:
+            target: The storage path/key to read.
+
+        Returns:
+            (content, version), or (None, None) if the file does not exist.
+        """
+        raise NotImplementedError(f"{type(self).__name__} has no versioned reads")
+
+    def write_if_version(
+        self, target: str, data: WRITE_DATA, version: str | None
+    ) -> str:
+        """
+        Write a file only if it is still at ``version``.
+
+        The check and the write are atomic, including against other
+        processes, so concurrent read-modify-write updates cannot overwrite
+        each other.
+
+        Args:
+            target: The storage path/key to write to.
+            data: Content to store.
+            version: Version returned by ``read_versioned``, or None to
+                require that the file does not exist yet.
+
+        Returns:
+            The normalized storage target.
+
+        Raises:
+            StorageConflictError: If the file is at another version.
+        """
+        raise NotImplementedError(f"{type(self).__name__} has no conditional writes")
+
+    def delete_if_version(self, target: str, version: str) -> None:
+        """
+        Delete a file only if it is still at ``version``.
+
+        Args:
+            target: The storage path/key to delete.
+            version: Version returned by ``read_versioned``.
+
+        Raises:
+            StorageConflictError: If the file is missing or at another version.
+        """
+        raise NotImplementedError(f"{type(self).__name__} has no conditional deletes")
+
+    def local_path(self, target: str) -> Path | None:
+        """
+        Return a filesystem path for a stored file, if one exists.
+
+        Callers use it to serve files straight from disk (sendfile and
+        range requests) instead of copying them through ``read``. Backends
+        without local files return None.
+
+        Args:
+            target: The storage path/key to resolve.
+
+        Returns:
+            Path of an existing regular file, or None.
+        """
+        _ = target
+        return None
+
     def _to_storage_path(self, value: str | Path | Blob) -> str:
         """
         Normalize input into a StoragePath.
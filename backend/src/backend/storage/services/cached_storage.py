@@ -0,0 +1,327 @@
+import builtins
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from pathlib import Path
+from typing import BinaryIO
+
+from backend.core import logger
+from backend.storage.schema import StorageEntry
+
+from .base import STORAGE_TYPE, WRITE_DATA, Storage
+
+
+class CachedStorage(Storage):
+    """Read-through cache that wraps any Storage backend.
+
+    Reads are served from an in-memory LRU first, then from a local disk tier,
+    and only fall through to the wrapped backend when neither holds a copy
+    matching the backend's current object version. Writes, deletes, copies and
+    moves are delegated to the backend and invalidate the affected keys.
+
+    Checking the version costs a backend round trip, so a cached copy is
+    trusted for ``revalidate_after`` seconds after its last check. Changes
+    made through this instance show at once; changes made elsewhere (another
+    process, or directly on the backend) can take up to that long to show.
+    ``revalidate_after=0`` checks the version on every read.
+    """
+
+    def __init__(
+        self,
+        backend: Storage,
+        cache_dir: str | Path,
+        *,
+        max_disk_bytes: int = 512 * 1024 * 1024,
+        max_memory_bytes: int = 64 * 1024 * 1024,
+        revalidate_after: float = 5.0,
+    ) -> None:
+        self.backend = backend
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_disk_bytes = max_disk_bytes
+        self.max_memory_bytes = max_memory_bytes
+        self.revalidate_after = revalidate_after
+
+        # key -> (version, content)
+        self._memory: OrderedDict[str, tuple[str, bytes]] = OrderedDict()
+        self._memory_bytes = 0
+        # key -> (version, size)
+        self._disk: OrderedDict[str, tuple[str, int]] = OrderedDict()
+        self._disk_bytes = 0
+        # key -> time.monotonic() of the last version check
+        self._validated: dict[str, float] = {}
+        self._lock = threading.RLock()
+
+        self._load_disk_index()
+        self.set_storage_type()
+        logger.info(
+            "[CachedStorage]: Wrapping %s cache_dir=%s",
+            backend.__class__.__name__,
+            self.cache_dir,
+        )
+
+    def set_storage_type(self) -> STORAGE_TYPE:
+        self.mode = self.backend.get_storage_type()
+        return self.mode
+
+    def get_storage_type(self) -> STORAGE_TYPE:
+        return self.backend.get_storage_type()
+
+    def get_version(self, target: str) -> str | None:
+        return self.backend.get_version(target)
+
+    def stat(self, target: str) -> StorageEntry | None:
+        return self.backend.stat(target)
+
+    # ---------------------------------------------------------
+    # Reads
+    # ---------------------------------------------------------
+
+    def read(self, target: str) -> bytes | None:
+        key = self._cache_key(target)
+        version = self._recently_validated(key)
+        if version is None:
+            version = self.backend.get_version(target)
+            if version is None:
+                # Missing object or backend without versions: never serve stale data
+                self._invalidate(key)
+                return self.backend.read(target)
+            with self._lock:
+                self._validated[key] = time.monotonic()
+
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached and cached[0] == version:
+                self._memory.move_to_end(key)
+                return cached[1]
+
+        content = self._read_disk(key, version)
+        if content is not None:
+            self._put_memory(key, version, content)
+            return content
+
+        content = self.backend.read(target)
+        if content is not None:
+            self._put_memory(key, version, content)
+            self._put_disk(key, version, content)
+        return content
+
+    def exists(self, target: str) -> bool:
+        return self.backend.exists(target)
+
+    def is_dir(self, target: str) -> bool:
+        return self.backend.is_dir(target)
+
+    def list(self, target: str, *, recursive: bool = False) -> Sequence[str]:
+        return self.backend.list(target, recursive=recursive)
+
+    def list_entries(
+        self, target: str, *, recursive: bool = False
+    ) -> builtins.list[StorageEntry]:
+        return self.backend.list_entries(target, recursive=recursive)
+
+    def download(self, target: str) -> bytes:
+        return self.backend.download(target)
+
+    def local_path(self, target: str) -> Path | None:
+        # Local files are already on disk; serve them without the cache
+        return self.backend.local_path(target)
+
+    # ---------------------------------------------------------
+    # Mutations (delegated, then invalidated)
+    # ---------------------------------------------------------
+
+    def create_dir(self, target: str) -> str:
+        return self.backend.create_dir(target)
+
+    def write(
+        self,
+        target: str,
+        data: str | dict | builtins.list | bytes | bytearray,
+        *,
+        overwrite: bool = True,
+    ) -> str:
+        self._invalidate(self._cache_key(target))
+        return self.backend.write(target, data, overwrite=overwrite)
+
+    def write_fileobj(self, target: str, fileobj: BinaryIO) -> str:
+        self._invalidate(self._cache_key(target))
+        return self.backend.write_fileobj(target, fileobj)
+
+    def delete(self, target: str) -> None:
+        self._invalidate_prefix(self._cache_key(target))
+        self.backend.delete(target)
+
+    def copy(self, source: str, destination: str) -> str:
+        self._invalidate_prefix(self._cache_key(destination))
+        return self.backend.copy(source, destination)
+
+    def move(self, source: str, destination: str) -> str:
+        self._invalidate_prefix(self._cache_key(source))
+        self._invalidate_prefix(self._cache_key(destination))
+        return self.backend.move(source, destination)
+
+    def write_many(
+        self,
+        items: Sequence[tuple[str, WRITE_DATA]],
+        *,
+        overwrite: bool = True,
+    ) -> builtins.list[str]:
+        for target, _ in items:
+            self._invalidate(self._cache_key(target))
+        return self.backend.write_many(items, overwrite=overwrite)
+
+    def delete_many(self, targets: Sequence[str]) -> None:
+        for target in targets:
+            self._invalidate_prefix(self._cache_key(target))
+        self.backend.delete_many(targets)
+
+    def clear(self) -> None:
+        """Drop every cached entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            self._validated.clear()
+            for key in list(self._disk):
+                self._drop_disk(key)
+
+    # ---------------------------------------------------------
+    # Memory tier
+    # ---------------------------------------------------------
+
+    def _put_memory(self, key: str, version: str, content: bytes) -> None:
+        size = len(content)
+        if size > self.max_memory_bytes:
+            return
+        with self._lock:
+            self._drop_memory(key)
+            self._memory[key] = (version, content)
+            self._memory_bytes += size
+            while self._memory_bytes > self.max_memory_bytes and self._memory:
+                oldest = next(iter(self._memory))
+                self._drop_memory(oldest)
+
+    def _drop_memory(self, key: str) -> None:
+        entry = self._memory.pop(key, None)
+        if entry is not None:
+            self._memory_bytes -= len(entry[1])
+
+    # ---------------------------------------------------------
+    # Disk tier
+    # ---------------------------------------------------------
+
+    def _read_disk(self, key: str, version: str) -> bytes | None:
+        with self._lock:
+            entry = self._disk.get(key)
+            if entry is None:
+                return None
+            if entry[0] != version:
+                self._drop_disk(key)
+                return None
+            self._disk.move_to_end(key)
+        try:
+            return self._data_path(key).read_bytes()
+        except OSError:
+            with self._lock:
+                self._drop_disk(key)
+            return None
+
+    def _put_disk(self, key: str, version: str, content: bytes) -> None:
+        size = len(content)
+        if size > self.max_disk_bytes:
+            return
+        with self._lock:
+            self._drop_disk(key)
+            try:
+                self._data_path(key).write_bytes(content)
+                self._meta_path(key).write_text(
+                    json.dumps({"key": key, "version": version, "size": size})
+                )
+            except OSError:
+                logger.warning("[CachedStorage]: Failed to cache %s on disk", key)
+                self._remove_files(key)
+                return
+            self._disk[key] = (version, size)
+            self._disk_bytes += size
+            while self._disk_bytes > self.max_disk_bytes and self._disk:
+                oldest = next(iter(self._disk))
+                self._drop_disk(oldest)
+
+    def _drop_disk(self, key: str) -> None:
+        entry = self._disk.pop(key, None)
+        if entry is not None:
+            self._disk_bytes -= entry[1]
+        self._remove_files(key)
+
+    def _remove_files(self, key: str) -> None:
+        self._data_path(key).unlink(missing_ok=True)
+        self._meta_path(key).unlink(missing_ok=True)
+
+    def _load_disk_index(self) -> None:
+        """Rebuild the disk index from metadata left by a previous process."""
+        for meta in self.cache_dir.glob("*.json"):
+            try:
+                info = json.loads(meta.read_text())
+                key, version, size = info["key"], info["version"], int(info["size"])
+            except (OSError, ValueError, KeyError):
+                meta.unlink(missing_ok=True)
+                continue
+            if not self._data_path(key).exists():
+                meta.unlink(missing_ok=True)
+                continue
+            self._disk[key] = (version, size)
+            self._disk_bytes += size
+        while self._disk_bytes > self.max_disk_bytes and self._disk:
+            self._drop_disk(next(iter(self._disk)))
+
+    def _data_path(self, key: str) -> Path:
+        return self.cache_dir / f"{self._digest(key)}.bin"
+
+    def _meta_path(self, key: str) -> Path:
+        return self.cache_dir / f"{self._digest(key)}.json"
+
+    # ---------------------------------------------------------
+    # Invalidation helpers
+    # ---------------------------------------------------------
+
+    def _invalidate(self, key: str) -> None:
+        with self._lock:
+            self._validated.pop(key, None)
+            self._drop_memory(key)
+            self._drop_disk(key)
+
+    def _invalidate_prefix(self, key: str) -> None:
+        """Invalidate a key and, when it names a directory, everything below it."""
+        prefix = key.rstrip("/") + "/"
+        with self._lock:
+            stale = {
+                k
+                for k in (*self._memory, *self._disk)
+                if k == key or k.startswith(prefix)
+            }
+            for k in stale:
+                self._validated.pop(k, None)
+                self._drop_memory(k)
+                self._drop_disk(k)
+
+    def _recently_validated(self, key: str) -> str | None:
+        """Version of the cached copy of ``key`` if it was checked recently."""
+        with self._lock:
+            checked = self._validated.get(key)
+            if checked is None or time.monotonic() - checked >= self.revalidate_after:
+                return None
+            entry = self._memory.get(key) or self._disk.get(key)
+            if entry is None:
+                self._validated.pop(key, None)
+                return None
+            return entry[0]
+
+    def _cache_key(self, target: str) -> str:
+        return self._to_storage_path(target).replace("\\", "/").lstrip("/").rstrip("/")
+
+    @staticmethod
+    def _digest(key: str) -> str:
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
@@ -0,0 +1,506 @@
+import builtins
+import contextlib
+import hashlib
+import json
+import random
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO
+
+from google.cloud.storage.blob import Blob
+
+from backend.core import logger
+from backend.storage.constant import MANIFEST_FILENAME, MANIFEST_UPDATE_ATTEMPTS
+from backend.storage.exceptions import StorageBatchError, StorageConflictError
+from backend.storage.schema import StorageEntry
+
+from .base import STORAGE_TYPE, WRITE_DATA, Storage
+
+# Granularity used when hashing streamed uploads
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# filename -> {"sha256": str, "size": int}
+Manifest = dict[str, dict[str, str | int]]
+
+
+class ContentAddressedStorage(Storage):
+    """Deduplicating layout that wraps any Storage backend.
+
+    File contents are stored once as blobs keyed by their SHA-256 digest under
+    ``blob_prefix``. Every directory that holds files gets a small manifest
+    (``.manifest.json``) mapping filenames to digests, so a question folder is
+    described by a single manifest. Copying or moving a directory only copies
+    its manifests, and identical uploads share one blob.
+
+    Files written before the layout was enabled are still read, listed and
+    deleted directly through the backend.
+
+    Manifest updates are conditional writes (``write_if_version``) retried
+    on conflict, so several processes can write to the same directory
+    without losing each other's entries.
+
+    Blobs nothing refers to any more are removed by ``collect_garbage``,
+    which runs in the background after deletes, at most once every
+    ``gc_interval`` seconds (never when it is None). Each manifest directory
+    is registered under ``<blob_prefix>/manifests`` so the collector finds
+    every manifest without listing the whole bucket.
+    """
+
+    def __init__(
+        self,
+        backend: Storage,
+        blob_prefix: str = "blobs",
+        *,
+        gc_grace: float = 3600.0,
+        gc_interval: float | None = 3600.0,
+    ) -> None:
+        """
+        Args:
+            backend: Storage that holds the blobs and manifests.
+            blob_prefix: Prefix under which blobs are stored.
+            gc_grace: Seconds a blob is kept after it was last written, so a
+                write whose manifest has not landed yet keeps its blobs.
+            gc_interval: Minimum seconds between background collections.
+        """
+        self.backend = backend
+        self.blob_prefix = blob_prefix.rstrip("/")
+        self.gc_grace = gc_grace
+        self.gc_interval = gc_interval
+        self._gc_lock = threading.Lock()
+        self._gc_thread: threading.Thread | None = None
+        self._gc_started: float | None = None
+        self.set_storage_type()
+        logger.info(
+            "[ContentAddressedStorage]: Wrapping %s blob_prefix=%s",
+            backend.__class__.__name__,
+            self.blob_prefix,
+        )
+
+    def set_storage_type(self) -> STORAGE_TYPE:
+        self.mode = self.backend.get_storage_type()
+        return self.mode
+
+    def get_storage_type(self) -> STORAGE_TYPE:
+        return self.backend.get_storage_type()
+
+    def get_version(self, target: str) -> str | None:
+        entry = self._entry(target)
+        if entry is not None:
+            # Content addressed: the digest only changes with the content
+            return str(entry["sha256"])
+        return self.backend.get_version(target)
+
+    def stat(self, target: str) -> StorageEntry | None:
+        entry = self._entry(target)
+        if entry is None:
+            return self.backend.stat(target)
+        # The manifest changes whenever any file in the folder is replaced
+        manifest = self.backend.stat(self._manifest_path(self._split(target)[0]))
+        return StorageEntry(
+            path=self._to_storage_path(target),
+            size=int(entry["size"]),
+            updated=manifest.updated if manifest else None,
+            version=str(entry["sha256"]),
+        )
+
+    # ---------------------------------------------------------
+    # Reads
+    # ---------------------------------------------------------
+
+    def read(self, target: str) -> bytes | None:
+        entry = self._entry(target)
+        if entry is None:
+            return self.backend.read(target)
+        return self.backend.read(self.blob_path(str(entry["sha256"])))
+
+    def read_many(self, targets: Sequence[str]) -> dict[str, bytes | None]:
+        """Read several files, loading each directory manifest only once."""
+        manifests: dict[str, Manifest] = {}
+        blob_for: dict[str, str] = {}
+        for target in targets:
+            directory, name = self._split(target)
+            if directory not in manifests:
+                manifests[directory] = self._load_manifest(directory)
+            entry = manifests[directory].get(name)
+            blob_for[target] = self.blob_path(str(entry["sha256"])) if entry else target
+
+        contents = self.backend.read_many(list(dict.fromkeys(blob_for.values())))
+        return {target: contents[blob_for[target]] for target in targets}
+
+    def local_path(self, target: str) -> Path | None:
+        entry = self._entry(target)
+        if entry is None:
+            return self.backend.local_path(target)
+        return self.backend.local_path(self.blob_path(str(entry["sha256"])))
+
+    def exists(self, target: str) -> bool:
+        return self._entry(target) is not None or self.backend.exists(target)
+
+    def is_dir(self, target: str) -> bool:
+        return self.backend.is_dir(target)
+
+    def list(self, target: str, *, recursive: bool = False) -> Sequence[str]:
+        return [entry.path for entry in self.list_entries(target, recursive=recursive)]
+
+    def list_entries(
+        self, target: str, *, recursive: bool = False
+    ) -> builtins.list[StorageEntry]:
+        results: builtins.list[StorageEntry] = []
+        for entry in self.backend.list_entries(target, recursive=recursive):
+            listed = PurePosixPath(entry.path)
+            if listed.name != MANIFEST_FILENAME:
+                results.append(entry)
+                continue
+            # Files in a manifest share the manifest's modification time
+            directory = listed.parent.as_posix()
+            results.extend(
+                StorageEntry(f"{directory}/{name}", int(info["size"]), entry.updated)
+                for name, info in self._load_manifest(directory).items()
+            )
+        return results
+
+    def download(self, target: str) -> bytes:
+        content = self.read(target)
+        if content is None:
+            raise FileNotFoundError(f"Cannot download {target}")
+        return content
+
+    # ---------------------------------------------------------
+    # Writes
+    # ---------------------------------------------------------
+
+    def create_dir(self, target: str) -> str:
+        return self.backend.create_dir(target)
+
+    def write(
+        self,
+        target: str,
+        data: str | dict | builtins.list | bytes | bytearray,
+        *,
+        overwrite: bool = True,
+    ) -> str:
+        content = self._normalize_content(data)
+        digest = self._put_blob(content)
+        directory, name = self._split(target)
+        self._set_entries(
+            directory, {name: (digest, len(content))}, overwrite=overwrite
+        )
+        return self._to_storage_path(target)
+
+    def write_fileobj(self, target: str, fileobj: BinaryIO) -> str:
+        # Hash while spooling so large uploads are never held in memory
+        sha = hashlib.sha256()
+        size = 0
+        with tempfile.SpooledTemporaryFile(max_size=_HASH_CHUNK_SIZE) as spooled:
+            while chunk := fileobj.read(_HASH_CHUNK_SIZE):
+                sha.update(chunk)
+                size += len(chunk)
+                spooled.write(chunk)
+            digest = sha.hexdigest()
+            blob = self.blob_path(digest)
+            if self._needs_upload(blob):
+                spooled.seek(0)
+                self.backend.write_fileobj(blob, spooled)  # type: ignore[arg-type]
+        directory, name = self._split(target)
+        self._set_entries(directory, {name: (digest, size)})
+        return self._to_storage_path(target)
+
+    def write_many(
+        self,
+        items: Sequence[tuple[str, WRITE_DATA]],
+        *,
+        overwrite: bool = True,
+    ) -> builtins.list[str]:
+        """Write several files, storing each distinct blob once and updating
+        every affected manifest a single time."""
+        blobs: dict[str, bytes] = {}
+        by_directory: defaultdict[str, dict[str, tuple[str, int]]] = defaultdict(dict)
+        for target, data in items:
+            content = self._normalize_content(data)
+            digest = hashlib.sha256(content).hexdigest()
+            blobs.setdefault(digest, content)
+            directory, name = self._split(target)
+            by_directory[directory][name] = (digest, len(content))
+
+        missing = [
+            (self.blob_path(digest), content)
+            for digest, content in blobs.items()
+            if self._needs_upload(self.blob_path(digest))
+        ]
+        try:
+            self.backend.write_many(missing)
+        except StorageBatchError as e:
+            # Report failures against the requested targets; no manifest has
+            # been touched yet, so nothing needs rolling back.
+            failures: dict[str, Exception] = {}
+            for directory, entries in by_directory.items():
+                for name, (digest, _) in entries.items():
+                    error = e.failures.get(self.blob_path(digest))
+                    if error is not None:
+                        failures[f"{directory}/{name}"] = error
+            raise StorageBatchError("write", failures, []) from e
+        for directory, entries in by_directory.items():
+            self._set_entries(directory, entries, overwrite=overwrite)
+        return [self._to_storage_path(target) for target, _ in items]
+
+    # ---------------------------------------------------------
+    # Deletes, copies and moves
+    # ---------------------------------------------------------
+
+    def delete(self, target: str) -> None:
+        if not str(target).endswith("/"):
+            directory, name = self._split(target)
+            removed = False
+
+            def drop(manifest: Manifest) -> bool:
+                nonlocal removed
+                removed = manifest.pop(name, None) is not None
+                return removed
+
+            self._update_manifest(directory, drop)
+            if removed:
+                self._schedule_gc()
+                return
+        # Directories (and their manifests) or files stored outside the layout
+        self.backend.delete(target)
+        self._schedule_gc()
+
+    def copy(self, source: str, destination: str) -> str:
+        entry = self._entry(source)
+        if entry is None:
+            # Directory copies only duplicate the manifests
+            copied = self.backend.copy(source, destination)
+            self._register_tree(destination)
+            return copied
+        directory, name = self._split(destination)
+        self._set_entries(directory, {name: (str(entry["sha256"]), int(entry["size"]))})
+        return self._to_storage_path(destination)
+
+    def move(self, source: str, destination: str) -> str:
+        # Copy first so copied manifests are registered before the originals go
+        moved = self.copy(source, destination)
+        self.delete(source)
+        return moved
+
+    # ---------------------------------------------------------
+    # Blob maintenance
+    # ---------------------------------------------------------
+
+    def blob_path(self, digest: str) -> str:
+        """Return the storage path of the blob for a SHA-256 digest."""
+        return f"{self.blob_prefix}/{digest[:2]}/{digest}"
+
+    def collect_garbage(self) -> int:
+        """Delete blobs that no registered manifest references.
+
+        Blobs written within the last ``gc_grace`` seconds are kept, since
+        the write that uploaded them may not have recorded its manifest
+        entry yet. Writers re-upload a reused blob older than half the grace
+        period for the same reason. A blob is checked again right before it
+        is deleted, but a writer that reuses it in between can still lose it.
+
+        Returns:
+            Number of blobs deleted.
+        """
+        cutoff = time.time() - self.gc_grace
+        referenced: set[str] = set()
+        for marker in self._list_tree(self._registry_prefix):
+            referenced.update(self._referenced_by(marker.path, cutoff))
+
+        unused = [
+            entry.path
+            for entry in self._list_tree(self.blob_prefix)
+            if self._is_blob(entry.path)
+            and PurePosixPath(entry.path).name not in referenced
+            and self._written_before(entry, cutoff)
+        ]
+        # Skip blobs a writer refreshed since the listing
+        unused = [
+            path
+            for path in unused
+            if self._written_before(self.backend.stat(path), cutoff)
+        ]
+        self.backend.delete_many(unused)
+        logger.info("[ContentAddressedStorage]: Removed %s unused blobs", len(unused))
+        return len(unused)
+
+    def _schedule_gc(self) -> None:
+        """Collect garbage in the background, at most once per interval."""
+        if self.gc_interval is None:
+            return
+        with self._gc_lock:
+            now = time.monotonic()
+            if self._gc_thread is not None and self._gc_thread.is_alive():
+                return
+            if (
+                self._gc_started is not None
+                and now - self._gc_started < self.gc_interval
+            ):
+                return
+            self._gc_started = now
+            self._gc_thread = threading.Thread(
+                target=self._collect_in_background, name="blob-gc", daemon=True
+            )
+            self._gc_thread.start()
+
+    def _collect_in_background(self) -> None:
+        try:
+            self.collect_garbage()
+        except Exception:
+            logger.exception("[ContentAddressedStorage]: Garbage collection failed")
+
+    def _referenced_by(self, marker: str, cutoff: float) -> set[str]:
+        """Digests used by a registered manifest; drops stale registrations."""
+        raw, version = self.backend.read_versioned(marker)
+        if raw is None or version is None:
+            return set()
+        info = json.loads(raw)
+        manifest = self._load_manifest(info["directory"])
+        if manifest:
+            return {str(entry["sha256"]) for entry in manifest.values()}
+        # A fresh registration may belong to a manifest that is being created
+        if info["registered"] < cutoff:
+            with contextlib.suppress(StorageConflictError):
+                self.backend.delete_if_version(marker, version)
+        return set()
+
+    def _needs_upload(self, blob: str) -> bool:
+        """Whether a blob must be written before a manifest may refer to it.
+
+        Old blobs are written again so the collector, which spares blobs
+        written within the grace period, cannot remove one this write uses.
+        """
+        return self._written_before(
+            self.backend.stat(blob), time.time() - self.gc_grace / 2, missing=True
+        )
+
+    @staticmethod
+    def _written_before(
+        entry: StorageEntry | None, cutoff: float, *, missing: bool = False
+    ) -> bool:
+        if entry is None or entry.updated is None:
+            return missing
+        return entry.updated < cutoff
+
+    def _is_blob(self, path: str) -> bool:
+        listed = PurePosixPath(path)
+        return len(listed.parent.name) == 2 and len(listed.name) == 64
+
+    def _list_tree(self, prefix: str) -> builtins.list[StorageEntry]:
+        prefix = prefix.rstrip("/")
+        if not self.backend.exists(f"{prefix}/"):
+            return []
+        return self.backend.list_entries(prefix, recursive=True)
+
+    @property
+    def _registry_prefix(self) -> str:
+        return f"{self.blob_prefix}/manifests"
+
+    def _register(self, directory: str) -> None:
+        """Record that ``directory`` holds a manifest, for the collector."""
+        digest = hashlib.sha256(directory.encode("utf-8")).hexdigest()
+        self.backend.write(
+            f"{self._registry_prefix}/{digest}",
+            {"directory": directory, "registered": time.time()},
+        )
+
+    def _register_tree(self, root: str) -> None:
+        for entry in self._list_tree(root):
+            listed = PurePosixPath(entry.path)
+            if listed.name == MANIFEST_FILENAME:
+                self._register(listed.parent.as_posix())
+
+    # ---------------------------------------------------------
+    # Manifest helpers
+    # ---------------------------------------------------------
+
+    def _put_blob(self, content: bytes) -> str:
+        digest = hashlib.sha256(content).hexdigest()
+        blob = self.blob_path(digest)
+        if self._needs_upload(blob):
+            self.backend.write(blob, content)
+        return digest
+
+    def _entry(self, target: str | Path | Blob) -> dict[str, str | int] | None:
+        if str(target).endswith("/"):
+            return None
+        directory, name = self._split(target)
+        return self._load_manifest(directory).get(name)
+
+    def _set_entries(
+        self,
+        directory: str,
+        entries: dict[str, tuple[str, int]],
+        *,
+        overwrite: bool = True,
+    ) -> None:
+        """Record (digest, size) pairs for files in a directory manifest."""
+
+        def record(manifest: Manifest) -> bool:
+            if not overwrite:
+                existing = sorted(set(entries) & set(manifest))
+                if existing:
+                    raise FileExistsError(f"{directory}/{existing[0]} already exists")
+            for name, (digest, size) in entries.items():
+                manifest[name] = {"sha256": digest, "size": size}
+            return True
+
+        self._update_manifest(directory, record)
+
+    def _update_manifest(
+        self, directory: str, change: Callable[[Manifest], bool]
+    ) -> None:
+        """Apply ``change`` to a directory manifest as an optimistic update.
+
+        The manifest is only replaced if it is still at the version that was
+        read; otherwise ``change`` is applied again to the newer manifest.
+        ``change`` edits the manifest in place and returns False when there
+        is nothing to write.
+
+        Raises:
+            StorageConflictError: If every attempt lost to another writer.
+        """
+        path = self._manifest_path(directory)
+        for attempt in range(MANIFEST_UPDATE_ATTEMPTS):
+            raw, version = self.backend.read_versioned(path)
+            manifest = self._parse_manifest(raw)
+            if not change(manifest):
+                return
+            try:
+                if manifest:
+                    if version is None:
+                        self._register(directory)
+                    data = {"files": dict(sorted(manifest.items()))}
+                    self.backend.write_if_version(path, data, version)
+                elif version is not None:
+                    self.backend.delete_if_version(path, version)
+                return
+            except StorageConflictError:
+                logger.debug("[ContentAddressedStorage]: %s changed, retrying", path)
+                time.sleep(random.uniform(0, 0.05 * 2**attempt))
+        raise StorageConflictError(path)
+
+    def _load_manifest(self, directory: str) -> Manifest:
+        try:
+            raw = self.backend.read(self._manifest_path(directory))
+        except (FileNotFoundError, NotADirectoryError):
+            return {}
+        return self._parse_manifest(raw)
+
+    @staticmethod
+    def _parse_manifest(raw: bytes | None) -> Manifest:
+        if not raw:
+            return {}
+        return json.loads(raw).get("files", {})
+
+    def _manifest_path(self, directory: str) -> str:
+        return f"{directory}/{MANIFEST_FILENAME}"
+
+    def _split(self, target: str | Path | Blob) -> tuple[str, str]:
+        """Split a file target into its directory and filename."""
+        path = PurePosixPath(self._to_storage_path(target).rstrip("/"))
+        return path.parent.as_posix(), path.name
@@ -1,5 +1,4 @@
 # --- Standard Library ---
-import base64
 import mimetypes
 from typing import cast
 
@@ -16,7 +15,7 @@ from backend.storage.exceptions import (
     InvalidUploadFileError,
     UnsupportedFileInputError,
 )
-from backend.storage.schema import FILE, FileData
+from backend.storage.schema import FILE, BinaryFileData, FileData
 
 
 class UploadFileDataConverter:
@@ -95,14 +94,18 @@ class UploadFileDataConverter:
                     ) from e
 
                 if self._is_image_file(filename=filename, mime_type=mime_type):
-                    content = base64.b64encode(raw).decode("utf-8")
-                else:
-                    try:
-                        content = raw.decode("utf-8")
-                    except UnicodeDecodeError as e:
-                        raise FileContentDecodeError(
-                            f"Could not decode '{filename}' as UTF-8 text"
-                        ) from e
+                    # Images stay binary; they are only encoded for JSON responses
+                    return BinaryFileData(
+                        filename=filename,
+                        content=raw,
+                        mime_type=mime_type or "application/octet-stream",
+                    )
+                try:
+                    content = raw.decode("utf-8")
+                except UnicodeDecodeError as e:
+                    raise FileContentDecodeError(
+                        f"Could not decode '{filename}' as UTF-8 text"
+                    ) from e
 
                 return FileData(
                     filename=filename,
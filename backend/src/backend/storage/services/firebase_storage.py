@@ -1,13 +1,20 @@
+import builtins
+import contextlib
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Literal, cast
+from typing import BinaryIO, Literal, cast
 
 from firebase_admin import storage
+from google.api_core.exceptions import NotFound, PreconditionFailed
 from google.cloud.storage.blob import Blob
 
 from backend.core import logger
+from backend.storage.constant import GCS_BATCH_SIZE, MAX_CONCURRENT_STORAGE_OPS
+from backend.storage.exceptions import StorageBatchError, StorageConflictError
+from backend.storage.schema import StorageEntry
 
-from .base import STORAGE_TYPE, Storage
+from .base import STORAGE_TYPE, WRITE_DATA, Storage
 
 
 class FbStorage(Storage):
@@ -65,6 +72,13 @@ class FbStorage(Storage):
 
         return str(blob.name)
 
+    def write_fileobj(self, target: str, fileobj: BinaryIO) -> str:
+        key = self._to_blob_key(target).rstrip("/")
+        blob: Blob = self.bucket.blob(key)
+        # Uploads in chunks (resumable for large objects) without buffering
+        blob.upload_from_file(fileobj, content_type="application/octet-stream")
+        return str(blob.name)
+
     def read(self, target: str) -> bytes | None:
         key = self._to_blob_key(target).rstrip("/")
         if self._exists_file(key):
@@ -72,21 +86,81 @@ class FbStorage(Storage):
         logger.warn(f"Cannot read blob. {key} is not file")
         return None
 
+    def get_version(self, target: str | Path | Blob) -> str | None:
+        entry = self.stat(target)
+        return entry.version if entry else None
+
+    def read_versioned(self, target: str) -> tuple[bytes | None, str | None]:
+        blob = self.bucket.blob(self._to_blob_key(target).rstrip("/"))
+        try:
+            content = blob.download_as_bytes()
+        except NotFound:
+            return None, None
+        # The download response carries the generation of the bytes it returned
+        return content, str(blob.generation)
+
+    def write_if_version(
+        self, target: str, data: WRITE_DATA, version: str | None
+    ) -> str:
+        key = self._to_blob_key(target).rstrip("/")
+        blob = self.bucket.blob(key)
+        try:
+            # Generation 0 only matches when the object does not exist
+            blob.upload_from_string(
+                self._normalize_content(data),
+                content_type="application/octet-stream",
+                if_generation_match=int(version) if version else 0,
+            )
+        except PreconditionFailed as e:
+            raise StorageConflictError(key) from e
+        return key
+
+    def delete_if_version(self, target: str, version: str) -> None:
+        key = self._to_blob_key(target).rstrip("/")
+        try:
+            self.bucket.blob(key).delete(if_generation_match=int(version))
+        except (PreconditionFailed, NotFound) as e:
+            raise StorageConflictError(key) from e
+
+    def stat(self, target: str | Path | Blob) -> StorageEntry | None:
+        key = self._to_blob_key(target).rstrip("/")
+        if not key:
+            return None
+        # Metadata-only request; the generation changes on every overwrite
+        blob = self.bucket.get_blob(key)
+        if blob is None or blob.generation is None:
+            return None
+        return StorageEntry(
+            path=key,
+            size=blob.size,
+            updated=blob.updated.timestamp() if blob.updated else None,
+            version=str(blob.generation),
+        )
+
     def delete(self, target: str | Path | Blob) -> None:
         key = self._to_blob_key(target)
         logger.info(f"Resolved key {key}")
         if key.endswith("/"):
-            for blob in self.bucket.list_blobs(prefix=key):
-                blob.delete()
-                logger.info(
-                    f"Deleting {blob}",
-                )
+            blobs = list(self.bucket.list_blobs(prefix=key))
+            logger.info("Deleting %s blobs under %s", len(blobs), key)
+            self._delete_blobs(blobs)
             return
 
         blob = self.bucket.blob(key)
         if blob.exists():
             blob.delete()
 
+    def delete_many(self, targets: Sequence[str | Path | Blob]) -> None:
+        """Delete files and prefixes with GCS batch requests."""
+        blobs: list[Blob] = []
+        for target in targets:
+            key = self._to_blob_key(target)
+            if key.endswith("/"):
+                blobs.extend(self.bucket.list_blobs(prefix=key))
+            elif key:
+                blobs.append(self.bucket.blob(key))
+        self._delete_blobs(blobs)
+
     def list(
         self, target: str | Path | Blob, *, recursive: bool = False
     ) -> Sequence[str]:
@@ -115,6 +189,27 @@ class FbStorage(Storage):
         logger.info("Non-recursive results: %s", files)
         return files
 
+    def list_entries(
+        self, target: str | Path | Blob, *, recursive: bool = False
+    ) -> builtins.list[StorageEntry]:
+        key = self._to_blob_key(target).strip("/")
+        prefix = f"{key}/" if key else ""
+        if not self.exists(prefix):
+            raise ValueError("Prefix does not exists")
+        # The listing response already carries size and update time
+        blobs = self.bucket.list_blobs(
+            prefix=prefix, delimiter=None if recursive else "/"
+        )
+        return [
+            StorageEntry(
+                path=blob.name,
+                size=blob.size,
+                updated=blob.updated.timestamp() if blob.updated else None,
+            )
+            for blob in blobs
+            if blob.name != prefix and not blob.name.endswith("/")
+        ]
+
     def download(self, target: str | Path | Blob) -> bytes:
         raise NotImplementedError("Download for firebase not implemented")
         key = self._to_blob_key(target)
@@ -123,56 +218,58 @@ class FbStorage(Storage):
             raise ValueError("[FB] Failed to download blob. Blob does not exist")
         return blob.download_as_bytes()
 
-    # TODO: implement recursive blob download using list_blobs.
     def copy(
         self,
         source: str | Path | Blob,
         destination: str | Path | Blob,
     ) -> str:
+        """Copy a blob, or every blob under a prefix, using server-side copies.
 
+        No object bytes pass through this process; GCS copies the data
+        internally and per-blob requests are issued concurrently.
+        """
         source_key = self._to_blob_key(source)
         dest_key = self._to_blob_key(destination)
 
-        source_blob = self.bucket.get_blob(source_key)
+        if not source_key.endswith("/"):
+            source_blob = self.bucket.get_blob(source_key)
+            if source_blob is not None:
+                self._copy_blob(source_blob, dest_key)
+                return dest_key
 
-        if source_blob is None or not source_blob.exists():
+        source_prefix = source_key.rstrip("/") + "/"
+        dest_prefix = dest_key.rstrip("/") + "/"
+        blobs = list(self.bucket.list_blobs(prefix=source_prefix))
+        if not blobs:
             raise ValueError("Source blob does not exist")
 
-        # Download content
-        content = source_blob.download_as_bytes()
-
-        # Create destination blob
-        dest_blob = self.bucket.blob(dest_key)
-
-        # Overwrite safely
-        dest_blob.upload_from_string(content)
-
-        return dest_key
+        self._copy_blobs(blobs, source_prefix, dest_prefix)
+        return dest_prefix
 
     def move(self, source: str | Path | Blob, destination: str | Path | Blob) -> str:
+        """Move a prefix or single blob via server-side copies and batched deletes."""
         try:
-            source_prefix = self._to_blob_key(source)
-            dest_prefix = self._to_blob_key(destination)
+            source_key = self._to_blob_key(source)
+            dest_key = self._to_blob_key(destination)
+
+            if not source_key.endswith("/"):
+                source_blob = self.bucket.get_blob(source_key)
+                if source_blob is not None:
+                    self._copy_blob(source_blob, dest_key)
+                    self._delete_blobs([source_blob])
+                    return dest_key
 
-            if not source_prefix.endswith("/"):
-                source_prefix += "/"
-            if not dest_prefix.endswith("/"):
-                dest_prefix += "/"
+            source_prefix = source_key.rstrip("/") + "/"
+            dest_prefix = dest_key.rstrip("/") + "/"
 
             blobs = list(self.bucket.list_blobs(prefix=source_prefix))
 
             if not blobs:
                 raise ValueError("Source path does not exist or is empty")
 
-            for blob in blobs:
-                # Compute new blob name
-                new_name = blob.name.replace(source_prefix, dest_prefix, 1)
-
-                # Use native GCS copy (faster, server-side)
-                # new_blob = self.bucket.cop(blob, self.bucket, new_name)
-                self.bucket.blob(new_name).upload_from_string(blob.download_as_bytes())
-                # Delete original
-                blob.delete()
+            # Copy everything first so a failed copy never loses the source
+            self._copy_blobs(blobs, source_prefix, dest_prefix)
+            self._delete_blobs(blobs)
 
             return dest_prefix
 
@@ -186,6 +283,68 @@ class FbStorage(Storage):
 
     # Custom methods
 
+    def _copy_blob(self, blob: Blob, dest_key: str) -> Blob:
+        """Server-side copy of one blob within the bucket."""
+        return self.bucket.copy_blob(blob, self.bucket, dest_key)
+
+    def _copy_blobs(
+        self, blobs: Sequence[Blob], source_prefix: str, dest_prefix: str
+    ) -> None:
+        """Concurrently copy blobs from one prefix to another."""
+
+        def _copy(blob: Blob) -> Blob:
+            new_name = dest_prefix + blob.name.removeprefix(source_prefix)
+            return self._copy_blob(blob, new_name)
+
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_STORAGE_OPS) as pool:
+            # Consume the iterator so the first failure is raised here
+            list(pool.map(_copy, blobs))
+
+    def _delete_blobs(self, blobs: Sequence[Blob]) -> None:
+        """Delete blobs using GCS batch requests.
+
+        A batch only reports its last failed sub-request, so a chunk whose
+        batch fails (or an endpoint without batch support, e.g. some emulator
+        versions) is retried one blob at a time to find out which deletes
+        failed. A missing blob counts as deleted.
+
+        Raises:
+            StorageBatchError: If any blob could not be deleted.
+        """
+        failures: dict[str, Exception] = {}
+        for start in range(0, len(blobs), GCS_BATCH_SIZE):
+            chunk = blobs[start : start + GCS_BATCH_SIZE]
+            try:
+                with self.bucket.client.batch():
+                    for blob in chunk:
+                        blob.delete()
+            except Exception as e:
+                logger.warning("[Firebase]: Batch delete failed (%s); retrying", e)
+                failures.update(self._delete_each(chunk))
+
+        if failures:
+            succeeded = [str(b.name) for b in blobs if b.name not in failures]
+            raise StorageBatchError("delete", failures, succeeded)
+
+    def _delete_each(self, blobs: Sequence[Blob]) -> dict[str, Exception]:
+        """Delete blobs concurrently, one request each, collecting failures."""
+
+        def delete(blob: Blob) -> Exception | None:
+            try:
+                with contextlib.suppress(NotFound):
+                    blob.delete()
+            except Exception as e:
+                return e
+            return None
+
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_STORAGE_OPS) as pool:
+            results = pool.map(delete, blobs)
+            return {
+                str(blob.name): error
+                for blob, error in zip(blobs, results, strict=True)
+                if error is not None
+            }
+
     def _to_blob_key(self, value: str | Path | Blob) -> str:
         """
         Convert input to a cloud object key without filesystem normalization.
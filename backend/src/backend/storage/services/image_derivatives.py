@@ -0,0 +1,168 @@
+import asyncio
+import base64
+import binascii
+import functools
+import hashlib
+import io
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Literal
+
+from PIL import Image, UnidentifiedImageError
+
+from backend.core import logger
+from backend.storage.constant import BASE64_IMAGE_PREFIXES
+from backend.storage.schema import StorageEntry
+
+from .async_storage import run_blocking
+from .base import Storage
+
+DERIVED_FORMAT = Literal["webp", "avif", "png"]
+
+DERIVED_MEDIA_TYPES: dict[str, str] = {
+    "webp": "image/webp",
+    "avif": "image/avif",
+    "png": "image/png",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ImageTransform:
+    """Parameters describing one derivative of a stored image."""
+
+    format: DERIVED_FORMAT
+    width: int | None = None
+    quality: int = 80
+
+    @property
+    def media_type(self) -> str:
+        return DERIVED_MEDIA_TYPES[self.format]
+
+    def cache_key(self, source_version: str) -> str:
+        """Digest identifying this transform of a specific source version."""
+        params = f"{source_version}|{self.width or ''}|{self.format}|{self.quality}"
+        return hashlib.sha256(params.encode("utf-8")).hexdigest()
+
+
+def render_derivative(
+    content: bytes, width: int | None, format: DERIVED_FORMAT, quality: int
+) -> bytes:
+    """Resize and re-encode an image.
+
+    Runs in a worker process, so it only takes and returns plain values. The
+    aspect ratio is preserved and images are never scaled up. Legacy images
+    stored as base64 text are decoded first.
+
+    Raises:
+        ValueError: If ``content`` is not a readable image.
+    """
+    if content.startswith(BASE64_IMAGE_PREFIXES):
+        try:
+            content = base64.b64decode(content)
+        except binascii.Error as e:
+            raise ValueError(f"Cannot decode base64 image: {e}") from e
+    try:
+        image = Image.open(io.BytesIO(content))
+        image.load()
+    except (UnidentifiedImageError, OSError) as e:
+        raise ValueError(f"Cannot decode image: {e}") from e
+
+    if width and image.width > width:
+        height = max(1, round(image.height * width / image.width))
+        image = image.resize((width, height), Image.Resampling.LANCZOS)
+
+    if image.mode not in ("RGB", "RGBA"):
+        has_alpha = "A" in image.getbands() or "transparency" in image.info
+        image = image.convert("RGBA" if has_alpha else "RGB")
+
+    out = io.BytesIO()
+    if format == "png":
+        image.save(out, format="PNG", optimize=True)
+    else:
+        image.save(out, format=format.upper(), quality=quality)
+    return out.getvalue()
+
+
+@functools.lru_cache(maxsize=1)
+def _process_pool(max_workers: int) -> ProcessPoolExecutor:
+    # Spawned workers do not inherit the server's threads or open connections
+    return ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+class ImageDerivativeCache:
+    """Produce resized/re-encoded images and keep them in storage.
+
+    Derivatives are stored under ``prefix`` keyed by the source image's
+    version and the transform parameters, so each one is rendered once and
+    a new upload of the source automatically gets fresh derivatives. Image
+    processing is CPU bound and runs in a process pool.
+    """
+
+    def __init__(
+        self, storage: Storage, prefix: str = "derived", *, max_workers: int = 2
+    ) -> None:
+        self.storage = storage
+        self.prefix = prefix.rstrip("/")
+        self.max_workers = max_workers
+
+    def derived_path(self, key: str, transform: ImageTransform) -> str:
+        """Storage path of the derivative with the given cache key."""
+        return f"{self.prefix}/{key[:2]}/{key}.{transform.format}"
+
+    async def get(
+        self, source: str, transform: ImageTransform
+    ) -> tuple[str, StorageEntry] | None:
+        """Return the stored derivative of ``source``, rendering it if needed.
+
+        Args:
+            source: Storage path of the original image.
+            transform: Size, format and quality of the derivative.
+
+        Returns:
+            The derivative's storage path and an entry whose version is the
+            derivative's cache key, or None when the source does not exist.
+
+        Raises:
+            ValueError: If the source is not a readable image.
+        """
+        source_entry = await run_blocking(self.storage.stat, source)
+        if source_entry is None or not source_entry.version:
+            return None
+
+        key = transform.cache_key(source_entry.version)
+        path = self.derived_path(key, transform)
+        entry = await run_blocking(self.storage.stat, path)
+        if entry is None:
+            content = await self.storage.aread(source)
+            if content is None:
+                return None
+            rendered = await self._render(content, transform)
+            await self.storage.awrite(path, rendered)
+            logger.info(
+                "[ImageDerivativeCache]: Rendered %s (%s bytes) from %s",
+                path,
+                len(rendered),
+                source,
+            )
+            entry = await run_blocking(self.storage.stat, path)
+
+        return path, StorageEntry(
+            path=path,
+            size=entry.size if entry else None,
+            updated=source_entry.updated,
+            version=key,
+        )
+
+    async def _render(self, content: bytes, transform: ImageTransform) -> bytes:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _process_pool(self.max_workers),
+            render_derivative,
+            content,
+            transform.width,
+            transform.format,
+            transform.quality,
+        )
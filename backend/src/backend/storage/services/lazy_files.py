@@ -0,0 +1,82 @@
+import mimetypes
+from collections import defaultdict
+from collections.abc import Sequence
+from pathlib import PurePosixPath
+
+from pydantic import BaseModel, PrivateAttr
+
+from backend.storage.schema import BinaryFileData, StorageEntry
+
+from .base import Storage
+
+
+class LazyFileData(BaseModel):
+    """Handle to a stored file whose content is read on first access.
+
+    Built from a storage listing, so the filename, size, update time and mime
+    type are available without downloading anything. Serializing a handle
+    only emits that metadata. Use ``prefetch`` to load many handles with a
+    single batch read.
+    """
+
+    filename: str
+    mime_type: str = "application/octet-stream"
+    size: int | None = None
+    # Last modification time as a POSIX timestamp
+    updated: float | None = None
+
+    _path: str = PrivateAttr()
+    _storage: Storage = PrivateAttr()
+    _content: bytes | None = PrivateAttr(default=None)
+
+    @classmethod
+    def from_entry(cls, storage: Storage, entry: StorageEntry) -> "LazyFileData":
+        mime_type, _ = mimetypes.guess_type(entry.path)
+        handle = cls(
+            filename=PurePosixPath(entry.path).name,
+            mime_type=mime_type or "application/octet-stream",
+            size=entry.size,
+            updated=entry.updated,
+        )
+        handle._path = entry.path
+        handle._storage = storage
+        return handle
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def loaded(self) -> bool:
+        return self._content is not None
+
+    async def aread(self) -> bytes:
+        """Return the file content, reading it from storage the first time."""
+        if self._content is None:
+            self._content = await self._storage.aread(self._path) or b""
+        return self._content
+
+    async def load(self) -> BinaryFileData:
+        """Return the file as BinaryFileData, reading it if needed."""
+        return BinaryFileData(
+            filename=self.filename,
+            content=await self.aread(),
+            mime_type=self.mime_type,
+        )
+
+
+async def prefetch(files: Sequence[LazyFileData]) -> None:
+    """Load every handle that has not been read yet.
+
+    Handles are grouped by storage backend and each group is fetched with one
+    ``aread_many`` call.
+    """
+    pending: defaultdict[int, list[LazyFileData]] = defaultdict(list)
+    for handle in files:
+        if not handle.loaded:
+            pending[id(handle._storage)].append(handle)
+
+    for handles in pending.values():
+        contents = await handles[0]._storage.aread_many([h.path for h in handles])
+        for handle in handles:
+            handle._content = contents.get(handle.path) or b""
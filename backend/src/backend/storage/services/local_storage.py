@@ -1,17 +1,40 @@
+import builtins
+import hashlib
+import os
 import shutil
-from collections.abc import Sequence
+import sys
+import threading
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Literal, cast
+from typing import BinaryIO, Literal, cast
 
 from google.cloud.storage.blob import Blob
 
 from backend.core import logger
+from backend.storage.exceptions import StorageConflictError
+from backend.storage.schema import StorageEntry
 
-from .base import STORAGE_TYPE, Storage
+from .base import STORAGE_TYPE, WRITE_DATA, Storage
+
+if sys.platform != "win32":
+    import fcntl
 
 
 class LocalStorage(Storage):
-    def __init__(self) -> None:
+    def __init__(self, *, index: bool = False) -> None:
+        """
+        Args:
+            index: Keep an in-memory index of directory listings. Entries are
+                dropped whenever this instance changes a path below them, so
+                only enable it when no other process writes to the same tree.
+        """
+        # (resolved directory, recursive) -> entries
+        self._index: dict[tuple[str, bool], list[StorageEntry]] | None = (
+            {} if index else None
+        )
+        self._index_lock = threading.Lock()
+        self._update_lock = threading.Lock()
         self.set_storage_type()
 
     def set_storage_type(self) -> Literal["cloud"] | Literal["local"]:
@@ -37,6 +60,7 @@ class LocalStorage(Storage):
         if path.is_file():
             raise ValueError("Cannot create directory. Received file")
         path.mkdir(parents=True, exist_ok=True)
+        self._invalidate_index(path)
         return path.as_posix()
 
     def read(self, target: str | Path | Blob) -> bytes | None:
@@ -56,8 +80,106 @@ class LocalStorage(Storage):
 
         path.parent.mkdir(parents=True, exist_ok=True)
         path.write_bytes(self._normalize_content(data))
+        self._invalidate_index(path)
+        return storage_path
+
+    def write_fileobj(self, target: str, fileobj: BinaryIO) -> str:
+        storage_path = self._to_storage_path(target)
+        path = self._resolve(storage_path)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as out:
+            shutil.copyfileobj(fileobj, out)
+        self._invalidate_index(path)
         return storage_path
 
+    def get_version(self, target: str | Path | Blob) -> str | None:
+        entry = self.stat(target)
+        return entry.version if entry else None
+
+    # Conditional updates compare content digests: mtimes are too coarse to
+    # tell apart two same-size writes made within a few milliseconds.
+
+    def read_versioned(self, target: str) -> tuple[bytes | None, str | None]:
+        path = self._resolve(self._to_storage_path(target))
+        try:
+            with self._locked(path.parent, exclusive=False):
+                content = path.read_bytes()
+        except (FileNotFoundError, NotADirectoryError):
+            return None, None
+        return content, hashlib.sha256(content).hexdigest()
+
+    def write_if_version(
+        self, target: str, data: WRITE_DATA, version: str | None
+    ) -> str:
+        storage_path = self._to_storage_path(target)
+        path = self._resolve(storage_path)
+        content = self._normalize_content(data)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._locked(path.parent, exclusive=True):
+            if self._digest_of(path) != version:
+                raise StorageConflictError(storage_path)
+            path.write_bytes(content)
+        self._invalidate_index(path)
+        return storage_path
+
+    def delete_if_version(self, target: str, version: str) -> None:
+        storage_path = self._to_storage_path(target)
+        path = self._resolve(storage_path)
+        try:
+            with self._locked(path.parent, exclusive=True):
+                if self._digest_of(path) != version:
+                    raise StorageConflictError(storage_path)
+                path.unlink()
+        except (FileNotFoundError, NotADirectoryError) as e:
+            raise StorageConflictError(storage_path) from e
+        self._invalidate_index(path)
+
+    @staticmethod
+    def _digest_of(path: Path) -> str | None:
+        try:
+            return hashlib.sha256(path.read_bytes()).hexdigest()
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
+    @contextmanager
+    def _locked(self, directory: Path, *, exclusive: bool) -> Iterator[None]:
+        """Lock ``directory`` for a conditional update or a consistent read.
+
+        flock excludes other processes on this host as well as other threads;
+        where it is unavailable only updates made by this instance are
+        serialized.
+        """
+        if sys.platform == "win32":
+            with self._update_lock:
+                yield
+            return
+        fd = os.open(directory, os.O_RDONLY)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            yield
+        finally:
+            os.close(fd)
+
+    def stat(self, target: str | Path | Blob) -> StorageEntry | None:
+        path = self._resolve(self._to_storage_path(target))
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        if not path.is_file():
+            return None
+        return StorageEntry(
+            path=path.as_posix(),
+            size=stat.st_size,
+            updated=stat.st_mtime,
+            version=f"{stat.st_mtime_ns}-{stat.st_size}",
+        )
+
+    def local_path(self, target: str | Path | Blob) -> Path | None:
+        path = self._resolve(self._to_storage_path(target))
+        return path if path.is_file() else None
+
     def download(self, target: str) -> bytes:
         raise NotImplementedError("Cannot download question not implemented")
 
@@ -68,20 +190,62 @@ class LocalStorage(Storage):
             path.unlink()
         elif path.is_dir():
             shutil.rmtree(path)
+        self._invalidate_index(path)
 
     def list(self, target: str, *, recursive: bool = False) -> Sequence[str]:
-        storage_path = self._to_storage_path(target)
-        base = self._resolve(storage_path)
+        return [entry.path for entry in self.list_entries(target, recursive=recursive)]
+
+    def list_entries(
+        self, target: str, *, recursive: bool = False
+    ) -> builtins.list[StorageEntry]:
+        base = self._resolve(self._to_storage_path(target))
+        key = (base.as_posix(), recursive)
+        if self._index is not None:
+            with self._index_lock:
+                cached = self._index.get(key)
+            if cached is not None:
+                return list(cached)
+
+        entries = list(self._scan(base, recursive))
+        if self._index is not None:
+            with self._index_lock:
+                self._index[key] = entries
+        return list(entries)
 
-        if not base.exists():
-            return []
+    def _scan(self, base: Path, recursive: bool) -> Iterator[StorageEntry]:
+        """Walk a directory with os.scandir, reusing each entry's cached type."""
+        pending = [base.as_posix()]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as it:
+                    for entry in it:
+                        if entry.is_file():
+                            stat = entry.stat()
+                            yield StorageEntry(
+                                path=entry.path.replace(os.sep, "/"),
+                                size=stat.st_size,
+                                updated=stat.st_mtime,
+                            )
+                        elif recursive and entry.is_dir():
+                            pending.append(entry.path)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
 
-        iterator = base.rglob("*") if recursive else base.glob("*")
-        results = []
-        for path in iterator:
-            if path.is_file():
-                results.append(self._to_storage_path(path))
-        return results
+    def _invalidate_index(self, *targets: str | Path | Blob) -> None:
+        """Drop cached listings affected by a change to any of ``targets``."""
+        if not self._index:
+            return
+        changed = [self._resolve(self._to_storage_path(t)).as_posix() for t in targets]
+        with self._index_lock:
+            for key in list(self._index):
+                directory = key[0]
+                if any(
+                    path == directory
+                    or path.startswith(directory + "/")
+                    or directory.startswith(path + "/")
+                    for path in changed
+                ):
+                    del self._index[key]
 
     def move(self, source: str, destination: str) -> str:
         # Probably redundatn but ensure we have the path
@@ -121,4 +285,5 @@ class LocalStorage(Storage):
                 f"Failed to move file received {src_path} cannot determine path"
             )
 
+        self._invalidate_index(dst_path)
         return str(dst_storage)
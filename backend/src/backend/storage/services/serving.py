@@ -0,0 +1,45 @@
+from fastapi.responses import FileResponse, Response
+
+from .base import Storage
+
+
+def file_response(
+    storage: Storage,
+    target: str,
+    *,
+    media_type: str,
+    headers: dict[str, str] | None = None,
+    filename: str | None = None,
+) -> Response | None:
+    """Build an HTTP response for a stored file.
+
+    Files that exist on local disk are returned as a ``FileResponse`` so the
+    server can use sendfile and honour ``Range`` requests; other backends fall
+    back to reading the object into memory.
+
+    Args:
+        storage: Storage backend holding the file.
+        target: Storage path/key of the file.
+        media_type: Content type of the response.
+        headers: Extra response headers.
+        filename: When set, the file is sent as an attachment with this name.
+
+    Returns:
+        The response, or None if the file does not exist.
+    """
+    path = storage.local_path(target)
+    if path is not None:
+        return FileResponse(
+            path, media_type=media_type, headers=headers, filename=filename
+        )
+
+    try:
+        content = storage.read(target)
+    except FileNotFoundError:
+        return None
+    if content is None:
+        return None
+    headers = dict(headers or {})
+    if filename:
+        headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return Response(content=content, media_type=media_type, headers=headers)
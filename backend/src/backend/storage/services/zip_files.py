@@ -1,12 +1,34 @@
+import asyncio
+import contextlib
 import io
+import tempfile
 import zipfile
+from collections import deque
+from collections.abc import AsyncIterator, Buffer, Iterable, Sequence
 from pathlib import Path, PurePosixPath
+from typing import BinaryIO, cast
 
 from fastapi import UploadFile
 
+from backend.core import logger
+from backend.storage.constant import (
+    MAX_CONCURRENT_STORAGE_OPS,
+    MAX_ZIP_ARCHIVE_SIZE_MB,
+    MAX_ZIP_EXTRACTED_SIZE_MB,
+    MAX_ZIP_MEMBERS,
+)
+from backend.storage.exceptions import (
+    StorageBatchError,
+    ZipArchiveError,
+    ZipLimitExceededError,
+)
 from backend.utils import safe_dir_name
 
-from .base import Storage
+from .async_storage import run_blocking
+from .base import WRITE_DATA, Storage
+
+# Read/write granularity when spooling uploads and decompressing members
+ZIP_CHUNK_SIZE = 1024 * 1024
 
 
 def extract_zip_files(content: bytes) -> dict[str, bytes]:
@@ -21,15 +43,11 @@ def extract_zip_files(content: bytes) -> dict[str, bytes]:
     extracted_files = {}
     with zipfile.ZipFile(io.BytesIO(content), "r") as z:
         for info in z.infolist():
-            # Skip directories
-            if info.is_dir():
-                continue
-            # Clean up name
-            member_path = PurePosixPath(info.filename.replace("\\", "/"))
-            # Ensure nto absoulte
-            if member_path.is_absolute() or ".." in member_path.parts:
+            # Skips directories and unsafe (absolute or parent) paths
+            member_path = _member_path(info)
+            if member_path is None:
                 continue
-            extracted_files[member_path] = z.read(member_path.as_posix())
+            extracted_files[member_path] = z.read(info)
     return extracted_files
 
 
@@ -50,44 +68,294 @@ def download_zip(
     return buffer.getvalue()
 
 
+class _ZipStreamBuffer(io.RawIOBase):
+    """Write-only, non-seekable sink that hands written bytes back in chunks.
+
+    ``zipfile`` falls back to data descriptors when the target cannot seek, so
+    each member can be emitted as soon as it has been compressed.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b: Buffer) -> int:  # type: ignore[override]
+        data = bytes(b)
+        self._chunks.append(data)
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def stream_zip(
+    storage: Storage,
+    entries: Iterable[tuple[str, str]],
+    *,
+    max_in_flight: int = MAX_CONCURRENT_STORAGE_OPS,
+) -> AsyncIterator[bytes]:
+    """Stream a ZIP archive built from stored files.
+
+    Up to ``max_in_flight`` files are read from storage concurrently ahead of
+    the writer. Each member is compressed off the event loop and its bytes are
+    yielded immediately, so memory stays bounded by the read-ahead window
+    rather than the size of the archive.
+
+    Args:
+        storage: Storage backend the files are read from.
+        entries: (archive name, storage target) pairs, in archive order.
+        max_in_flight: Maximum number of concurrent storage reads.
+
+    Yields:
+        Consecutive chunks of the ZIP archive.
+    """
+    pending: deque[tuple[str, asyncio.Task[bytes | None]]] = deque()
+    remaining = iter(entries)
+
+    def fill() -> None:
+        while len(pending) < max_in_flight:
+            entry = next(remaining, None)
+            if entry is None:
+                return
+            arcname, target = entry
+            task = asyncio.create_task(storage.aread(target))
+            pending.append((arcname, task))
+
+    buffer = _ZipStreamBuffer()
+    try:
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as z:
+            fill()
+            while pending:
+                arcname, task = pending.popleft()
+                content = await task
+                fill()
+                if content is None:
+                    logger.warning("Skipping unreadable archive entry %s", arcname)
+                    continue
+                await asyncio.to_thread(z.writestr, arcname, content)
+                if chunk := buffer.drain():
+                    yield chunk
+        # Central directory
+        if chunk := buffer.drain():
+            yield chunk
+    finally:
+        for _, task in pending:
+            task.cancel()
+
+
+def _member_path(info: zipfile.ZipInfo) -> PurePosixPath | None:
+    """Return a safe relative path for an archive member, or None to skip it."""
+    if info.is_dir():
+        return None
+    member_path = PurePosixPath(info.filename.replace("\\", "/"))
+    if member_path.is_absolute() or ".." in member_path.parts:
+        return None
+    return member_path
+
+
+def _read_member(z: zipfile.ZipFile, info: zipfile.ZipInfo, limit: int) -> bytes:
+    """Read one member in chunks, aborting once it exceeds ``limit`` bytes.
+
+    Declared sizes in the central directory can lie, so the limit is enforced
+    against the bytes actually decompressed.
+    """
+    buffer = bytearray()
+    with z.open(info) as member:
+        while chunk := member.read(ZIP_CHUNK_SIZE):
+            buffer.extend(chunk)
+            if len(buffer) > limit:
+                raise ZipLimitExceededError(
+                    "Extracted archive content exceeds the allowed size"
+                )
+    return bytes(buffer)
+
+
+async def spool_upload(
+    file: UploadFile, *, max_bytes: int = MAX_ZIP_ARCHIVE_SIZE_MB * 1024 * 1024
+) -> BinaryIO:
+    """Copy an upload into a temporary file in fixed-size chunks.
+
+    Args:
+        file: Incoming upload.
+        max_bytes: Maximum archive size accepted.
+
+    Returns:
+        A temporary binary file positioned at its start. The caller closes it.
+    """
+    with contextlib.ExitStack() as stack:
+        spooled = stack.enter_context(tempfile.TemporaryFile())
+        size = 0
+        while chunk := await file.read(ZIP_CHUNK_SIZE):
+            size += len(chunk)
+            if size > max_bytes:
+                raise ZipLimitExceededError(
+                    f"Zip file exceeds the maximum size of {max_bytes} bytes"
+                )
+            spooled.write(chunk)
+        if size == 0:
+            raise ZipArchiveError("Zip file is empty")
+        spooled.seek(0)
+        # Hand the open file to the caller
+        stack.pop_all()
+        return cast(BinaryIO, spooled)
+
+
+def extract_zip_to_storage(
+    archive: BinaryIO,
+    storage: Storage,
+    folder_path: str | PurePosixPath,
+    *,
+    max_members: int = MAX_ZIP_MEMBERS,
+    max_total_bytes: int = MAX_ZIP_EXTRACTED_SIZE_MB * 1024 * 1024,
+    max_in_flight: int = MAX_CONCURRENT_STORAGE_OPS,
+) -> list[str]:
+    """Extract an archive into storage with bounded memory.
+
+    Members are decompressed one at a time and written in batches of
+    ``max_in_flight`` through ``storage.write_many``, which writes a batch
+    concurrently and lets layouts such as ContentAddressedStorage update
+    each folder manifest once per batch instead of once per member.
+
+    Args:
+        archive: Seekable binary file containing the ZIP archive.
+        storage: Destination storage backend.
+        folder_path: Storage folder the members are written under.
+        max_members: Maximum number of file members accepted.
+        max_total_bytes: Maximum total uncompressed size accepted.
+        max_in_flight: Maximum number of members held in memory and written
+            per batch.
+
+    Returns:
+        Storage targets written, in archive order.
+
+    Raises:
+        ZipArchiveError: If the archive is not a valid ZIP file.
+        ZipLimitExceededError: If the archive exceeds a limit.
+        StorageBatchError: If any member fails to write.
+    """
+    folder = PurePosixPath(folder_path)
+    z, members = _open_archive(archive, max_members, max_total_bytes)
+    written: list[str] = []
+    batch: list[tuple[str, WRITE_DATA]] = []
+    remaining = max_total_bytes
+    try:
+        with z:
+            for info, member_path in members:
+                data = _read_member(z, info, remaining)
+                remaining -= len(data)
+                batch.append(((folder / member_path).as_posix(), data))
+                if len(batch) == max_in_flight:
+                    written.extend(storage.write_many(batch))
+                    batch = []
+            written.extend(storage.write_many(batch))
+    except StorageBatchError as e:
+        _discard(storage, [*written, *e.succeeded])
+        raise
+    except BaseException:
+        _discard(storage, written)
+        raise
+    return written
+
+
+def check_zip_archive(
+    archive: BinaryIO,
+    *,
+    max_members: int = MAX_ZIP_MEMBERS,
+    max_total_bytes: int = MAX_ZIP_EXTRACTED_SIZE_MB * 1024 * 1024,
+) -> int:
+    """Validate an archive's central directory without extracting it.
+
+    Args:
+        archive: Seekable binary file containing the ZIP archive.
+        max_members: Maximum number of file members accepted.
+        max_total_bytes: Maximum total uncompressed size accepted.
+
+    Returns:
+        The number of members that would be extracted.
+
+    Raises:
+        ZipArchiveError: If the archive is not a valid ZIP file.
+        ZipLimitExceededError: If the archive exceeds a limit.
+    """
+    z, members = _open_archive(archive, max_members, max_total_bytes)
+    z.close()
+    return len(members)
+
+
+def _open_archive(
+    archive: BinaryIO, max_members: int, max_total_bytes: int
+) -> tuple[zipfile.ZipFile, list[tuple[zipfile.ZipInfo, PurePosixPath]]]:
+    """Open an archive and check its declared members against the limits."""
+    try:
+        z = zipfile.ZipFile(archive, "r")
+    except zipfile.BadZipFile as e:
+        raise ZipArchiveError(f"Invalid zip file: {e}") from e
+
+    members = [(info, path) for info in z.infolist() if (path := _member_path(info))]
+    # Cheap up-front check against the central directory
+    if len(members) > max_members:
+        z.close()
+        raise ZipLimitExceededError(
+            f"Zip file contains {len(members)} files; limit is {max_members}"
+        )
+    if sum(info.file_size for info, _ in members) > max_total_bytes:
+        z.close()
+        raise ZipLimitExceededError(
+            "Extracted archive content exceeds the allowed size"
+        )
+    return z, members
+
+
+def _discard(storage: Storage, targets: Sequence[str]) -> None:
+    """Best-effort removal of files written by a failed extraction."""
+    if not targets:
+        return
+    try:
+        storage.delete_many(targets)
+    except StorageBatchError as e:
+        logger.warning("Failed to remove %s partially extracted files", len(e.failures))
+
+
 async def upload_zip_and_extract(
     file: UploadFile, storage: Storage, path: str | Path
 ) -> dict[str, str | int]:
     filename = file.filename
     if not filename:
-        raise ValueError(f"File {file} has no name")
+        raise ZipArchiveError(f"File {file} has no name")
     if not filename.endswith(".zip"):
         ext = filename.split(".")[-1]
-        raise ValueError(f"Expected zip file extension, received '{ext}'")
+        raise ZipArchiveError(f"Expected zip file extension, received '{ext}'")
 
     root_path = PurePosixPath(Path(path).as_posix())
     cleaned_name = safe_dir_name(filename.removesuffix(".zip"))
     folder_path = root_path / cleaned_name
 
-    contents = await file.read()
-    if not contents:
-        raise ValueError("Zip file is empty")
-
-    # Upload raw zip bytes.
     zip_blob_path = (folder_path / filename).as_posix()
-    storage.write(zip_blob_path, contents)
-
-    extracted_files = 0
-    with zipfile.ZipFile(io.BytesIO(contents), "r") as zip_ref:
-        for info in zip_ref.infolist():
-            if info.is_dir():
-                continue
-
-            member_path = PurePosixPath(info.filename.replace("\\", "/"))
-            if member_path.is_absolute() or ".." in member_path.parts:
-                continue
+    archive = await spool_upload(file)
+    try:
+        # Reject corrupt or oversized archives before anything is stored
+        await run_blocking(check_zip_archive, archive)
+        archive.seek(0)
+        await run_blocking(storage.write_fileobj, zip_blob_path, archive)
 
-            target_path = (folder_path / member_path).as_posix()
-            storage.write(target_path, zip_ref.read(info))
-            extracted_files += 1
+        archive.seek(0)
+        try:
+            written = await run_blocking(
+                extract_zip_to_storage, archive, storage, folder_path
+            )
+        except BaseException:
+            await run_blocking(_discard, storage, [zip_blob_path])
+            raise
+    finally:
+        archive.close()
 
     return {
         "detail": f"Uploaded zip and extracted files to {folder_path.as_posix()}",
         "zip_path": zip_blob_path,
-        "files_extracted": extracted_files,
+        "files_extracted": len(written),
     }
@@ -1,6 +1,11 @@
 """Public exports for shared backend utilities."""
 
-from backend.utils.common import pick, safe_dir_name, validate_response_payload
+from backend.utils.common import (
+    as_utc,
+    pick,
+    safe_dir_name,
+    validate_response_payload,
+)
 from backend.utils.data import (
     names,
     normalize_content,
@@ -16,26 +21,38 @@ from backend.utils.data import (
     to_serializable,
 )
 from backend.utils.database import (
+    LookupCache,
     convert_uuid,
+    decode_cursor,
+    encode_cursor,
     filter_conditional,
     get_all_model_relationship_data,
     get_all_model_relationships,
     get_or_create_many,
     get_relationship_data,
     is_relationship,
+    keyset_after,
+    like_pattern,
     normalize_kwargs,
     normalize_timestamps,
     pick_related_label_col,
+    prefix_tsquery,
     safe_python_type,
     string_condition,
+    title_rank,
+    title_search,
 )
 from backend.utils.database import generics as database_generics
 from backend.utils.media import encode_image, handle_image_data, write_image_data
 from backend.utils.testing import prepare_file_uploads
 
 __all__ = [
+    "LookupCache",
+    "as_utc",
     "convert_uuid",
     "database_generics",
+    "decode_cursor",
+    "encode_cursor",
     "encode_image",
     "filter_conditional",
     "get_all_model_relationship_data",
@@ -44,6 +61,8 @@ __all__ = [
     "get_relationship_data",
     "handle_image_data",
     "is_relationship",
+    "keyset_after",
+    "like_pattern",
     "names",
     "normalize_content",
     "normalize_json_content",
@@ -56,11 +75,14 @@ __all__ = [
     "normset",
     "pick",
     "pick_related_label_col",
+    "prefix_tsquery",
     "prepare_file_uploads",
     "safe_dir_name",
     "safe_python_type",
     "serialized_to_dict",
     "string_condition",
+    "title_rank",
+    "title_search",
     "to_bool",
     "to_list",
     "to_serializable",
@@ -1,8 +1,14 @@
 """Common general-purpose utility exports."""
 
-from backend.utils.common.general import pick, safe_dir_name, validate_response_payload
+from backend.utils.common.general import (
+    as_utc,
+    pick,
+    safe_dir_name,
+    validate_response_payload,
+)
 
 __all__ = [
+    "as_utc",
     "pick",
     "safe_dir_name",
     "validate_response_payload",
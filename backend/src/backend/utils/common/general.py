@@ -1,5 +1,6 @@
 # --- Standard Library ---
 import re
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
@@ -19,6 +20,13 @@ def pick(obj: Any, *keys: str, default: Any = None) -> Any:
     return default
 
 
+def as_utc(value: datetime) -> datetime:
+    """Return ``value`` in UTC, treating naive datetimes as UTC already."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
 def validate_response_payload(payload: dict, created: dict, key: str) -> bool:
     """Compare a given key in the request payload and response payload."""
     return pick(payload, key) == pick(created, key)
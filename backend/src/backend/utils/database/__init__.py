@@ -16,11 +16,26 @@ from backend.utils.database.generics import (
     get_relationship_data,
     is_relationship,
 )
+from backend.utils.database.lookup_cache import LookupCache
+from backend.utils.database.pagination import (
+    decode_cursor,
+    encode_cursor,
+    keyset_after,
+)
+from backend.utils.database.search import (
+    like_pattern,
+    prefix_tsquery,
+    title_rank,
+    title_search,
+)
 
 from . import generics
 
 __all__ = [
+    "LookupCache",
     "convert_uuid",
+    "decode_cursor",
+    "encode_cursor",
     "filter_conditional",
     "generics",
     "get_all_model_relationship_data",
@@ -28,9 +43,14 @@ __all__ = [
     "get_or_create_many",
     "get_relationship_data",
     "is_relationship",
+    "keyset_after",
+    "like_pattern",
     "normalize_kwargs",
     "normalize_timestamps",
     "pick_related_label_col",
+    "prefix_tsquery",
     "safe_python_type",
     "string_condition",
+    "title_rank",
+    "title_search",
 ]
@@ -2,11 +2,13 @@ from collections.abc import Iterable, Sequence
 from enum import Enum
 from typing import Any, Literal, TypeVar
 
-from sqlalchemy import func
+from sqlalchemy import Insert, func, insert
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.inspection import inspect
 from sqlalchemy.orm.properties import RelationshipProperty
-from sqlmodel import Session, SQLModel, select
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.core import logger
 
@@ -14,35 +16,76 @@ T = TypeVar("T", bound=SQLModel)
 
 
 async def get_or_create_many[T: SQLModel](
-    session: Session, model: type[T], names: Sequence[str], lookup_field="name"
+    session: AsyncSession, model: type[T], names: Sequence[str], lookup_field="name"
 ) -> list[T]:
+    """
+    Fetch rows of ``model`` by case-insensitive name, creating the missing ones.
+
+    Existing rows are read with one ``lower(field) IN (...)`` query and the
+    missing ones are created with a single ``INSERT ... ON CONFLICT DO NOTHING
+    RETURNING``, so the cost does not grow with the number of names. Rows that
+    a concurrent transaction inserted in between are read back with one more
+    query.
+
+    Returns:
+        One row per entry of ``names``, in the same order. Names that differ
+        only by case map to the same row; new rows keep the first spelling.
+    """
     if model is None:
         logger.error(f"MODEL PASSED: {model=} ({type(model)=})")
         raise RuntimeError("get_or_create_many received model=None")
 
     if not hasattr(model, lookup_field):
         raise ValueError(f"Model {model} does not have attribute {lookup_field}")
-    results = []
+
+    wanted: dict[str, str] = {}
+    for name in names:
+        wanted.setdefault(name.lower(), name)
+    if not wanted:
+        return []
     try:
-        for name in names:
-            stmt = select(model).where(
-                func.lower(getattr(model, lookup_field)) == name.lower()
+        found = await _get_by_lower_name(session, model, lookup_field, list(wanted))
+        missing = [name for key, name in wanted.items() if key not in found]
+        if missing:
+            stmt = _insert_ignoring_conflicts(session, model).returning(model)
+            created = await session.scalars(
+                stmt,
+                [model(**{lookup_field: name}).model_dump() for name in missing],
             )
-            obj = session.exec(stmt).one_or_none()
-            if not obj:
-                obj = model(**{lookup_field: name})
-                session.add(obj)
-                session.flush()
-            results.append(obj)
-        return results
+            for obj in created.all():
+                found[getattr(obj, lookup_field).lower()] = obj
+            if raced := [name.lower() for name in missing if name.lower() not in found]:
+                found.update(
+                    await _get_by_lower_name(session, model, lookup_field, raced)
+                )
+        return [found[name.lower()] for name in names]
     except SQLAlchemyError as e:
-        session.rollback()
+        await session.rollback()
         logger.error(f"[DB] could not create {model} {e}")
         raise ValueError(
             f"[DB] failed to create or get many relationship {model} an error occured {e}"
         ) from e
 
 
+async def _get_by_lower_name[T: SQLModel](
+    session: AsyncSession, model: type[T], lookup_field: str, keys: list[str]
+) -> dict[str, T]:
+    column = getattr(model, lookup_field)
+    rows = (await session.exec(select(model).where(func.lower(column).in_(keys)))).all()
+    return {getattr(row, lookup_field).lower(): row for row in rows}
+
+
+def _insert_ignoring_conflicts(session: AsyncSession, model: type[SQLModel]) -> Insert:
+    """``INSERT`` that skips rows violating a unique constraint."""
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert(model).on_conflict_do_nothing()
+    if dialect == "sqlite":
+        return sqlite.insert(model).on_conflict_do_nothing()
+    # Without ON CONFLICT a concurrent insert fails the statement instead
+    return insert(model)
+
+
 NormalizeMode = Literal["auto", "list", "scalar"]
 
 
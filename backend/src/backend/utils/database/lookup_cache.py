@@ -0,0 +1,121 @@
+import time
+import weakref
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import ColumnElement
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import make_transient_to_detached
+from sqlmodel import SQLModel, col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from backend.core import logger
+
+
+@dataclass
+class _Snapshot:
+    by_key: dict[Any, dict[str, Any]] = field(default_factory=dict)
+    by_id: dict[Any, dict[str, Any]] = field(default_factory=dict)
+    loaded_at: float = field(default_factory=time.monotonic)
+
+
+class LookupCache[T: SQLModel]:
+    """
+    In-process copy of a small lookup table, keyed by a name column.
+
+    The whole table is read with one query on first use (or by ``load`` at
+    startup) and then served from memory until ``ttl`` seconds pass or
+    ``invalidate`` is called after a write. A name that is not cached is
+    looked up in the database, so rows inserted by another process are still
+    found before the TTL runs out.
+
+    Rows are kept as plain column values. Each lookup builds a fresh instance
+    and merges it into the caller's session without a query, so cached rows
+    never leak between sessions. Snapshots are kept per engine.
+    """
+
+    def __init__(self, model: type[T], key: str = "name", ttl: float = 300.0) -> None:
+        self.model = model
+        self.key = key
+        self.ttl = ttl
+        self._snapshots: weakref.WeakKeyDictionary[Engine, _Snapshot] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def load(self, session: AsyncSession) -> None:
+        """Read the whole table into memory."""
+        rows = (await session.exec(select(self.model))).all()
+        snapshot = _Snapshot()
+        for row in rows:
+            self._remember(snapshot, row)
+        self._snapshots[self._engine(session)] = snapshot
+        logger.debug("[LookupCache] Loaded %s %s rows", len(rows), self.model.__name__)
+
+    def invalidate(self) -> None:
+        """Drop every snapshot; the next lookup reloads the table."""
+        self._snapshots.clear()
+
+    async def get(self, session: AsyncSession, key: Any) -> T | None:
+        """Return the row whose name column equals ``key``."""
+        snapshot = await self._snapshot(session)
+        values = snapshot.by_key.get(key)
+        if values is None:
+            return await self._fetch(
+                session, snapshot, col(getattr(self.model, self.key)) == key
+            )
+        return await self._attach(session, values)
+
+    async def get_by_id(self, session: AsyncSession, id: Any) -> T | None:
+        """Return the row with primary key ``id``."""
+        snapshot = await self._snapshot(session)
+        values = snapshot.by_id.get(id)
+        if values is None:
+            condition = col(self.model.id) == id  # type: ignore[attr-defined]
+            return await self._fetch(session, snapshot, condition)
+        return await self._attach(session, values)
+
+    async def get_many(
+        self, session: AsyncSession, keys: Iterable[Any]
+    ) -> dict[Any, T]:
+        """Return the rows for ``keys``; keys without a row are left out."""
+        found: dict[Any, T] = {}
+        for key in set(keys):
+            row = await self.get(session, key)
+            if row is not None:
+                found[key] = row
+        return found
+
+    async def _snapshot(self, session: AsyncSession) -> _Snapshot:
+        snapshot = self._snapshots.get(self._engine(session))
+        if snapshot is None or time.monotonic() - snapshot.loaded_at > self.ttl:
+            await self.load(session)
+            snapshot = self._snapshots[self._engine(session)]
+        return snapshot
+
+    async def _fetch(
+        self,
+        session: AsyncSession,
+        snapshot: _Snapshot,
+        condition: ColumnElement[bool],
+    ) -> T | None:
+        row = (await session.exec(select(self.model).where(condition))).first()
+        if row is not None:
+            self._remember(snapshot, row)
+        return row
+
+    async def _attach(self, session: AsyncSession, values: dict[str, Any]) -> T:
+        obj = self.model(**values)
+        make_transient_to_detached(obj)
+        # load=False trusts the copy, and reuses the session's instance if any
+        return await session.merge(obj, load=False)
+
+    def _remember(self, snapshot: _Snapshot, row: T) -> None:
+        values = row.model_dump()
+        snapshot.by_key[values[self.key]] = values
+        snapshot.by_id[values["id"]] = values
+
+    @staticmethod
+    def _engine(session: AsyncSession) -> Engine:
+        bind = session.get_bind()
+        return bind if isinstance(bind, Engine) else bind.engine
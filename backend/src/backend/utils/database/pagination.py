@@ -0,0 +1,77 @@
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, and_, false, or_
+
+CursorValue = datetime | UUID | None
+
+
+def encode_cursor(*values: CursorValue) -> str:
+    """
+    Pack the sort key of the last row on a page into an opaque cursor.
+
+    The cursor is URL-safe base64 of a JSON list, so clients can pass it back
+    as-is without relying on its contents.
+    """
+    raw = json.dumps([None if v is None else str(v) for v in values])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, types: Sequence[type]) -> tuple[CursorValue, ...]:
+    """
+    Unpack a cursor produced by ``encode_cursor``.
+
+    Args:
+        cursor: The opaque cursor string.
+        types: Expected type of each value, ``datetime`` or ``UUID``.
+
+    Raises:
+        ValueError: If the cursor is malformed or does not match ``types``.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, json.JSONDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    if not isinstance(values, list) or len(values) != len(types):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+
+    parsers = {datetime: datetime.fromisoformat, UUID: UUID}
+    try:
+        return tuple(
+            None if value is None else parsers[kind](value)
+            for value, kind in zip(values, types, strict=True)
+        )
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+def keyset_after(
+    columns: Sequence[ColumnElement[Any]], values: Sequence[Any]
+) -> ColumnElement[bool]:
+    """
+    Condition selecting the rows that follow ``values`` in keyset order.
+
+    Rows are assumed to be ordered by every column ``DESC NULLS LAST`` and the
+    last column must be unique, so the order is total and pages never repeat
+    or skip rows.
+
+    Args:
+        columns: Sort key columns, most significant first.
+        values: The sort key of the last row already returned.
+    """
+    branches: list[ColumnElement[bool]] = []
+    equal: list[ColumnElement[bool]] = []
+    for column, value in zip(columns, values, strict=True):
+        if value is None:
+            # Nulls sort last, so nothing follows them in this column
+            equal.append(column.is_(None))
+            continue
+        branches.append(and_(*equal, or_(column < value, column.is_(None))))
+        equal.append(column == value)
+    return or_(*branches) if branches else false()
@@ -0,0 +1,94 @@
+import re
+from typing import Any
+
+from sqlalchemy import ColumnElement, and_, case, func, literal_column, or_
+
+# Text search configuration used by the search indexes. "simple" does not
+# stem, so prefix queries behave the same for every language.
+TS_CONFIG = "simple"
+
+# Underscores split words, as they do in the PostgreSQL text parser
+_TOKEN = re.compile(r"[^\W_]+")
+
+
+def search_tokens(term: str) -> list[str]:
+    """Split a search term into lowercase words."""
+    return _TOKEN.findall(term.lower())
+
+
+def prefix_tsquery(term: str, weight: str = "") -> str | None:
+    """
+    Build a ``to_tsquery`` string where every word is a prefix match.
+
+    ``"bern eq"`` becomes ``"bern:* & eq:*"``. With ``weight`` the match is
+    restricted to lexemes of that weight, e.g. ``"bern:*A"``. Returns None
+    when the term has no words.
+    """
+    tokens = search_tokens(term)
+    if not tokens:
+        return None
+    return " & ".join(f"{token}:*{weight}" for token in tokens)
+
+
+def like_pattern(term: str) -> str:
+    """``%term%`` with LIKE wildcards in the term escaped by a backslash."""
+    escaped = re.sub(r"([\\%_])", r"\\\1", term)
+    return f"%{escaped}%"
+
+
+def _title_vector(title: ColumnElement[Any]) -> ColumnElement[Any]:
+    # Written out literally so PostgreSQL matches it to the expression index
+    return literal_column(
+        f"to_tsvector('{TS_CONFIG}', coalesce({title.compile()}, ''))"
+    )
+
+
+def _tsquery(query: str) -> ColumnElement[Any]:
+    return func.to_tsquery(literal_column(f"'{TS_CONFIG}'"), query)
+
+
+def title_search(
+    title: ColumnElement[Any], term: str, dialect: str
+) -> ColumnElement[bool]:
+    """
+    Condition matching ``term`` against a title column.
+
+    On PostgreSQL a title matches when every word of the term prefixes a word
+    of the title, or when the whole term is a substring of it. Both are
+    answered by GIN indexes (full text and trigram). Other databases fall back
+    to requiring every word as a case-insensitive substring.
+    """
+    if dialect == "postgresql":
+        condition = title.ilike(like_pattern(term))
+        query = prefix_tsquery(term)
+        if query is None:
+            return condition
+        matches = _title_vector(title).op("@@")(_tsquery(query))
+        return or_(matches, condition)
+
+    words = search_tokens(term) or [term.lower()]
+    return and_(
+        *(func.lower(title).like(like_pattern(word), escape="\\") for word in words)
+    )
+
+
+def title_rank(title: ColumnElement[Any], term: str, dialect: str) -> ColumnElement:
+    """
+    Relevance of a title for ``term``; higher is better.
+
+    PostgreSQL combines the full text rank with trigram similarity. The
+    fallback ranks exact titles first, then titles starting with the term.
+    """
+    if dialect == "postgresql":
+        rank = func.similarity(title, term)
+        query = prefix_tsquery(term)
+        if query is not None:
+            rank = rank + func.ts_rank(_title_vector(title), _tsquery(query))
+        return rank
+
+    lowered = func.lower(title)
+    return case(
+        (lowered == term.lower(), 2),
+        (lowered.like(like_pattern(term)[1:], escape="\\"), 1),
+        else_=0,
+    )
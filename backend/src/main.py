@@ -8,13 +8,15 @@ import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.routing import APIRouter
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend.api import ALL_ROUTES
+from backend.api.pagination import NEXT_CURSOR_HEADER
 from backend.auth import InstitutionDB, RoleDB
 from backend.core import get_settings, initialize_firebase_app, logger
-from backend.database import engine
+from backend.database import AsyncSessionLocal, async_engine
 from backend.question import QuestionQTypeDB
+from backend.question_views.service.dashboard_refresh import DashboardRefresher
 
 settings = get_settings()
 
@@ -68,13 +70,16 @@ def tags_meta():
     return sorted(tags_metadata, key=lambda tag: tag["name"].lower())
 
 
-async def seed_database(session: Session) -> None:
+async def seed_database(session: AsyncSession) -> None:
     await RoleDB(session).seed_roles()
     logger.info("[Initialization] Roles Created/verified Successfully")
     await InstitutionDB(session).seed_institution()
     logger.info("[Initialization] Institution Created/verified Successfully")
-    QuestionQTypeDB(session).seed_types()
+    await QuestionQTypeDB(session).seed_types()
     logger.info("[Initialization] QuestionQTypeDB Created/verified Successfully")
+    # Serve the static lookup tables from memory from the first request on
+    for cache in (RoleDB.cache, InstitutionDB.cache, QuestionQTypeDB.cache):
+        await cache.load(session)
 
 
 ## Intializes the database
@@ -84,11 +89,20 @@ async def on_startup(app: FastAPI):
         # Attempt to initialize firebase application
         initialize_firebase_app()
         # Ensures that the roles are present at startup
-        with Session(engine) as session:
+        async with AsyncSessionLocal() as session:
             await seed_database(session)
-        yield
+        # Keep the dashboard projection in step with question writes, and
+        # catch up on anything written while the app was down
+        dashboard = DashboardRefresher(
+            async_engine, interval=settings.DASHBOARD_REFRESH_INTERVAL_SECONDS
+        ).listen()
+        dashboard.request()
     except Exception as e:
         raise ValueError(f"Failed to initialize app {e}") from e
+    try:
+        yield
+    finally:
+        dashboard.remove()
 
 
 def add_routes(app: FastAPI, routes: list[APIRouter] = ALL_ROUTES) -> None:
@@ -111,7 +125,7 @@ def get_application(test_mode: bool = False):
         allow_credentials=True,  # allow cookies, Authorization headers
         allow_methods=["*"],  # allow all HTTP methods (GET, POST, etc.)
         allow_headers=["*"],  # allow all headers (including Authorization)
-        expose_headers=["Content-Disposition"],
+        expose_headers=["Content-Disposition", NEXT_CURSOR_HEADER],
     )
 
     return app